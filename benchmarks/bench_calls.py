@@ -0,0 +1,40 @@
+"""
+Mide el costo fijo de la biblioteca, sin red: crear un cliente y resolver una
+llamada hasta su URL (`debug=True`), que es todo lo que ocurre antes de la E/S.
+
+Uso:
+    python benchmarks/bench_calls.py [--number N]
+"""
+import argparse
+import timeit
+
+from pyBCRAdata import BCRAclient, APISettings
+from pyBCRAdata.connector import build_url
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+
+    client = BCRAclient()
+    config = APISettings.API_CONFIG['monetary']['series']
+    params = {'id_variable': 6, 'desde': '2024-01-01', 'hasta': '2024-06-30'}
+    plan = client.monetary._plans['series']
+
+    cases = {
+        'BCRAclient()': (lambda: BCRAclient().close(), max(args.number // 100, 10)),
+        'monetary.series(debug=True)': (lambda: client.monetary.series(**params, debug=True), args.number),
+        'currency.rates(debug=True)': (lambda: client.currency.rates(debug=True), args.number),
+        'build_url': (lambda: build_url(client.connector.base_url, config.endpoint, params,
+                                        config.path_params, config.query_params), args.number),
+        'CallPlan.url': (lambda: plan.url(client.connector.base_url, params), args.number),
+    }
+
+    print(f"{'caso':<30}{'us/llamada':>12}")
+    for name, (func, number) in cases.items():
+        best = min(timeit.repeat(func, number=number, repeat=5)) / number
+        print(f"{name:<30}{best * 1e6:>12.2f}")
+    client.close()
+
+if __name__ == '__main__':
+    main()
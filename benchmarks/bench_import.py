@@ -0,0 +1,39 @@
+"""
+Mide el tiempo de `import pyBCRAdata` en un intérprete limpio.
+
+Uso:
+    python benchmarks/bench_import.py [--repeat N] [--budget MS]
+
+Cada repetición corre `python -X importtime -c "import pyBCRAdata"` en un
+proceso nuevo y toma el tiempo acumulado del paquete. Informa la mediana y
+termina con código 1 si supera `--budget` (50 ms por defecto). Depende de la
+máquina y de su carga, por eso se mide acá y no en los tests.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+IMPORT_BUDGET_MS = 50.0
+
+def import_time_us() -> int:
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import pyBCRAdata'],
+                            capture_output=True, text=True, check=True)
+    # Formato de -X importtime: "import time: self [us] | cumulative | module"
+    line = next(line for line in result.stderr.splitlines() if line.rstrip().endswith('| pyBCRAdata'))
+    return int(line.split('|')[1])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=9)
+    parser.add_argument('--budget', type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+
+    median_ms = statistics.median(import_time_us() for _ in range(args.repeat)) / 1e3
+    print(f'import pyBCRAdata: {median_ms:.1f} ms (mediana de {args.repeat}; presupuesto {args.budget:.0f} ms)')
+    if median_ms > args.budget:
+        print('REGRESIÓN: el import supera el presupuesto')
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
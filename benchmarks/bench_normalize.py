@@ -0,0 +1,78 @@
+"""
+Compara el normalizador de respuestas actual con la implementación original.
+
+Uso:
+    python benchmarks/bench_normalize.py [--repeat N]
+
+Usa las respuestas sintéticas de `payloads.py` para `currency.rates`,
+`currency.series`, `debtors.history` y `monetary.series`, verifica que ambos
+motores produzcan el mismo DataFrame e informa, para el proceso completo
+(normalización y tipos de columna), el mejor tiempo y el pico de memoria de
+cada uno: el original aplica `astype` al final y el actual construye las
+columnas con el esquema del endpoint.
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+import pandas as pd
+
+from pyBCRAdata.connector import endpoint_schema
+from pyBCRAdata.normalize import normalize_json, legacy_json_to_df
+
+from payloads import currency_rates, currency_series, debtors_history, monetary_series
+
+CASES = {
+    'currency.rates': currency_rates,
+    'currency.series': currency_series,
+    'debtors.history': debtors_history,
+    'monetary.series': monetary_series,
+}
+
+def legacy_pipeline(payload, endpoint_key: str) -> pd.DataFrame:
+    schema = endpoint_schema(endpoint_key)
+    df = legacy_json_to_df(payload, schema.explode)
+    for col, dtype in schema.column_types().items():
+        if col in df.columns:
+            df[col] = df[col].astype(dtype)
+    return df
+
+def schema_pipeline(payload, endpoint_key: str) -> pd.DataFrame:
+    schema = endpoint_schema(endpoint_key)
+    return normalize_json(payload, schema.explode, schema.column_types())
+
+def measure(func, payload, endpoint_key: str, repeat: int):
+    """Mejor tiempo en segundos y pico de memoria en bytes."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(payload, endpoint_key)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func(payload, endpoint_key)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    random.seed(0)
+
+    print(f"{'endpoint':<18}{'filas':>8}{'legado (ms)':>14}{'actual (ms)':>14}{'mejora':>9}"
+          f"{'legado (MiB)':>15}{'actual (MiB)':>15}")
+    for name, build in CASES.items():
+        payload = build()
+        explode = endpoint_schema(name).explode
+        expected = legacy_json_to_df(payload, explode)
+        pd.testing.assert_frame_equal(normalize_json(payload, explode), expected)
+
+        legacy, legacy_peak = measure(legacy_pipeline, payload, name, args.repeat)
+        current, current_peak = measure(schema_pipeline, payload, name, args.repeat)
+        print(f"{name:<18}{len(expected):>8}{legacy * 1e3:>14.2f}{current * 1e3:>14.2f}{legacy / current:>8.1f}x"
+              f"{legacy_peak / 2**20:>15.2f}{current_peak / 2**20:>15.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,176 @@
+"""
+Mide cada endpoint contra el servidor local y lo compara con la línea base.
+
+Uso:
+    python benchmarks/bench_suite.py [--repeat N] [--rounds N] [--concurrency N] [--threshold T] [--confirm N]
+    python benchmarks/bench_suite.py --save-baseline
+
+Para cada endpoint de `APISettings.API_CONFIG` se ejecuta su llamada de
+referencia (las series, paginadas y de varios años) contra `MockBCRAServer`
+y se mide:
+
+- latencia: mediana de la llamada completa, en ms;
+- parseo: mediana de `process_response` sobre la respuesta ya descargada, en ms;
+- memoria: mediana del pico de memoria de una llamada completa
+  (tracemalloc), en MiB;
+- throughput: mediana de las llamadas por segundo con `--concurrency` hilos
+  en `--rounds` rondas.
+
+Con --save-baseline los resultados se guardan en `benchmarks/baseline.json`.
+Si no, se comparan con ella y el proceso termina con código 1 si alguna
+métrica empeora más que `--threshold` (0.3 = 30 %) y, a la vez, más que su
+tolerancia absoluta. Antes de informarla, cada regresión se confirma
+volviendo a medir el endpoint `--confirm` veces: una carga pasajera de la
+máquina no la reproduce. La línea base depende de la máquina: conviene
+generarla en la misma donde se compara.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from pyBCRAdata import APISettings, BCRAclient
+from pyBCRAdata import __version__
+
+from mock_server import MockBCRAServer
+from payloads import SAMPLE_CALLS
+
+BASELINE_PATH = Path(__file__).parent / 'baseline.json'
+
+# Diferencia absoluta mínima que se considera regresión en cada métrica,
+# además de la relativa (--threshold), para no reaccionar al ruido de las
+# mediciones cortas ni de los endpoints con pocas llamadas por segundo
+LOWER_IS_BETTER = {'latency_ms': 1.0, 'parse_ms': 1.0, 'peak_mib': 0.5}
+HIGHER_IS_BETTER = {'throughput_rps': 10.0}
+
+def reference_call(client: BCRAclient, endpoint_key: str):
+    api_name, method_name = endpoint_key.split('.')
+    method = getattr(getattr(client, api_name), method_name)
+    extra = {'paginate': True} if APISettings.API_CONFIG[api_name][method_name].page_size else {}
+    return lambda **kwargs: method(**SAMPLE_CALLS[endpoint_key], **extra, **kwargs)
+
+def median_seconds(func, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+def peak_mib(func) -> float:
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20
+
+def calls_per_second(func, concurrency: int) -> float:
+    calls = concurrency * 4
+    with ThreadPoolExecutor(concurrency) as executor:
+        start = time.perf_counter()
+        list(executor.map(lambda _: func(), range(calls)))
+        return calls / (time.perf_counter() - start)
+
+def measure(client: BCRAclient, endpoint_key: str, repeat: int, rounds: int, concurrency: int) -> dict:
+    call = reference_call(client, endpoint_key)
+    df = call()
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        raise RuntimeError(f'{endpoint_key}: la llamada de referencia no devolvió datos')
+
+    latency = median_seconds(call, repeat)
+
+    status, data = call(json=True)
+    parse = median_seconds(lambda: client.connector.process_response(status, data, endpoint_key), repeat)
+
+    peak = statistics.median(peak_mib(call) for _ in range(rounds))
+    throughput = statistics.median(calls_per_second(call, concurrency) for _ in range(rounds))
+
+    return {
+        'rows': len(df),
+        'latency_ms': latency * 1e3,
+        'parse_ms': parse * 1e3,
+        'peak_mib': peak,
+        'throughput_rps': throughput,
+    }
+
+def regressions(results: dict, baseline: dict, threshold: float) -> list:
+    found = []
+    for endpoint_key, metrics in results.items():
+        base = baseline.get(endpoint_key)
+        if base is None:
+            continue
+        for metric, min_delta in LOWER_IS_BETTER.items():
+            if metrics[metric] > base[metric] * (1 + threshold) and metrics[metric] - base[metric] > min_delta:
+                found.append((endpoint_key, metric, base[metric], metrics[metric]))
+        for metric, min_delta in HIGHER_IS_BETTER.items():
+            if metrics[metric] < base[metric] / (1 + threshold) and base[metric] - metrics[metric] > min_delta:
+                found.append((endpoint_key, metric, base[metric], metrics[metric]))
+    return found
+
+def confirmed_regressions(client: BCRAclient, found: list, baseline: dict, args) -> list:
+    """Vuelve a medir los endpoints con regresiones y conserva las que se repiten en cada medición."""
+    for _ in range(args.confirm):
+        if not found:
+            break
+        endpoints = dict.fromkeys(endpoint_key for endpoint_key, *_ in found)
+        retry = {endpoint_key: measure(client, endpoint_key, args.repeat, args.rounds, args.concurrency)
+                 for endpoint_key in endpoints}
+        repeated = {(endpoint_key, metric) for endpoint_key, metric, *_ in regressions(retry, baseline, args.threshold)}
+        found = [regression for regression in found if regression[:2] in repeated]
+    return found
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--threshold', type=float, default=0.3)
+    parser.add_argument('--confirm', type=int, default=2)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    args = parser.parse_args()
+
+    baseline = None
+    if not args.save_baseline and args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())['results']
+
+    results, found = {}, []
+    with MockBCRAServer() as server, \
+            BCRAclient(base_url=server.base_url, coalesce=False, pool_maxsize=args.concurrency) as client:
+        print(f"{'endpoint':<22}{'filas':>8}{'latencia (ms)':>15}{'parseo (ms)':>13}"
+              f"{'pico (MiB)':>12}{'llamadas/s':>12}")
+        for endpoint_key in SAMPLE_CALLS:
+            metrics = results[endpoint_key] = measure(client, endpoint_key, args.repeat, args.rounds, args.concurrency)
+            print(f"{endpoint_key:<22}{metrics['rows']:>8}{metrics['latency_ms']:>15.2f}"
+                  f"{metrics['parse_ms']:>13.2f}{metrics['peak_mib']:>12.2f}{metrics['throughput_rps']:>12.1f}")
+        if baseline is not None:
+            found = confirmed_regressions(client, regressions(results, baseline, args.threshold), baseline, args)
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({
+            'pyBCRAdata': __version__,
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'results': results,
+        }, indent=2) + '\n')
+        print(f'Línea base guardada en {args.baseline}')
+        return
+
+    if baseline is None:
+        print('No hay línea base; genérela con --save-baseline')
+        return
+    for endpoint_key, metric, before, after in found:
+        print(f'REGRESIÓN {endpoint_key} {metric}: {before:.2f} -> {after:.2f}')
+    if found:
+        sys.exit(1)
+    print(f'Sin regresiones mayores al {args.threshold:.0%} respecto de la línea base')
+
+if __name__ == '__main__':
+    main()
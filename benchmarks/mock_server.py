@@ -0,0 +1,140 @@
+"""
+Servidor HTTP local que imita la API del BCRA para medir la biblioteca sin red.
+
+Uso:
+    python benchmarks/mock_server.py [--port 8000]
+    python benchmarks/mock_server.py --record
+
+Responde todos los endpoints de `APISettings.API_CONFIG` con las respuestas
+de `payloads.py`. En las series respeta el rango de fechas y limit/offset,
+e informa el total en `metadata.resultset.count`, como la API. Cada cuerpo
+se serializa una sola vez, de modo que el costo del servidor no se mezcla
+con el de la biblioteca.
+
+Con --record descarga de la API real la llamada de referencia de cada
+endpoint y la guarda en `benchmarks/recorded/`, desde donde se sirve en
+las siguientes ejecuciones.
+"""
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+from pyBCRAdata import APISettings, BCRAclient
+from pyBCRAdata.connector import endpoint_for_path
+
+from payloads import RECORDED_DIR, SAMPLE_CALLS, load_payloads
+
+class MockBCRAServer:
+    """
+    Servidor en un hilo propio; se usa como context manager y expone su
+    `base_url`.
+    """
+
+    def __init__(self, port: int = 0, seed: int = 0):
+        self.payloads = load_payloads(seed)
+        self._bodies = {}
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', port), self._handler())
+        self.server.daemon_threads = True
+        self.base_url = f'http://127.0.0.1:{self.server.server_port}'
+
+    def __enter__(self) -> 'MockBCRAServer':
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def body(self, path: str, query: str):
+        """Status y cuerpo serializado de la consulta, memorizados por URL."""
+        key = (path, query)
+        with self._lock:
+            cached = self._bodies.get(key)
+        if cached is None:
+            status, payload = self.respond(path, {k: v[0] for k, v in parse_qs(query).items()})
+            cached = status, json.dumps(payload, ensure_ascii=False).encode('utf-8')
+            with self._lock:
+                self._bodies[key] = cached
+        return cached
+
+    def respond(self, path: str, query: dict):
+        endpoint_key = endpoint_for_path(path)
+        if not endpoint_key:
+            return 404, {'status': 404, 'errorMessages': [f'Ruta desconocida: {path}']}
+        results = self.payloads[endpoint_key]
+
+        api_name, method_name = endpoint_key.split('.')
+        config = APISettings.API_CONFIG[api_name][method_name]
+        if not config.page_size:
+            return 200, {'status': 200, 'results': results}
+
+        start_param, end_param = config.date_params
+        start, end = query.get(start_param, '0000'), query.get(end_param, '9999')
+        selected = [record for record in results if start <= record['fecha'] <= end]
+        offset = int(query.get('offset', 0))
+        limit = int(query.get('limit', config.page_size))
+        return 200, {
+            'status': 200,
+            'metadata': {'resultset': {'count': len(selected), 'offset': offset, 'limit': limit}},
+            'results': selected[offset:offset + limit],
+        }
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Encabezados y cuerpo se escriben por separado: sin esto Nagle y
+            # el ACK diferido suman ~40 ms a cada respuesta chica
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                status, body = server.body(parts.path, parts.query)
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+def record() -> None:
+    """Graba la llamada de referencia de cada endpoint contra la API real."""
+    RECORDED_DIR.mkdir(exist_ok=True)
+    with BCRAclient() as client:
+        for endpoint_key, params in SAMPLE_CALLS.items():
+            api_name, method_name = endpoint_key.split('.')
+            method = getattr(getattr(client, api_name), method_name)
+            paginate = APISettings.API_CONFIG[api_name][method_name].page_size is not None
+            status, data = method(**params, json=True, **({'paginate': True} if paginate else {}))
+            if status != 200:
+                print(f'{endpoint_key}: status {status}, no se graba')
+                continue
+            (RECORDED_DIR / f'{endpoint_key}.json').write_text(json.dumps(data['results'], ensure_ascii=False))
+            print(f'{endpoint_key}: grabado')
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--record', action='store_true')
+    args = parser.parse_args()
+
+    if args.record:
+        record()
+        return
+    with MockBCRAServer(args.port) as server:
+        print(f'Sirviendo en {server.base_url} (Ctrl+C para terminar)')
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == '__main__':
+    main()
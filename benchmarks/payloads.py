@@ -0,0 +1,130 @@
+"""
+Respuestas de tamaño realista para cada endpoint de `APISettings.API_CONFIG`.
+
+Si existe `benchmarks/recorded/<api>.<metodo>.json` (grabado con
+`python benchmarks/mock_server.py --record`), se usa esa respuesta real; si
+no, una sintética generada con semilla fija con la forma y el tamaño de las
+respuestas de la API.
+"""
+import json
+import random
+from pathlib import Path
+
+import pandas as pd
+
+RECORDED_DIR = Path(__file__).parent / 'recorded'
+
+# Llamada de referencia de cada endpoint: la que se graba y la que se mide
+SAMPLE_CALLS = {
+    'monetary.variables': {},
+    'monetary.series': {'id_variable': 1, 'desde': '2005-01-01', 'hasta': '2024-12-31'},
+    'currency.currencies': {},
+    'currency.rates': {'fecha': '2024-01-02'},
+    'currency.series': {'moneda': 'USD', 'fechadesde': '2015-01-01', 'fechahasta': '2024-12-31'},
+    'checks.banks': {},
+    'checks.reported': {'codigo_entidad': 11, 'numero_cheque': 20377516},
+    'debtors.debtors': {'identificacion': '20123456789'},
+    'debtors.history': {'identificacion': '20123456789'},
+    'debtors.rejected': {'identificacion': '20123456789'},
+}
+
+def monetary_variables(count: int = 1200) -> list:
+    categories = ['Principales Variables', 'Series.xlsm', 'Tasas de interés', 'Base monetaria']
+    return [
+        {'idVariable': i, 'cdSerie': 7000 + i, 'descripcion': f'Variable monetaria número {i}',
+         'fecha': '2024-12-31', 'valor': random.random() * 1e6, 'categoria': categories[i % len(categories)]}
+        for i in range(1, count + 1)
+    ]
+
+def monetary_series(start: str = '2005-01-01', end: str = '2024-12-31') -> list:
+    return [
+        {'idVariable': 1, 'fecha': fecha, 'valor': random.random() * 1e5}
+        for fecha in pd.date_range(start, end, freq='D').strftime('%Y-%m-%d')
+    ]
+
+def currency_currencies(count: int = 80) -> list:
+    return [{'codigo': f'C{i:02d}', 'denominacion': f'MONEDA {i}'} for i in range(count)]
+
+def currency_rates(currencies: int = 80) -> dict:
+    return {
+        'fecha': '2024-01-02',
+        'detalle': [
+            {'codigoMoneda': f'C{i:02d}', 'descripcion': f'MONEDA {i}',
+             'tipoPase': random.random(), 'tipoCotizacion': random.random() * 1000}
+            for i in range(currencies)
+        ]
+    }
+
+def currency_series(start: str = '2015-01-01', end: str = '2024-12-31') -> list:
+    return [
+        {'fecha': fecha, 'detalle': [
+            {'codigoMoneda': 'USD', 'descripcion': 'DOLAR E.E.U.U.',
+             'tipoPase': 1.0, 'tipoCotizacion': random.random() * 1000}
+        ]}
+        for fecha in pd.bdate_range(start, end).strftime('%Y-%m-%d')
+    ]
+
+def checks_banks(count: int = 80) -> list:
+    return [{'codigoEntidad': 11 + i, 'denominacion': f'BANCO {i}'} for i in range(count)]
+
+def checks_reported() -> dict:
+    return {
+        'numeroCheque': 20377516, 'denunciado': True, 'fechaProcesamiento': '2024-01-02',
+        'denominacionEntidad': 'BANCO DE LA NACION ARGENTINA',
+        'detalles': [{'sucursal': 524, 'numeroCuenta': 5240055962, 'causal': 'Denuncia por robo'}],
+    }
+
+def _entity(e: int) -> dict:
+    return {'entidad': f'BANCO {e}', 'situacion': random.randint(1, 5), 'fechaSit1': '2023-06-01',
+            'monto': random.random() * 1e4, 'diasAtrasoPago': random.randint(0, 90),
+            'refinanciaciones': False, 'recategorizacionOblig': False, 'situacionJuridica': False,
+            'irrecDisposicionTecnica': False, 'enRevision': False, 'procesoJud': False}
+
+def debtors_debtors(entities: int = 12) -> dict:
+    return {'identificacion': 20123456789, 'denominacion': 'PEREZ JUAN',
+            'periodos': [{'periodo': '202412', 'entidades': [_entity(e) for e in range(entities)]}]}
+
+def debtors_history(periods: int = 24, entities: int = 60) -> dict:
+    return {
+        'identificacion': 20123456789, 'denominacion': 'PEREZ JUAN',
+        'periodos': [
+            {'periodo': f'{2024 - p // 12}{12 - p % 12:02d}', 'entidades': [_entity(e) for e in range(entities)]}
+            for p in range(periods)
+        ]
+    }
+
+def debtors_rejected(causes: int = 3, checks: int = 20) -> dict:
+    return {
+        'identificacion': 20123456789, 'denominacion': 'PEREZ JUAN',
+        'causales': [
+            {'causal': f'CAUSAL {c}', 'entidades': [{'entidad': 11, 'detalle': [
+                {'nroCheque': 1000 + i, 'fechaRechazo': '2024-03-01', 'monto': random.random() * 1e5,
+                 'fechaPago': None, 'fechaPagoMulta': None, 'estadoMulta': 'IMPAGA',
+                 'ctaPersonal': True, 'denomJuridica': None, 'enRevision': False, 'procesoJud': False}
+                for i in range(checks)
+            ]}]}
+            for c in range(causes)
+        ]
+    }
+
+GENERATORS = {
+    'monetary.variables': monetary_variables,
+    'monetary.series': monetary_series,
+    'currency.currencies': currency_currencies,
+    'currency.rates': currency_rates,
+    'currency.series': currency_series,
+    'checks.banks': checks_banks,
+    'checks.reported': checks_reported,
+    'debtors.debtors': debtors_debtors,
+    'debtors.history': debtors_history,
+    'debtors.rejected': debtors_rejected,
+}
+
+def load_payloads(seed: int = 0) -> dict:
+    """Contenido de `results` de cada endpoint: el grabado si existe, si no el sintético."""
+    random.seed(seed)
+    payloads = {}
+    for endpoint_key, generate in GENERATORS.items():
+        recorded = RECORDED_DIR / f'{endpoint_key}.json'
+        payloads[endpoint_key] = json.loads(recorded.read_text()) if recorded.exists() else generate()
+    return payloads
@@ -2,23 +2,67 @@
 pyBCRAdata - Cliente Python para la API del Banco Central de la República Argentina
 """
 
-from .client import BCRAclient, MonetaryAPI, CurrencyAPI, ChecksAPI, DebtorsAPI
-from .connector import APIConnector
-from .settings import APISettings
+import threading
+from importlib import import_module
 
 __version__ = "0.4.4"
 __author__ = "Diego Mora"
 
-_default_client = BCRAclient()
+__all__ = ['BCRAclient', 'AsyncBCRAclient', 'RateLimiter', 'RetryPolicy', 'APIError', 'ResponseCache', 'FrameCache', 'SeriesStore', 'MetricsCollector', 'ParquetSink', 'ArrowFileSink', 'ArrowSink', 'CSVSink', 'monetary', 'currency', 'checks', 'debtors', '__version__']
 
-__all__ = ['BCRAclient', 'monetary', 'currency', 'checks', 'debtors', '__version__']
+# Los módulos (y con ellos pandas y requests) se importan recién cuando se
+# usa alguno de sus nombres, para que `import pyBCRAdata` sea inmediato.
+_LAZY_IMPORTS = {
+    'BCRAclient': '.client',
+    'MonetaryAPI': '.client',
+    'CurrencyAPI': '.client',
+    'ChecksAPI': '.client',
+    'DebtorsAPI': '.client',
+    'AsyncBCRAclient': '.async_client',
+    'APIConnector': '.connector',
+    'APISettings': '.settings',
+    'RateLimiter': '.ratelimit',
+    'AdaptiveRateLimiter': '.ratelimit',
+    'RetryPolicy': '.retry',
+    'APIError': '.retry',
+    'ResponseCache': '.cache',
+    'FrameCache': '.cache',
+    'SeriesStore': '.store',
+    'Instrumentation': '.metrics',
+    'MetricsCollector': '.metrics',
+    'OpenTelemetryInstrumentation': '.metrics',
+    'Sink': '.sinks',
+    'ParquetSink': '.sinks',
+    'ArrowFileSink': '.sinks',
+    'ArrowSink': '.sinks',
+    'CSVSink': '.sinks',
+    'JSONDecoder': '.decoding',
+    'OrjsonDecoder': '.decoding',
+    'SimdjsonDecoder': '.decoding',
+}
 
-_connector = APIConnector(
-    base_url=APISettings.BASE_URL,
-    cert_path=APISettings.CERT_PATH
-)
+# APIs del cliente por defecto, creado en el primer acceso a cualquiera de ellas
+_DEFAULT_APIS = ('monetary', 'currency', 'checks', 'debtors')
+_default_client = None
+_default_lock = threading.Lock()
 
-monetary = MonetaryAPI(_connector)
-currency = CurrencyAPI(_connector)
-checks = ChecksAPI(_connector)
-debtors = DebtorsAPI(_connector)
+def _get_default_client():
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            from .client import BCRAclient
+            _default_client = BCRAclient()
+        return _default_client
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    elif name in _DEFAULT_APIS:
+        value = getattr(_get_default_client(), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_DEFAULT_APIS))
@@ -0,0 +1,491 @@
+from typing import Dict, Any, Union, Optional, List, Tuple, Callable, Awaitable, AsyncIterator, Mapping
+import asyncio
+import inspect
+import warnings
+import pandas as pd
+
+from .settings import APISettings, ERROR_MESSAGES
+from .connector import APIConnector, build_ssl_context, decode_incrementally
+from .cache import CacheOption, FrameCacheOption, FrameCache, ResponseCache, open_cache, open_frame_cache
+from .store import SeriesStore, StoreOption, open_series_store
+from .retry import RetryPolicy, RetryOption, open_retry_policy, endpoint_family
+from .metrics import Instrumentation
+from .decoding import JSONDecoder, DecoderOption, open_decoder, decode_chunks_async
+from .concurrency import ordered_map_async
+from .sinks import open_sink, write_frames_async
+from .base_api import BaseAPI, BatchResult, APIResult, CallPlan, create_api_class
+from .panel import SeriesArrays, build_panel
+
+class AsyncAPIConnector(APIConnector):
+    """
+    Conector HTTP para asyncio basado en aiohttp.
+
+    Comparte con `APIConnector` la construcción de URLs y la transformación
+    de las respuestas en DataFrames; solo cambia el transporte. El pool de
+    conexiones (`aiohttp.TCPConnector`) se crea en el primer uso, dentro del
+    event loop que lo va a utilizar.
+    """
+
+    def __init__(self, base_url: str, cert_path: Union[str, bool, None],
+                pool_maxsize: int = APISettings.POOL_MAXSIZE,
+                keep_alive: bool = True, cache: Optional[ResponseCache] = None,
+                frame_cache: Optional[FrameCache] = None,
+                series_store: Optional[SeriesStore] = None,
+                retry: Optional[RetryPolicy] = None,
+                rate_limits: Optional[Mapping[str, float]] = None,
+                coalesce: bool = True,
+                instrumentation: Optional[Instrumentation] = None,
+                json_decoder: Optional[JSONDecoder] = None):
+        self._pool_maxsize = pool_maxsize
+        self._keep_alive = keep_alive
+        super().__init__(base_url, cert_path, pool_maxsize=pool_maxsize,
+                         keep_alive=keep_alive, cache=cache, frame_cache=frame_cache,
+                         series_store=series_store, retry=retry, rate_limits=rate_limits,
+                         coalesce=coalesce, instrumentation=instrumentation,
+                         json_decoder=json_decoder)
+
+    def _build_session(self, pool_connections: int, pool_maxsize: int,
+                      pool_block: bool, keep_alive: bool) -> None:
+        self._ssl = build_ssl_context(self.cert_path) if self.cert_path is not False else False
+        return None
+
+    def _get_session(self):
+        if self.session is None or self.session.closed:
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError(
+                    "AsyncBCRAclient requiere aiohttp: pip install pyBCRAdata[async]"
+                ) from None
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_maxsize,
+                ssl=self._ssl,
+                force_close=not self._keep_alive
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+        return self.session
+
+    async def close(self) -> None:
+        """Cierra las conexiones abiertas del pool."""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def __aenter__(self) -> 'AsyncAPIConnector':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def connect_to_api(self, url: str, cache_ttl: Optional[float] = 0) -> Tuple[int, Dict[str, Any]]:
+        use_cache = self.cache is not None and cache_ttl != 0
+        # La caché es SQLite: se consulta en otro hilo para no bloquear el event loop
+        if use_cache:
+            cached = await asyncio.to_thread(self.cache.get, url)
+            if cached is not None:
+                return 200, self.decoder.loads(cached)
+
+        family = endpoint_family(url)
+        attempt = 0
+        while True:
+            self.guard.check(family)
+            limiter = self.guard.limiter(family)
+            if limiter is not None:
+                await limiter.acquire_async()
+            status_code, data, headers, body = await self._send_async(url, keep_body=use_cache)
+            wait = self.guard.outcome(family, status_code, headers, attempt)
+            if wait is None:
+                break
+            attempt += 1
+            self._log_retry(url, status_code, attempt, wait)
+            await asyncio.sleep(wait)
+
+        if self.guard.retryable(status_code):
+            raise self._retries_exhausted(status_code, data, attempt + 1)
+        if use_cache and status_code == 200:
+            await asyncio.to_thread(self.cache.set, url, body, cache_ttl)
+        return status_code, data
+
+    async def _send_async(self, url: str, keep_body: bool = False) -> Tuple[int, Dict[str, Any], Mapping[str, str], bytes]:
+        endpoint_key = self._endpoint_key(url)
+        try:
+            with self.span("connect", endpoint_key):
+                response = await self._get_session().get(url)
+            async with response:
+                status_code, headers = response.status, response.headers
+                if not keep_body and decode_incrementally(headers):
+                    return await self._send_incremental_async(response, endpoint_key)
+                with self.span("transfer", endpoint_key):
+                    body = await response.read()
+        except Exception as e:
+            self._handle_request_error(e)
+            return 0, {}, {}, b""
+        if self.instrumentation is not None:
+            self.instrumentation.record(endpoint_key, nbytes=len(body))
+        try:
+            with self.span("json_decode", endpoint_key):
+                data = self.decoder.loads(body) if body else {}
+        except ValueError as e:
+            self._handle_request_error(e)
+            return (0 if status_code == 200 else status_code), {}, headers, b""
+        return status_code, data, headers, body
+
+    async def _send_incremental_async(self, response: Any,
+                                     endpoint_key: str) -> Tuple[int, Dict[str, Any], Mapping[str, str], bytes]:
+        received = 0
+
+        async def chunks() -> AsyncIterator[bytes]:
+            nonlocal received
+            async for chunk in response.content.iter_chunked(APISettings.DECODE_CHUNK_SIZE):
+                received += len(chunk)
+                yield chunk
+
+        try:
+            with self.span("transfer", endpoint_key):
+                data = await decode_chunks_async(chunks(), self.decoder)
+        except ValueError as e:
+            self._handle_request_error(e)
+            return (0 if response.status == 200 else response.status), {}, response.headers, b""
+        except Exception as e:
+            self._handle_request_error(e)
+            return 0, {}, {}, b""
+        finally:
+            if self.instrumentation is not None:
+                self.instrumentation.record(endpoint_key, nbytes=received)
+        return response.status, data, response.headers, b""
+
+    async def fetch_data(self, url: str, endpoint_key: str = "", cache_ttl: Optional[float] = 0) -> pd.DataFrame:
+        async def fetch() -> pd.DataFrame:
+            status_code, data = await self.connect_to_api(url, cache_ttl)
+            return self.process_response(status_code, data, endpoint_key)
+
+        return await self.memoize_frame_async((endpoint_key, url), cache_ttl, fetch)
+
+    async def memoize_frame_async(self, key: Tuple[str, str], cache_ttl: Optional[float],
+                                 build: Callable[[], Awaitable[Any]]) -> Any:
+        """Equivalente asíncrono de `APIConnector.memoize_frame`."""
+        use_cache = self.frame_cache is not None and cache_ttl != 0
+        if use_cache:
+            cached = self.frame_cache.get(key)
+            if cached is not None:
+                return cached
+
+        async def load() -> Any:
+            return self._store_frame(key, cache_ttl, await build(), use_cache)
+
+        if self.single_flight is None:
+            return await load()
+        return await self.single_flight.do_async(key, load)
+
+    async def iter_pages(self, page_url: Callable[[int, int], str], page_size: int,
+                        offset: int = 0, max_workers: int = APISettings.MAX_WORKERS,
+                        cache_ttl: Optional[float] = 0) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """Equivalente asíncrono de `APIConnector.iter_pages`."""
+        status_code, data = await self.connect_to_api(page_url(offset, page_size), cache_ttl)
+        yield status_code, data
+        if status_code != 200:
+            return
+
+        total = self._result_count(data)
+        if total is not None:
+            offsets = range(offset + page_size, total, page_size)
+            async for status_code, data in ordered_map_async(
+                    lambda o: self.connect_to_api(page_url(o, page_size), cache_ttl), offsets, max_workers):
+                yield status_code, data
+                if status_code != 200:
+                    return
+            return
+
+        while len(self._page_results(data)) >= page_size:
+            offset += page_size
+            status_code, data = await self.connect_to_api(page_url(offset, page_size), cache_ttl)
+            yield status_code, data
+            if status_code != 200:
+                return
+
+    async def fetch_pages(self, page_url: Callable[[int, int], str], page_size: int,
+                         offset: int = 0, max_workers: int = APISettings.MAX_WORKERS,
+                         cache_ttl: Optional[float] = 0) -> Tuple[int, Dict[str, Any]]:
+        """Equivalente asíncrono de `APIConnector.fetch_pages`."""
+        responses = [page async for page in self.iter_pages(page_url, page_size, offset, max_workers, cache_ttl)]
+        return self.merge_responses(responses)
+
+class AsyncBaseAPI(BaseAPI):
+    """Variante de `BaseAPI` cuyos métodos generados son corutinas."""
+
+    async def _make_api_call(self, method_name: str, **kwargs) -> APIResult:
+        plan, api_params, func_params = self._prepare_call(method_name, kwargs)
+        # Con debug o stream el resultado no es una corutina y se devuelve tal cual
+        result = self._call_handler(func_params)(plan, api_params, func_params)
+        return await result if inspect.isawaitable(result) else result
+
+    async def _sink_call(self, plan: CallPlan, api_params: Dict[str, Any], func_params: Dict[str, Any]) -> Any:
+        frames = self._stream_call(plan, api_params, {**func_params, "json": False})
+        if func_params.get("debug", False):
+            return frames
+        return await write_frames_async(open_sink(func_params["sink"]), frames)
+
+    async def _composite_call(self, plan: CallPlan, api_params: Dict[str, Any],
+                             func_params: Dict[str, Any]) -> APIResult:
+        paginate, windows, max_workers = self._composite_plan(plan, api_params, func_params)
+        if func_params.get("debug", False):
+            return self._composite_debug(plan, api_params, paginate, windows)
+
+        async def fetch() -> Tuple[int, Dict[str, Any]]:
+            return await self._fetch_composite(plan, api_params, paginate, windows, max_workers)
+
+        async def build() -> APIResult:
+            return self.api_connector.process_response(*(await fetch()), plan.endpoint_key)
+
+        if func_params.get("json", False):
+            return await fetch()
+        return await self.api_connector.memoize_frame_async(
+            self._composite_key(plan, api_params, paginate, windows),
+            self._cache_ttl(plan, api_params),
+            build
+        )
+
+    async def _fetch_composite(self, plan: CallPlan, api_params: Dict[str, Any],
+                              paginate: bool, windows: Optional[List[Dict[str, Any]]],
+                              max_workers: int) -> Tuple[int, Dict[str, Any]]:
+        if windows is None:
+            return await self._fetch_window(plan, api_params, paginate, max_workers)
+        responses = [
+            response async for response in ordered_map_async(
+                lambda params: self._fetch_window(plan, params, paginate, 1),
+                windows, max_workers
+            )
+        ]
+        return self.api_connector.merge_responses(responses, deduplicate=True)
+
+    async def _incremental_call(self, plan: CallPlan, api_params: Dict[str, Any],
+                               func_params: Dict[str, Any]) -> APIResult:
+        # Las lecturas y escrituras del almacén (SQLite) corren en otro hilo
+        # para no bloquear el event loop
+        store, series, gaps, fetch_func_params = await asyncio.to_thread(
+            self._incremental_plan, plan, api_params, func_params
+        )
+        urls, responses = [], []
+        for gap in gaps:
+            params = self._gap_params(plan, api_params, gap)
+            paginate, windows, max_workers = self._composite_plan(plan, params, fetch_func_params)
+            if func_params.get("debug", False):
+                debug_urls = self._composite_debug(plan, params, paginate, windows)
+                urls.extend([debug_urls] if isinstance(debug_urls, str) else debug_urls)
+                continue
+            responses.append(await self._fetch_composite(plan, params, paginate, windows, max_workers))
+            if responses[-1][0] != 200:
+                break
+        if func_params.get("debug", False):
+            return urls
+        return await asyncio.to_thread(
+            self._incremental_result, store, series, plan, api_params, func_params, gaps, responses
+        )
+
+    async def _fetch_window(self, plan: CallPlan, api_params: Dict[str, Any],
+                           paginate: bool, max_workers: int) -> Tuple[int, Dict[str, Any]]:
+        cache_ttl = self._cache_ttl(plan, api_params)
+        if not paginate:
+            return await self.api_connector.connect_to_api(self._build_url(plan, api_params), cache_ttl)
+        page_size, offset = self._page_bounds(plan, api_params)
+        return await self.api_connector.fetch_pages(
+            self._page_url_factory(plan, api_params), page_size, offset, max_workers, cache_ttl
+        )
+
+    def _stream_call(self, plan: CallPlan, api_params: Dict[str, Any],
+                    func_params: Dict[str, Any]) -> Union[AsyncIterator[APIResult], str, List[str]]:
+        paginate, windows, max_workers, chunk_size = self._stream_plan(plan, api_params, func_params)
+        if func_params.get("debug", False):
+            return self._composite_debug(plan, api_params, paginate, windows if func_params.get("shards") else None)
+
+        async def pages() -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+            for params in windows:
+                async for page in self._iter_window(plan, params, paginate, max_workers):
+                    yield page
+
+        return self._stream_chunks(plan, pages(), chunk_size, func_params.get("json", False))
+
+    async def _stream_chunks(self, plan: CallPlan, pages: AsyncIterator[Tuple[int, Dict[str, Any]]],
+                            chunk_size: Optional[int], as_json: bool) -> AsyncIterator[APIResult]:
+        buffer: List[Any] = []
+        async for page in pages:
+            for records in self._split_page(page, buffer, chunk_size):
+                yield self._chunk_result(plan, records, as_json)
+        if buffer:
+            yield self._chunk_result(plan, buffer, as_json)
+
+    async def _iter_window(self, plan: CallPlan, api_params: Dict[str, Any], paginate: bool,
+                          max_workers: int) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        cache_ttl = self._cache_ttl(plan, api_params)
+        if not paginate:
+            yield await self.api_connector.connect_to_api(self._build_url(plan, api_params), cache_ttl)
+            return
+        page_size, offset = self._page_bounds(plan, api_params)
+        async for page in self.api_connector.iter_pages(
+                self._page_url_factory(plan, api_params), page_size, offset, max_workers, cache_ttl):
+            yield page
+
+    async def _make_batch_call(self, method_name: str, **kwargs
+                              ) -> Union[BatchResult, AsyncIterator[BatchResult], List[str]]:
+        batch_param, items, item_params, max_workers, limiter, chunk_size, sink = self._batch_plan(method_name, kwargs)
+
+        if kwargs.get("debug", False):
+            return [await self._make_api_call(method_name, **item_params(item)) for item in items]
+
+        async def run(item: Any) -> Tuple[Any, Any]:
+            params = item_params(item)
+            if limiter is not None:
+                await limiter.acquire_async()
+            try:
+                return params.get(batch_param), await self._make_api_call(method_name, **params)
+            except Exception as e:
+                return params.get(batch_param), e
+
+        outcomes = ordered_map_async(run, items, max_workers)
+        if chunk_size is None:
+            return self._batch_result(batch_param, [outcome async for outcome in outcomes])
+        groups = self._batch_chunks(batch_param, outcomes, chunk_size)
+        if sink is None:
+            return groups
+        errors: List[pd.DataFrame] = []
+
+        async def frames() -> AsyncIterator[pd.DataFrame]:
+            async for group in groups:
+                for frame in self._batch_frames([group], errors):
+                    yield frame
+
+        data = await write_frames_async(sink, frames())
+        return BatchResult(data, self._batch_errors(batch_param, errors))
+
+    async def _make_panel_call(self, method_name: str, **kwargs) -> Union[pd.DataFrame, List[str]]:
+        series_param, items, series_params, max_workers = self._panel_plan(method_name, kwargs)
+        if kwargs.get("debug", False):
+            return [await self._make_api_call(method_name, **series_params(item)) for item in items]
+
+        async def run(item: Any) -> SeriesArrays:
+            return self._panel_arrays(method_name, item, await self._make_api_call(method_name, **series_params(item)))
+
+        arrays = [series async for series in ordered_map_async(run, items, max_workers)]
+        return build_panel(items, arrays, series_param)
+
+    async def _batch_chunks(self, batch_param: str, outcomes: AsyncIterator[Tuple[Any, Any]],
+                           chunk_size: int) -> AsyncIterator[BatchResult]:
+        group: List[Tuple[Any, Any]] = []
+        async for outcome in outcomes:
+            group.append(outcome)
+            if len(group) == chunk_size:
+                yield self._batch_result(batch_param, group)
+                group = []
+        if group:
+            yield self._batch_result(batch_param, group)
+
+AsyncMonetaryAPI = create_api_class('AsyncMonetaryAPI', APISettings.API_CONFIG['monetary'], AsyncBaseAPI, 'monetary')
+AsyncCurrencyAPI = create_api_class('AsyncCurrencyAPI', APISettings.API_CONFIG['currency'], AsyncBaseAPI, 'currency')
+AsyncChecksAPI = create_api_class('AsyncChecksAPI', APISettings.API_CONFIG['checks'], AsyncBaseAPI, 'checks')
+AsyncDebtorsAPI = create_api_class('AsyncDebtorsAPI', APISettings.API_CONFIG['debtors'], AsyncBaseAPI, 'debtors')
+
+class AsyncBCRAclient:
+    """
+    Cliente asíncrono para la API del BCRA.
+
+    Expone las mismas APIs y métodos que `BCRAclient`, pero cada método es
+    una corutina. Todas las APIs comparten un único pool de conexiones de
+    aiohttp, de modo que muchas consultas concurrentes cuestan una corutina
+    cada una en lugar de un hilo.
+
+    Attributes
+    ----------
+    monetary : AsyncMonetaryAPI
+        API para variables monetarias
+    currency : AsyncCurrencyAPI
+        API para cotizaciones
+    checks : AsyncChecksAPI
+        API para cheques
+    debtors : AsyncDebtorsAPI
+        API para deudores
+    connector : AsyncAPIConnector
+        Conector HTTP compartido por las cuatro APIs
+
+    Examples
+    --------
+    >>> async with AsyncBCRAclient() as client:
+    ...     df = await client.currency.rates(fecha="2024-01-02")
+    """
+
+    def __init__(self, base_url: str = APISettings.BASE_URL,
+                cert_path: Optional[str] = None, verify_ssl: bool = True,
+                pool_maxsize: int = APISettings.POOL_MAXSIZE, keep_alive: bool = True,
+                cache: CacheOption = None, memory_cache: FrameCacheOption = None,
+                series_store: StoreOption = None, retry: RetryOption = True,
+                rate_limits: Optional[Mapping[str, float]] = None, coalesce: bool = True,
+                instrumentation: Optional[Instrumentation] = None, json_decoder: DecoderOption = None):
+        """
+        Inicializa el cliente con la configuración de conexión.
+
+        Parameters
+        ----------
+        base_url : str, optional
+            URL base de la API del BCRA. Por defecto usa APISettings.BASE_URL
+        cert_path : str, optional
+            Ruta al certificado SSL. Si es None y verify_ssl=True, usa
+            APISettings.CERT_PATH
+        verify_ssl : bool, default=True
+            Si se debe verificar el certificado SSL
+        pool_maxsize : int, optional
+            Máximo de conexiones simultáneas del pool
+        keep_alive : bool, default=True
+            Si es False, cada conexión se cierra luego de su respuesta
+        cache : bool, str or ResponseCache, optional
+            Caché persistente de respuestas. True usa APISettings.CACHE_PATH,
+            una ruta usa ese archivo SQLite. Por defecto no se usa caché
+        memory_cache : int or FrameCache, optional
+            Memoización en memoria de los DataFrames ya procesados. Un entero
+            indica el presupuesto en bytes. Por defecto no se usa
+        series_store : bool, str or SeriesStore, optional
+            Almacén local de observaciones para `incremental=True`. True usa
+            APISettings.STORE_PATH, una ruta usa ese archivo SQLite
+        retry : bool, int or RetryPolicy, default=True
+            Reintentos y circuit breaker, como en `BCRAclient`
+        rate_limits : dict, optional
+            Solicitudes por segundo por familia de endpoints, como en `BCRAclient`
+        coalesce : bool, default=True
+            Si es True, las llamadas idénticas concurrentes comparten una
+            única consulta, como en `BCRAclient`
+        instrumentation : Instrumentation, optional
+            Recibe la duración de cada etapa de las consultas y los bytes y
+            filas por endpoint, como en `BCRAclient`
+        json_decoder : str or JSONDecoder, optional
+            Decodificador JSON de las respuestas, como en `BCRAclient`
+        """
+        if not verify_ssl:
+            warnings.warn(ERROR_MESSAGES['ssl_disabled'], UserWarning)
+
+        connector = AsyncAPIConnector(
+            base_url=base_url,
+            cert_path=cert_path or (APISettings.CERT_PATH if verify_ssl else False),
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            cache=open_cache(cache),
+            frame_cache=open_frame_cache(memory_cache),
+            series_store=open_series_store(series_store),
+            retry=open_retry_policy(retry),
+            rate_limits=rate_limits,
+            coalesce=coalesce,
+            instrumentation=instrumentation,
+            json_decoder=open_decoder(json_decoder)
+        )
+
+        self.connector = connector
+        self.monetary = AsyncMonetaryAPI(connector)
+        self.currency = AsyncCurrencyAPI(connector)
+        self.checks = AsyncChecksAPI(connector)
+        self.debtors = AsyncDebtorsAPI(connector)
+
+    async def close(self) -> None:
+        """Cierra las conexiones del pool compartido por todas las APIs."""
+        await self.connector.close()
+
+    async def __aenter__(self) -> 'AsyncBCRAclient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
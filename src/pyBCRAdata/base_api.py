@@ -1,87 +1,712 @@
-from typing import Dict, Any, Union, Optional, Callable, Type
+from typing import Dict, Any, Union, Optional, Callable, Type, List, Tuple, Iterable, Iterator, FrozenSet
 import pandas as pd
 import json
+import re
+from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
-from functools import wraps
+from functools import lru_cache
+from urllib.parse import urlencode
 
-from .settings import APISettings, EndpointConfig
-from .connector import APIConnector, build_url
+from .settings import APISettings, EndpointConfig, ERROR_MESSAGES
+from .connector import APIConnector
+from .concurrency import ordered_map, chunked
+from .dates import parse_date, format_date, split_date_range
+from .ratelimit import RateLimiter
+from .store import SeriesStore, OPEN_START
+from .sinks import Sink, open_sink, write_frames
+from .panel import SeriesArrays, series_arrays, build_panel
 
 APIResult = Union[str, pd.DataFrame, Dict[str, Any]]
 
+@lru_cache(maxsize=None)
 def load_api_docs() -> Dict[str, Dict[str, str]]:
+    """Documentación de los métodos generados; se lee una vez, al crear las clases de API."""
     docs_path = Path(__file__).parent / 'api_docs.json'
     with open(docs_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-API_DOCS = load_api_docs()
+BATCH_DOC = """Versión por lotes de `{method}`: consulta muchos valores de `{param}` en paralelo.
 
-def endpoint(method_name: str) -> Callable:
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        def wrapper(self, **kwargs) -> APIResult:
-            return self._make_api_call(method_name, **kwargs)
-        return wrapper
-    return decorator
+Parameters
+----------
+{arg} : list
+    Valores de `{param}` a consultar. También se aceptan diccionarios con
+    los parámetros completos de cada consulta
+max_workers : int, optional
+    Cantidad de consultas simultáneas
+rate_limit : float or RateLimiter, optional
+    Máximo de solicitudes por segundo entre todos los hilos
+stream : bool, optional
+    Si es True, devuelve un iterador de BatchResult, uno cada `chunk_size`
+    consultas, a medida que se completan
+chunk_size : int, optional
+    Consultas por bloque con stream=True o sink
+sink : str, PathLike or Sink, optional
+    Destino donde escribir los datos de todas las consultas, por bloques de
+    `chunk_size` consultas, con `{param}` como primera columna
+**kwargs
+    Parámetros comunes a todas las consultas
+
+Returns
+-------
+BatchResult or iterator of BatchResult
+    `data`: DataFrame combinado, indexado por `{param}`; con `sink`, lo que
+    devuelve el destino (la ruta del archivo o una `pyarrow.Table`)
+    `errors`: DataFrame con `{param}`, `status_code` y `error` de cada consulta fallida"""
+
+PANEL_DOC = """Descarga muchas series de `{method}` en paralelo y las une en un único DataFrame.
+
+Parameters
+----------
+{arg} : list
+    Valores de `{param}` de las series a descargar, uno por columna
+{start} : str, optional
+    Fecha de inicio (YYYY-MM-DD)
+{end} : str, optional
+    Fecha de fin (YYYY-MM-DD)
+max_workers : int, optional
+    Cantidad de descargas simultáneas, entre series y páginas
+debug : bool, optional
+    Si es True, devuelve la URL de cada serie sin consultarla
+
+Returns
+-------
+DataFrame
+    Indexado por `fecha` (la unión de las fechas de todas las series), con
+    una columna float64 por valor de `{param}`; NaN donde una serie no tiene
+    dato
+
+Raises
+------
+ValueError
+    Si la descarga de alguna serie falla"""
+
+@dataclass
+class BatchResult:
+    """Resultado de una consulta por lotes."""
+    data: pd.DataFrame
+    errors: pd.DataFrame
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        return iter((self.data, self.errors))
+
+def batch_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pasa el valor consultado del índice de un resultado por lotes a la
+    primera columna, salvo que la respuesta ya lo incluya, para exportarlo.
+    """
+    key = data.index.names[0]
+    return data.reset_index(level=0, drop=key in data.columns).reset_index(drop=True)
+
+@dataclass(frozen=True)
+class CallPlan:
+    """
+    Datos de un endpoint que se calculan una sola vez, al crear la clase de
+    API: su clave (`api.metodo`), la plantilla de la URL y los conjuntos de
+    parámetros válidos. Cada llamada solo valida, formatea y consulta.
+    """
+    config: EndpointConfig
+    endpoint_key: str
+    # Partes fijas y nombres de parámetros de la ruta, alternados
+    path_parts: Tuple[str, ...]
+    path_params: FrozenSet[str]
+    query_params: FrozenSet[str]
+    api_params: FrozenSet[str]
+    required_args: FrozenSet[str]
+
+    @classmethod
+    def compile(cls, api_name: str, method_name: str, config: EndpointConfig) -> 'CallPlan':
+        return cls(
+            config=config,
+            endpoint_key=f"{api_name}.{method_name}",
+            path_parts=tuple(re.split(r"\{(\w+)\}", config.endpoint.lstrip('/'))),
+            path_params=frozenset(config.path_params),
+            query_params=frozenset(config.query_params),
+            api_params=frozenset(config.path_params | config.query_params),
+            required_args=frozenset(config.required_args)
+        )
+
+    def split(self, kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Valida los argumentos y los separa en parámetros de la API y de la función."""
+        if missing := self.required_args - kwargs.keys():
+            raise ValueError(f"Faltan argumentos requeridos: {', '.join(missing)}")
+
+        api_params, func_params = {}, {}
+        for key, value in kwargs.items():
+            if key in self.api_params:
+                api_params[key] = value
+            elif key in APISettings.COMMON_FUNC_PARAMS:
+                func_params[key] = value
+            else:
+                raise ValueError(
+                    f"Parámetros inválidos: {', '.join(set(kwargs) - self.api_params - APISettings.COMMON_FUNC_PARAMS)}.\n\n"
+                    f"Permitidos API: {', '.join(self.api_params) or 'Ninguno'}.\n"
+                    f"Permitidos función: {', '.join(APISettings.COMMON_FUNC_PARAMS)}."
+                )
+        return api_params, func_params
+
+    def url(self, base_url: str, params: Dict[str, Any]) -> str:
+        """Equivalente a `build_url` con la plantilla precalculada."""
+        parts = self.path_parts
+        path = parts[0]
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            path += (str(params[name]) if name in params else f"{{{name}}}") + parts[i + 1]
+        query = {k: v for k, v in params.items() if k in self.query_params and v is not None}
+        url = f"{base_url}/{path}"
+        return f"{url}?{urlencode(query)}" if query else url
+
+def _api_method(method_name: str, doc: str) -> Callable:
+    def api_method(self, **kwargs) -> APIResult:
+        return self._make_api_call(method_name, **kwargs)
+
+    api_method.__name__ = api_method.__qualname__ = method_name
+    api_method.__doc__ = doc
+    return api_method
+
+def _batch_method(method_name: str, config: EndpointConfig) -> Callable:
+    def batch_method(self, **kwargs) -> Union[BatchResult, List[str]]:
+        return self._make_batch_call(method_name, **kwargs)
+
+    batch_method.__name__ = batch_method.__qualname__ = f"{method_name}_many"
+    batch_method.__doc__ = BATCH_DOC.format(
+        method=method_name, param=config.batch_param, arg=config.batch_arg
+    )
+    return batch_method
+
+def _panel_method(method_name: str, config: EndpointConfig) -> Callable:
+    def panel_method(self, **kwargs) -> Union[pd.DataFrame, List[str]]:
+        return self._make_panel_call(method_name, **kwargs)
+
+    path_param, = config.path_params
+    panel_method.__name__ = panel_method.__qualname__ = "panel"
+    panel_method.__doc__ = PANEL_DOC.format(
+        method=method_name, arg=config.panel_arg, param=path_param,
+        start=config.date_params[0], end=config.date_params[1]
+    )
+    return panel_method
 
 class BaseAPI:
     _api_config: Dict[str, EndpointConfig] = {}
+    _api_name: str = ""
+    _plans: Dict[str, CallPlan] = {}
 
     def __init__(self, connector: APIConnector):
         self.api_connector = connector
-        self._generate_methods()
 
-    def _generate_methods(self) -> None:
-        api_name = self.__class__.__name__.lower().replace('api', '')
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if '_api_config' in cls.__dict__:
+            cls._generate_methods()
 
-        for method_name, endpoint_config in self._api_config.items():
-            def create_api_method(name):
-                def api_method(self, **kwargs):
-                    return self._make_api_call(name, **kwargs)
+    @classmethod
+    def api_name(cls) -> str:
+        return cls._api_name or cls.__name__.lower().replace('api', '')
 
-                api_method.__name__ = name
-                api_method.__doc__ = API_DOCS.get(api_name, {}).get(name, "")
-                return endpoint(name)(api_method)
+    @classmethod
+    def _generate_methods(cls) -> None:
+        """Crea los métodos de cada endpoint y sus planes de llamada, una vez por clase."""
+        api_name = cls.api_name()
+        docs = load_api_docs().get(api_name, {})
 
-            api_method = create_api_method(method_name)
-            setattr(self.__class__, method_name, api_method)
+        cls._plans = {}
+        for method_name, endpoint_config in cls._api_config.items():
+            cls._plans[method_name] = CallPlan.compile(api_name, method_name, endpoint_config)
+            setattr(cls, method_name, _api_method(method_name, docs.get(method_name, "")))
+            if endpoint_config.batch_param:
+                setattr(cls, f"{method_name}_many", _batch_method(method_name, endpoint_config))
+            if endpoint_config.panel_arg:
+                setattr(cls, "panel", _panel_method(method_name, endpoint_config))
+
+    def _prepare_call(self, method_name: str, kwargs: Dict[str, Any]
+                     ) -> Tuple[CallPlan, Dict[str, Any], Dict[str, Any]]:
+        """Devuelve el plan del método y los argumentos separados en parámetros de la API y de la función."""
+        plan = self._plans[method_name]
+        return (plan, *plan.split(kwargs))
 
     def _make_api_call(self, method_name: str, **kwargs) -> APIResult:
-        endpoint_config = self._api_config[method_name]
+        plan, api_params, func_params = self._prepare_call(method_name, kwargs)
+        return self._call_handler(func_params)(plan, api_params, func_params)
 
-        if missing := endpoint_config.required_args - kwargs.keys():
-            raise ValueError(f"Faltan argumentos requeridos: {', '.join(missing)}")
+    def _call_handler(self, func_params: Dict[str, Any]) -> Callable[..., Any]:
+        """
+        Método que resuelve la consulta según las opciones de la función. El
+        orden de prioridad es el mismo para el cliente síncrono y el asíncrono.
+        """
+        if func_params.get("sink") is not None:
+            return self._sink_call
+        if func_params.get("stream", False):
+            return self._stream_call
+        if func_params.get("incremental", False):
+            return self._incremental_call
+        if func_params.get("paginate", False) or func_params.get("shards"):
+            return self._composite_call
+        return self._simple_call
 
-        valid_api_params = endpoint_config.path_params | endpoint_config.query_params
-        valid_func_params = APISettings.COMMON_FUNC_PARAMS
-
-        if invalid := set(kwargs) - valid_api_params - valid_func_params:
-            raise ValueError(
-                f"Parámetros inválidos: {', '.join(invalid)}.\n\n"
-                f"Permitidos API: {', '.join(valid_api_params) or 'Ninguno'}.\n"
-                f"Permitidos función: {', '.join(valid_func_params)}."
-            )
-
-        api_params = {k: v for k, v in kwargs.items() if k in valid_api_params}
-        func_params = {k: v for k, v in kwargs.items() if k in valid_func_params}
-
-        url = build_url(
-            base_url=self.api_connector.base_url,
-            endpoint=endpoint_config.endpoint,
-            params=api_params,
-            path_params=endpoint_config.path_params,
-            query_params=endpoint_config.query_params
-        )
-
-        # 🔥 Construimos el endpoint_key para pasarlo
-        api_name = self.__class__.__name__.lower().replace('api', '')
-        endpoint_key = f"{api_name}.{method_name}"
+    def _simple_call(self, plan: CallPlan, api_params: Dict[str, Any], func_params: Dict[str, Any]) -> APIResult:
+        """Una única consulta; con un conector asíncrono devuelve la corutina de la consulta."""
+        with self.api_connector.span("url_build", plan.endpoint_key):
+            url = self._build_url(plan, api_params)
+        cache_ttl = self._cache_ttl(plan, api_params)
 
         if func_params.get("debug", False):
             return url
         elif func_params.get("json", False):
-            return self.api_connector.connect_to_api(url)
-        return self.api_connector.fetch_data(url, endpoint_key=endpoint_key)
+            return self.api_connector.connect_to_api(url, cache_ttl)
+        return self.api_connector.fetch_data(url, endpoint_key=plan.endpoint_key, cache_ttl=cache_ttl)
+
+    def _build_url(self, plan: CallPlan, api_params: Dict[str, Any]) -> str:
+        return plan.url(self.api_connector.base_url, api_params)
+
+    @staticmethod
+    def _cache_ttl(plan: CallPlan, api_params: Dict[str, Any]) -> Optional[float]:
+        """
+        Vigencia en caché de una consulta: la del endpoint, salvo que el rango
+        de fechas termine antes de hoy, en cuyo caso los datos ya no cambian y
+        la respuesta no vence.
+        """
+        config = plan.config
+        if config.cache_ttl != 0 and config.date_params:
+            end = api_params.get(config.date_params[1])
+            try:
+                if end and parse_date(end) < date.today():
+                    return None
+            except ValueError:
+                pass
+        return config.cache_ttl
+
+    def _composite_plan(self, plan: CallPlan, api_params: Dict[str, Any],
+                       func_params: Dict[str, Any]) -> Tuple[bool, Optional[List[Dict[str, Any]]], int]:
+        """
+        Valida una consulta paginada y/o dividida en ventanas de fechas y
+        devuelve `(paginate, windows, max_workers)`; `windows` es None si no
+        se pidió división por fechas.
+        """
+        shards = func_params.get("shards")
+        # Las ventanas se paginan siempre que el endpoint lo permita: sin
+        # paginar, una ventana con más observaciones que el límite de la API
+        # quedaría truncada sin aviso
+        paginate = func_params.get("paginate", False) or bool(shards and plan.config.page_size)
+
+        if paginate and not plan.config.page_size:
+            raise ValueError(ERROR_MESSAGES['not_paginated'].format(method=plan.endpoint_key))
+        max_workers = func_params.get("max_workers", APISettings.MAX_WORKERS)
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError(ERROR_MESSAGES['invalid_workers'].format(value=max_workers))
+
+        windows = self._date_windows(plan, api_params, shards) if shards else None
+        return paginate, windows, max_workers
+
+    def _composite_debug(self, plan: CallPlan, api_params: Dict[str, Any],
+                        paginate: bool, windows: Optional[List[Dict[str, Any]]]) -> Union[str, List[str]]:
+        if windows is None:
+            return self._window_url(plan, api_params, paginate)
+        return [self._window_url(plan, params, paginate) for params in windows]
+
+    def _composite_call(self, plan: CallPlan, api_params: Dict[str, Any],
+                       func_params: Dict[str, Any]) -> APIResult:
+        """Resuelve las consultas paginadas y/o divididas en ventanas de fechas."""
+        paginate, windows, max_workers = self._composite_plan(plan, api_params, func_params)
+        if func_params.get("debug", False):
+            return self._composite_debug(plan, api_params, paginate, windows)
+
+        def fetch() -> Tuple[int, Dict[str, Any]]:
+            return self._fetch_composite(plan, api_params, paginate, windows, max_workers)
+
+        if func_params.get("json", False):
+            return fetch()
+        return self.api_connector.memoize_frame(
+            self._composite_key(plan, api_params, paginate, windows),
+            self._cache_ttl(plan, api_params),
+            lambda: self.api_connector.process_response(*fetch(), plan.endpoint_key)
+        )
+
+    def _fetch_composite(self, plan: CallPlan, api_params: Dict[str, Any],
+                        paginate: bool, windows: Optional[List[Dict[str, Any]]],
+                        max_workers: int) -> Tuple[int, Dict[str, Any]]:
+        if windows is None:
+            return self._fetch_window(plan, api_params, paginate, max_workers)
+        responses = ordered_map(
+            lambda params: self._fetch_window(plan, params, paginate, 1),
+            windows, max_workers
+        )
+        return self.api_connector.merge_responses(responses, deduplicate=True)
+
+    def _composite_key(self, plan: CallPlan, api_params: Dict[str, Any], paginate: bool,
+                      windows: Optional[List[Dict[str, Any]]]) -> Tuple[str, str]:
+        urls = self._composite_debug(plan, api_params, paginate, windows)
+        mode = "pages" if paginate else "windows"
+        return plan.endpoint_key, f"{mode}:{urls}"
+
+    def _incremental_plan(self, plan: CallPlan, api_params: Dict[str, Any],
+                         func_params: Dict[str, Any]
+                         ) -> Tuple[SeriesStore, str, List[Tuple[date, date]], Dict[str, Any]]:
+        """
+        Valida una consulta incremental y devuelve `(store, series, gaps,
+        fetch_func_params)`: `gaps` son los rangos de fechas pedidos que el
+        almacén todavía no cubre, vacía si ya cubre todo el rango.
+        """
+        config = plan.config
+        if not config.date_params:
+            raise ValueError(ERROR_MESSAGES['not_incremental'].format(method=plan.endpoint_key))
+        store = self.api_connector.series_store
+        if store is None:
+            raise ValueError(ERROR_MESSAGES['store_required'])
+        # Cada hueco se descarga completo para marcarlo como cubierto: un
+        # recorte con limit/offset dejaría observaciones sin guardar
+        if any(api_params.get(param) is not None for param in ("limit", "offset")):
+            raise ValueError(ERROR_MESSAGES['incremental_paging'])
+
+        start_param, end_param = config.date_params
+        series = ":".join([plan.endpoint_key] + [
+            str(api_params[param]) for param in sorted(plan.path_params)
+        ])
+        # Se pagina siempre que el endpoint lo permita: una descarga truncada
+        # por `limit` dejaría huecos dentro de un rango marcado como cubierto.
+        fetch_func_params = {**func_params, "paginate": bool(config.page_size)}
+
+        start, end = (parse_date(api_params[param], param) if api_params.get(param) else None
+                      for param in (start_param, end_param))
+        return store, series, store.gaps(series, start, end), fetch_func_params
+
+    @staticmethod
+    def _gap_params(plan: CallPlan, api_params: Dict[str, Any], gap: Tuple[date, date]) -> Dict[str, Any]:
+        """Parámetros de la consulta de un hueco; sin desde o hasta en los extremos abiertos."""
+        start_param, end_param = plan.config.date_params
+        params = {key: value for key, value in api_params.items() if key not in (start_param, end_param)}
+        if gap[0] > OPEN_START:
+            params[start_param] = format_date(gap[0])
+        if gap[1] < date.today() or api_params.get(end_param):
+            params[end_param] = format_date(gap[1])
+        return params
+
+    def _incremental_result(self, store: SeriesStore, series: str, plan: CallPlan,
+                           api_params: Dict[str, Any], func_params: Dict[str, Any],
+                           gaps: List[Tuple[date, date]],
+                           responses: List[Tuple[int, Dict[str, Any]]]) -> APIResult:
+        """Guarda las observaciones de los huecos descargados y devuelve el rango pedido desde el almacén."""
+        for (start, end), (status_code, data) in zip(gaps, responses):
+            if status_code != 200:
+                return (status_code, data) if func_params.get("json", False) else \
+                    self.api_connector.process_response(status_code, data, plan.endpoint_key)
+            records = self.api_connector._page_results(data)
+            store.append(series, records)
+            # Un rango que termina antes de hoy ya no cambia (ver `_cache_ttl`);
+            # si llega hasta hoy, solo queda cubierto hasta la última
+            # observación publicada, y lo posterior se vuelve a pedir.
+            if end >= date.today():
+                end = max((parse_date(str(record['fecha'])[:10]) for record in records), default=None)
+            if end is not None:
+                store.add_coverage(series, start, end)
+
+        start_param, end_param = plan.config.date_params
+        data = {"results": store.read(series, api_params.get(start_param), api_params.get(end_param))}
+        if func_params.get("json", False):
+            return 200, data
+        return self.api_connector.process_response(200, data, plan.endpoint_key)
+
+    def _incremental_call(self, plan: CallPlan, api_params: Dict[str, Any],
+                         func_params: Dict[str, Any]) -> APIResult:
+        """Descarga solo los rangos de fechas que el almacén todavía no tiene y arma el resultado desde él."""
+        store, series, gaps, fetch_func_params = self._incremental_plan(plan, api_params, func_params)
+        urls, responses = [], []
+        for gap in gaps:
+            params = self._gap_params(plan, api_params, gap)
+            paginate, windows, max_workers = self._composite_plan(plan, params, fetch_func_params)
+            if func_params.get("debug", False):
+                debug_urls = self._composite_debug(plan, params, paginate, windows)
+                urls.extend([debug_urls] if isinstance(debug_urls, str) else debug_urls)
+                continue
+            responses.append(self._fetch_composite(plan, params, paginate, windows, max_workers))
+            if responses[-1][0] != 200:
+                break
+        if func_params.get("debug", False):
+            return urls
+        return self._incremental_result(store, series, plan, api_params, func_params, gaps, responses)
+
+    def _stream_plan(self, plan: CallPlan, api_params: Dict[str, Any], func_params: Dict[str, Any]
+                    ) -> Tuple[bool, List[Dict[str, Any]], int, Optional[int]]:
+        """
+        Valida una consulta con `stream=True` y devuelve `(paginate, windows,
+        max_workers, chunk_size)`. Se pagina siempre que el endpoint lo
+        permita, para no tener nunca la respuesta completa en memoria.
+        """
+        if func_params.get("incremental", False):
+            raise ValueError(ERROR_MESSAGES['stream_incremental'])
+        chunk_size = func_params.get("chunk_size")
+        if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+            raise ValueError(ERROR_MESSAGES['invalid_chunk_size'].format(value=chunk_size))
+
+        paginate, windows, max_workers = self._composite_plan(
+            plan, api_params, {**func_params, "paginate": bool(plan.config.page_size)}
+        )
+        return paginate, windows if windows is not None else [api_params], max_workers, chunk_size
+
+    def _stream_call(self, plan: CallPlan, api_params: Dict[str, Any],
+                    func_params: Dict[str, Any]) -> Union[Iterator[APIResult], str, List[str]]:
+        """
+        Entrega el resultado en bloques a medida que llegan las páginas: uno
+        por página o, con `chunk_size`, uno cada esa cantidad de registros.
+        """
+        paginate, windows, max_workers, chunk_size = self._stream_plan(plan, api_params, func_params)
+        if func_params.get("debug", False):
+            return self._composite_debug(plan, api_params, paginate, windows if func_params.get("shards") else None)
+
+        def pages() -> Iterator[Tuple[int, Dict[str, Any]]]:
+            for params in windows:
+                yield from self._iter_window(plan, params, paginate, max_workers)
+
+        return self._stream_chunks(plan, pages(), chunk_size, func_params.get("json", False))
+
+    def _sink_call(self, plan: CallPlan, api_params: Dict[str, Any], func_params: Dict[str, Any]) -> Any:
+        """Escribe el resultado en el destino `sink` a medida que llegan las páginas."""
+        frames = self._stream_call(plan, api_params, {**func_params, "json": False})
+        if func_params.get("debug", False):
+            return frames
+        return write_frames(open_sink(func_params["sink"]), frames)
+
+    def _stream_chunks(self, plan: CallPlan, pages: Iterable[Tuple[int, Dict[str, Any]]],
+                      chunk_size: Optional[int], as_json: bool) -> Iterator[APIResult]:
+        buffer: List[Any] = []
+        for page in pages:
+            for records in self._split_page(page, buffer, chunk_size):
+                yield self._chunk_result(plan, records, as_json)
+        if buffer:
+            yield self._chunk_result(plan, buffer, as_json)
+
+    def _split_page(self, page: Tuple[int, Dict[str, Any]], buffer: List[Any],
+                   chunk_size: Optional[int]) -> List[List[Any]]:
+        """
+        Devuelve los bloques completos que se pueden entregar con los registros
+        de `page`; los sobrantes quedan en `buffer` para el bloque siguiente.
+        """
+        status_code, data = page
+        if status_code != 200:
+            raise ValueError(ERROR_MESSAGES['stream_error'].format(
+                status=status_code, error=self._describe_error(data)['error']
+            ))
+        records = self.api_connector._page_results(data)
+        if chunk_size is None:
+            return [records] if records else []
+
+        buffer.extend(records)
+        cut = len(buffer) - len(buffer) % chunk_size
+        chunks = [buffer[i:i + chunk_size] for i in range(0, cut, chunk_size)]
+        del buffer[:cut]
+        return chunks
+
+    def _chunk_result(self, plan: CallPlan, records: List[Any], as_json: bool) -> APIResult:
+        data = {"results": records}
+        return data if as_json else self.api_connector.process_response(200, data, plan.endpoint_key)
+
+    def _iter_window(self, plan: CallPlan, api_params: Dict[str, Any], paginate: bool,
+                    max_workers: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        cache_ttl = self._cache_ttl(plan, api_params)
+        if not paginate:
+            yield self.api_connector.connect_to_api(self._build_url(plan, api_params), cache_ttl)
+            return
+        page_size, offset = self._page_bounds(plan, api_params)
+        yield from self.api_connector.iter_pages(
+            self._page_url_factory(plan, api_params), page_size, offset, max_workers, cache_ttl
+        )
+
+    def _date_windows(self, plan: CallPlan, api_params: Dict[str, Any],
+                     shards: int) -> List[Dict[str, Any]]:
+        if not plan.config.date_params:
+            raise ValueError(ERROR_MESSAGES['not_sharded'].format(method=plan.endpoint_key))
+        if not isinstance(shards, int) or shards < 1:
+            raise ValueError(ERROR_MESSAGES['invalid_shards'].format(value=shards))
+
+        start_param, end_param = plan.config.date_params
+        if not api_params.get(start_param):
+            raise ValueError(ERROR_MESSAGES['shard_start_required'].format(field=start_param))
+        start = parse_date(api_params[start_param], start_param)
+        end = parse_date(api_params[end_param], end_param) if api_params.get(end_param) else date.today()
+
+        return [
+            {**api_params, start_param: format_date(lo), end_param: format_date(hi)}
+            for lo, hi in split_date_range(start, end, shards)
+        ]
+
+    def _page_url_factory(self, plan: CallPlan, api_params: Dict[str, Any]) -> Callable[[int, int], str]:
+        def page_url(page_offset: int, limit: int) -> str:
+            return self._build_url(plan, {**api_params, "limit": limit, "offset": page_offset})
+        return page_url
+
+    @staticmethod
+    def _page_bounds(plan: CallPlan, api_params: Dict[str, Any]) -> Tuple[int, int]:
+        return int(api_params.get("limit") or plan.config.page_size), int(api_params.get("offset") or 0)
+
+    def _window_url(self, plan: CallPlan, api_params: Dict[str, Any], paginate: bool) -> str:
+        if not paginate:
+            return self._build_url(plan, api_params)
+        page_size, offset = self._page_bounds(plan, api_params)
+        return self._page_url_factory(plan, api_params)(offset, page_size)
+
+    def _fetch_window(self, plan: CallPlan, api_params: Dict[str, Any],
+                     paginate: bool, max_workers: int) -> Tuple[int, Dict[str, Any]]:
+        cache_ttl = self._cache_ttl(plan, api_params)
+        if not paginate:
+            return self.api_connector.connect_to_api(self._build_url(plan, api_params), cache_ttl)
+        page_size, offset = self._page_bounds(plan, api_params)
+        return self.api_connector.fetch_pages(
+            self._page_url_factory(plan, api_params), page_size, offset, max_workers, cache_ttl
+        )
+
+    def _batch_plan(self, method_name: str, kwargs: Dict[str, Any]
+                   ) -> Tuple[str, Iterable[Any], Callable[[Any], Dict[str, Any]], int,
+                              Optional[RateLimiter], Optional[int], Optional[Sink]]:
+        """
+        Valida una consulta por lotes y devuelve `(batch_param, items,
+        item_params, max_workers, limiter, chunk_size, sink)`; `chunk_size`
+        es None salvo que se pida `stream=True` o un `sink`. Ni `stream` ni
+        `sink` pasan a las consultas individuales: se aplican al lote.
+        """
+        endpoint_config = self._plans[method_name].config
+        batch_param, batch_arg = endpoint_config.batch_param, endpoint_config.batch_arg
+
+        if batch_arg not in kwargs:
+            raise ValueError(f"Faltan argumentos requeridos: {batch_arg}")
+        items = kwargs.pop(batch_arg)
+        if isinstance(items, (str, bytes, dict)) or not isinstance(items, Iterable):
+            raise ValueError(ERROR_MESSAGES['batch_items'].format(arg=batch_arg))
+
+        max_workers = kwargs.pop("max_workers", APISettings.MAX_WORKERS)
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError(ERROR_MESSAGES['invalid_workers'].format(value=max_workers))
+        limiter = kwargs.pop("rate_limit", None)
+        if limiter is not None and not isinstance(limiter, RateLimiter):
+            limiter = RateLimiter(limiter)
+        stream = kwargs.pop("stream", False)
+        chunk_size = kwargs.pop("chunk_size", APISettings.STREAM_BATCH_SIZE)
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(ERROR_MESSAGES['invalid_chunk_size'].format(value=chunk_size))
+        sink = kwargs.pop("sink", None)
+        if stream and sink is not None:
+            raise ValueError(ERROR_MESSAGES['batch_sink_stream'])
+        sink = None if kwargs.get("debug", False) else open_sink(sink)
+
+        def item_params(item: Any) -> Dict[str, Any]:
+            return {**kwargs, **(item if isinstance(item, dict) else {batch_param: item})}
+
+        chunked_call = stream or sink is not None
+        return batch_param, items, item_params, max_workers, limiter, chunk_size if chunked_call else None, sink
+
+    def _make_batch_call(self, method_name: str, **kwargs) -> Union[BatchResult, Iterator[BatchResult], List[str]]:
+        batch_param, items, item_params, max_workers, limiter, chunk_size, sink = self._batch_plan(method_name, kwargs)
+
+        if kwargs.get("debug", False):
+            return [self._make_api_call(method_name, **item_params(item)) for item in items]
+
+        def run(item: Any) -> Tuple[Any, Any]:
+            params = item_params(item)
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                return params.get(batch_param), self._make_api_call(method_name, **params)
+            except Exception as e:
+                return params.get(batch_param), e
+
+        outcomes = ordered_map(run, items, max_workers)
+        if chunk_size is None:
+            return self._batch_result(batch_param, outcomes)
+        groups = (self._batch_result(batch_param, group) for group in chunked(outcomes, chunk_size))
+        if sink is None:
+            return groups
+        errors: List[pd.DataFrame] = []
+        data = write_frames(sink, self._batch_frames(groups, errors))
+        return BatchResult(data, self._batch_errors(batch_param, errors))
+
+    def _panel_plan(self, method_name: str, kwargs: Dict[str, Any]
+                   ) -> Tuple[str, List[Any], Callable[[Any], Dict[str, Any]], int]:
+        """
+        Valida una consulta de panel y devuelve `(series_param, items,
+        series_params, max_workers)`. Las descargas simultáneas se reparten
+        entre las series y las páginas de cada una.
+        """
+        config = self._plans[method_name].config
+        series_param, = config.path_params
+
+        if config.panel_arg not in kwargs:
+            raise ValueError(f"Faltan argumentos requeridos: {config.panel_arg}")
+        items = kwargs.pop(config.panel_arg)
+        if isinstance(items, (str, bytes, dict)) or not isinstance(items, Iterable):
+            raise ValueError(ERROR_MESSAGES['batch_items'].format(arg=config.panel_arg))
+        items = list(items)
+
+        max_workers = kwargs.pop("max_workers", APISettings.MAX_WORKERS)
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError(ERROR_MESSAGES['invalid_workers'].format(value=max_workers))
+        if invalid := kwargs.keys() - {*config.date_params, "debug"}:
+            raise ValueError(ERROR_MESSAGES['invalid_params'].format(params=", ".join(sorted(invalid))))
+
+        series_workers = max(1, min(max_workers, len(items)))
+        fetch_params = {"paginate": True, "json": True, "max_workers": max(1, max_workers // series_workers)}
+
+        def series_params(item: Any) -> Dict[str, Any]:
+            return {**kwargs, **fetch_params, series_param: item}
+
+        return series_param, items, series_params, series_workers
+
+    def _panel_arrays(self, method_name: str, item: Any, response: Tuple[int, Dict[str, Any]]) -> SeriesArrays:
+        """Fechas y valores de la respuesta de una serie; los registros se descartan enseguida."""
+        status, data = response
+        if status != 200:
+            error = self._describe_error(data)
+            raise ValueError(ERROR_MESSAGES['panel_error'].format(
+                status=error["status_code"] or status, series=item, error=error["error"]
+            ))
+        config = self._plans[method_name].config
+        return series_arrays(data.get("results") or [], config.panel_value)
+
+    def _make_panel_call(self, method_name: str, **kwargs) -> Union[pd.DataFrame, List[str]]:
+        series_param, items, series_params, max_workers = self._panel_plan(method_name, kwargs)
+        if kwargs.get("debug", False):
+            return [self._make_api_call(method_name, **series_params(item)) for item in items]
+
+        arrays = list(ordered_map(
+            lambda item: self._panel_arrays(method_name, item, self._make_api_call(method_name, **series_params(item))),
+            items, max_workers
+        ))
+        return build_panel(items, arrays, series_param)
+
+    @staticmethod
+    def _batch_frames(groups: Iterable[BatchResult], errors: List[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Datos de cada bloque del lote, listos para el sink; los errores se acumulan en `errors`."""
+        for group in groups:
+            if not group.errors.empty:
+                errors.append(group.errors)
+            if not group.data.empty:
+                yield batch_frame(group.data)
+
+    @staticmethod
+    def _batch_errors(batch_param: str, errors: List[pd.DataFrame]) -> pd.DataFrame:
+        if errors:
+            return pd.concat(errors, ignore_index=True)
+        return pd.DataFrame(columns=[batch_param, "status_code", "error"])
+
+    def _batch_result(self, batch_param: str, outcomes: Iterable[Tuple[Any, Any]]) -> BatchResult:
+        keys, frames, errors = [], [], []
+        for key, result in outcomes:
+            if isinstance(result, pd.DataFrame):
+                keys.append(key)
+                frames.append(result)
+            else:
+                errors.append({batch_param: key, **self._describe_error(result)})
+
+        data = pd.concat(frames, keys=keys, names=[batch_param, None]) if frames else pd.DataFrame()
+        return BatchResult(data, pd.DataFrame(errors, columns=[batch_param, "status_code", "error"]))
+
+    @staticmethod
+    def _describe_error(result: Any) -> Dict[str, Any]:
+        if isinstance(result, Exception):
+            return {"status_code": getattr(result, "status_code", 0), "error": str(result)}
+        if isinstance(result, dict) and result:
+            messages = result.get("errorMessages") or [json.dumps(result, ensure_ascii=False)]
+            return {"status_code": result.get("status", 0), "error": "; ".join(map(str, messages))}
+        return {"status_code": 0, "error": ERROR_MESSAGES['api_error'].format(error="sin respuesta del servidor")}
 
-def create_api_class(name: str, api_config: Dict[str, EndpointConfig]) -> Type[BaseAPI]:
-    return type(name, (BaseAPI,), {'_api_config': api_config})
+def create_api_class(name: str, api_config: Dict[str, EndpointConfig],
+                     base: Type[BaseAPI] = BaseAPI, api_name: str = "") -> Type[BaseAPI]:
+    return type(name, (base,), {'_api_config': api_config, '_api_name': api_name})
@@ -0,0 +1,312 @@
+from typing import Optional, Union, Dict, Hashable, Tuple
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .settings import APISettings
+
+class ResponseCache:
+    """
+    Caché persistente de respuestas HTTP en un archivo SQLite.
+
+    Las entradas se indexan por URL y guardan el cuerpo crudo de la respuesta
+    junto a su vencimiento. El archivo puede compartirse entre reinicios y
+    entre procesos: SQLite serializa las escrituras y cada hilo usa su propia
+    conexión. Cuando el tamaño total supera `max_bytes` se descartan primero
+    las entradas vencidas y luego las usadas hace más tiempo.
+
+    El tamaño total se mantiene en la tabla `totals` mediante triggers, de
+    modo que cada escritura cuesta lo mismo sin importar cuántas entradas
+    haya. Las lecturas no escriben: el último acceso de cada entrada se
+    registra en memoria y se guarda junto con la siguiente escritura.
+
+    Parameters
+    ----------
+    path : str or PathLike, optional
+        Ruta del archivo SQLite. Por defecto APISettings.CACHE_PATH
+    max_bytes : int, optional
+        Tamaño máximo de las respuestas almacenadas, en bytes
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            expires REAL,
+            accessed REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+        CREATE TABLE IF NOT EXISTS totals (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+        CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+            UPDATE totals SET value = value + new.size WHERE name = 'bytes';
+        END;
+        CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses BEGIN
+            UPDATE totals SET value = value - old.size + new.size WHERE name = 'bytes';
+        END;
+        CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+            UPDATE totals SET value = value - old.size WHERE name = 'bytes';
+        END;
+        INSERT OR IGNORE INTO totals SELECT 'bytes', COALESCE(SUM(size), 0) FROM responses;
+    """
+
+    def __init__(self, path: Union[str, os.PathLike, None] = None,
+                max_bytes: int = APISettings.CACHE_MAX_BYTES):
+        self.path = Path(path or APISettings.CACHE_PATH).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        # Últimos accesos aún no guardados, por clave
+        self._touched: Dict[str, float] = {}
+        self._touched_lock = threading.Lock()
+        with self._connection() as conn:
+            conn.executescript(self._SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Devuelve el valor almacenado para `key`, o None si no existe o venció."""
+        now = time.time()
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT value, expires FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires = row
+            if expires is not None and expires <= now:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+        with self._touched_lock:
+            self._touched[key] = now
+        return bytes(value)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        """
+        Guarda `value` bajo `key`. `ttl` es la vigencia en segundos; None
+        indica que la entrada no vence.
+        """
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        with self._connection() as conn:
+            # UPSERT y no INSERT OR REPLACE: el reemplazo no dispara el
+            # trigger de borrado y el total quedaría mal
+            conn.execute(
+                "INSERT INTO responses (key, value, size, expires, accessed) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                "expires = excluded.expires, accessed = excluded.accessed",
+                (key, sqlite3.Binary(value), len(value), expires, now)
+            )
+            self._flush_touched(conn)
+            self._evict(conn, now)
+
+    def _flush_touched(self, conn: sqlite3.Connection) -> None:
+        with self._touched_lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            conn.executemany(
+                "UPDATE responses SET accessed = MAX(accessed, ?) WHERE key = ?",
+                [(accessed, key) for key, accessed in touched.items()]
+            )
+
+    @staticmethod
+    def _total(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT value FROM totals WHERE name = 'bytes'").fetchone()[0]
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        total = self._total(conn)
+        if total <= self.max_bytes:
+            return
+        conn.execute("DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?", (now,))
+        total = self._total(conn)
+
+        stale = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            if total <= self.max_bytes:
+                break
+            stale.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def size(self) -> int:
+        """Tamaño total de las respuestas almacenadas, en bytes."""
+        with self._connection() as conn:
+            return self._total(conn)
+
+    def clear(self) -> None:
+        """Elimina todas las entradas."""
+        with self._touched_lock:
+            self._touched.clear()
+        with self._connection() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Guarda los accesos pendientes y cierra la conexión del hilo actual."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            with conn:
+                self._flush_touched(conn)
+            conn.close()
+            self._local.conn = None
+
+# Clase de los arrays de Arrow; no existe en las versiones de pandas anteriores a 1.5
+_ARROW_ARRAYS = getattr(pd.arrays, 'ArrowExtensionArray', ())
+
+def _copy_on_write_enabled() -> bool:
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return pd.get_option('mode.copy_on_write') is True if hasattr(pd.options.mode, 'copy_on_write') else False
+
+class FrameCache:
+    """
+    Memoización en memoria de DataFrames ya procesados, con política LRU y
+    un presupuesto de memoria en bytes.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memoria máxima ocupada por los DataFrames almacenados
+    mode : {'copy', 'cow', 'readonly'}, default='copy'
+        Qué se entrega en cada acierto para que el llamador no pueda alterar
+        el DataFrame almacenado:
+
+        - 'copy': una copia profunda.
+        - 'cow': una copia superficial que se copia recién al modificarse
+          (requiere Copy-on-Write de pandas; si no está activo se usa 'copy').
+        - 'readonly': una copia superficial sobre arrays marcados como de solo
+          lectura; modificarlos en el lugar produce un error. Los DataFrames
+          con columnas cuyos arrays no se pueden proteger se entregan como
+          en 'copy'.
+    """
+
+    MODES = ('copy', 'cow', 'readonly')
+
+    def __init__(self, max_bytes: int = APISettings.FRAME_CACHE_MAX_BYTES, mode: str = 'copy'):
+        if mode not in self.MODES:
+            raise ValueError(f"mode debe ser uno de {', '.join(self.MODES)}: {mode}")
+        self.max_bytes = max_bytes
+        self.mode = 'copy' if mode == 'cow' and not _copy_on_write_enabled() else mode
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        # Cada entrada: (DataFrame, bytes, vencimiento, si se entrega copia profunda)
+        self._entries: 'OrderedDict[Hashable, Tuple[pd.DataFrame, int, Optional[float], bool]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """Devuelve el DataFrame almacenado para `key`, o None si no existe o venció."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= time.monotonic():
+                self._discard(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self._share(entry[0], entry[3])
+
+    def put(self, key: Hashable, df: pd.DataFrame, ttl: Optional[float] = None) -> pd.DataFrame:
+        """
+        Almacena `df` bajo `key` con vigencia `ttl` en segundos (None: no
+        vence) y devuelve la vista que corresponde entregar al llamador.
+        """
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return df
+        deep = self.mode == 'copy' or (self.mode == 'readonly' and not self._freeze(df))
+        expires = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            self._entries[key] = (df, size, expires, deep)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+        return self._share(df, deep)
+
+    def _discard(self, key: Hashable) -> None:
+        size = self._entries.pop(key)[1]
+        self.bytes -= size
+
+    @staticmethod
+    def _share(df: pd.DataFrame, deep: bool) -> pd.DataFrame:
+        return df.copy(deep=deep)
+
+    @classmethod
+    def _freeze(cls, df: pd.DataFrame) -> bool:
+        """
+        Marca como de solo lectura los arrays de las columnas y del índice de
+        `df`. Devuelve False si alguno no se puede proteger.
+        """
+        arrays = [column.array for _, column in df.items()] + [df.index.array]
+        return all([cls._freeze_array(array) for array in arrays])
+
+    @staticmethod
+    def _freeze_array(array) -> bool:
+        # Los arrays de Arrow son inmutables
+        if isinstance(array, _ARROW_ARRAYS):
+            return True
+        if isinstance(array, pd.Categorical):
+            array = array.codes
+        # Se protegen la vista que entrega np.asarray y todos los arrays de
+        # los que deriva, hasta el dueño de los datos: las vistas que se
+        # creen después, como las de las demás columnas del mismo bloque,
+        # heredan la marca
+        values = np.asarray(array)
+        while isinstance(values, np.ndarray):
+            values.flags.writeable = False
+            values = values.base
+        # Si np.asarray tuvo que convertir los datos (enteros con faltantes,
+        # arrays dispersos...) se protegió una copia y el array sigue expuesto
+        return not np.asarray(array).flags.writeable
+
+    def stats(self) -> Dict[str, int]:
+        """Contadores de aciertos y fallos, cantidad de entradas y bytes ocupados."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'entries': len(self._entries), 'bytes': self.bytes}
+
+    def clear(self) -> None:
+        """Elimina todas las entradas (los contadores se conservan)."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+CacheOption = Union[None, bool, str, os.PathLike, ResponseCache]
+
+def open_cache(cache: CacheOption) -> Optional[ResponseCache]:
+    """
+    Normaliza la opción `cache` de los clientes: None/False desactiva la
+    caché, True usa la ruta por defecto, una ruta abre (o crea) ese archivo y
+    una instancia de ResponseCache se usa tal cual.
+    """
+    if cache is None or cache is False:
+        return None
+    if isinstance(cache, ResponseCache):
+        return cache
+    return ResponseCache(None if cache is True else cache)
+
+FrameCacheOption = Union[None, int, FrameCache]
+
+def open_frame_cache(memory_cache: FrameCacheOption) -> Optional[FrameCache]:
+    """Normaliza la opción `memory_cache`: un entero es el presupuesto en bytes."""
+    if memory_cache is None or isinstance(memory_cache, FrameCache):
+        return memory_cache
+    return FrameCache(max_bytes=int(memory_cache))
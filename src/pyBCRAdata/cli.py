@@ -0,0 +1,294 @@
+"""
+Línea de comandos de pyBCRAdata.
+
+    pybcradata bulk debtors.debtors cuits.txt --output resultados/
+    pybcradata bulk checks.reported cheques.txt --param codigo_entidad=11 --output cheques/
+
+`bulk` consulta un endpoint por lotes para una lista de identificadores
+(uno por línea, o un CSV con una columna por parámetro). La lista se divide
+en particiones de `--batch-size` identificadores que se reparten entre
+`--processes` procesos, cada uno con `--workers` consultas simultáneas. Cada
+partición se escribe en `part-NNNNN.parquet` (o .csv) y los errores en
+`errors/part-NNNNN.csv`; las particiones terminadas se registran en
+`_checkpoint.jsonl`, de modo que una ejecución interrumpida continúa donde
+quedó al repetir el mismo comando. Una partición con errores transitorios
+(sin respuesta, 408, 429, 5xx o circuito abierto) no se registra como
+terminada: repetir el comando la vuelve a consultar. Los demás errores (por
+ejemplo 404, identificador sin datos) son definitivos.
+"""
+from typing import Optional, Dict, Any, List, Tuple, Sequence
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from .settings import APISettings, ERROR_MESSAGES
+from .retry import endpoint_family
+from .base_api import batch_frame
+from .sinks import open_sink, write_frames, _require_pyarrow
+
+CHECKPOINT = "_checkpoint.jsonl"
+RUN_INFO = "_run.json"
+
+def bulk_endpoints() -> Dict[str, str]:
+    """Endpoints con consultas por lotes (`api.metodo`) y su parámetro por consulta."""
+    return {
+        f"{api_name}.{method_name}": config.batch_param
+        for api_name, methods in APISettings.API_CONFIG.items()
+        for method_name, config in methods.items()
+        if config.batch_param
+    }
+
+def read_items(path: Path, batch_param: str) -> List[Any]:
+    """
+    Identificadores de `path`: un valor por línea (se ignoran las vacías y
+    las que empiezan con #) o, si el archivo es .csv, un diccionario de
+    parámetros por fila con los nombres del encabezado.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            rows = [dict(row) for row in csv.DictReader(f)]
+            if rows and batch_param not in rows[0]:
+                raise ValueError(ERROR_MESSAGES['bulk_column'].format(path=path, column=batch_param))
+            return rows
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+def _parse_params(values: Sequence[str]) -> Dict[str, str]:
+    params = {}
+    for value in values:
+        key, sep, param = value.partition("=")
+        if not sep or not key:
+            raise ValueError(ERROR_MESSAGES['bulk_param'].format(value=value))
+        params[key.strip()] = param.strip()
+    return params
+
+def transient_errors(errors) -> int:
+    """Cantidad de errores que pueden resolverse al reintentar: todos salvo los 4xx distintos de 408 y 429."""
+    status = errors["status_code"]
+    return int((~status.between(400, 499) | status.isin([408, 429])).sum())
+
+def _check_params(endpoint: str, item: Any, params: Dict[str, str]) -> None:
+    """
+    Valida los parámetros armando la URL de la primera consulta, sin
+    enviarla: un error de validación se repetiría en todas y no se resuelve
+    al reintentar.
+    """
+    from .client import BCRAclient
+    api_name, method_name = endpoint.split(".")
+    config = APISettings.API_CONFIG[api_name][method_name]
+    with BCRAclient() as client:
+        batch = getattr(getattr(client, api_name), f"{method_name}_many")
+        batch(**{config.batch_arg: [item]}, **params, debug=True)
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+# Cliente de cada proceso, creado en su primera partición y reutilizado
+_client = None
+
+def _process_client(client_kwargs: Dict[str, Any]):
+    global _client
+    if _client is None:
+        from .client import BCRAclient
+        _client = BCRAclient(**client_kwargs)
+    return _client
+
+def run_partition(task: Tuple[int, List[Any], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Consulta una partición y escribe sus archivos. Se ejecuta en los procesos
+    del pool; los archivos se escriben con un nombre temporal y se renombran
+    al terminar, de modo que nunca quedan particiones a medio escribir.
+    """
+    index, items, options = task
+    api_name, method_name = options["endpoint"].split(".")
+    client = _process_client(options["client"])
+    batch = getattr(getattr(client, api_name), f"{method_name}_many")
+    config = APISettings.API_CONFIG[api_name][method_name]
+    data, errors = batch(**{config.batch_arg: items}, **options["params"], max_workers=options["workers"])
+
+    output = Path(options["output"])
+    name = f"part-{index:05d}"
+    # Una partición que se reintenta reemplaza los archivos del intento anterior
+    part_path = output / f"{name}.{options['format']}"
+    if not data.empty:
+        tmp = output / f".{name}.{options['format']}"
+        write_frames(open_sink(tmp), [batch_frame(data)])
+        os.replace(tmp, part_path)
+    else:
+        part_path.unlink(missing_ok=True)
+    errors_path = output / "errors" / f"{name}.csv"
+    if not errors.empty:
+        tmp = output / "errors" / f".{name}.csv"
+        errors.to_csv(tmp, index=False)
+        os.replace(tmp, errors_path)
+    else:
+        errors_path.unlink(missing_ok=True)
+    return {"partition": index, "rows": len(data), "errors": len(errors), "transient": transient_errors(errors)}
+
+def _completed(output: Path) -> Dict[int, Dict[str, Any]]:
+    path = output / CHECKPOINT
+    if not path.exists():
+        return {}
+    done = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            # Una línea incompleta (proceso interrumpido al escribirla) se ignora
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            done[entry["partition"]] = entry
+    return done
+
+def bulk(args: argparse.Namespace) -> int:
+    """
+    Consulta un endpoint por lotes para una lista de identificadores,
+    repartida en particiones entre varios procesos. Repetir el mismo comando
+    continúa una ejecución interrumpida y reintenta las particiones con
+    errores transitorios.
+    """
+    endpoints = bulk_endpoints()
+    if args.endpoint not in endpoints:
+        raise ValueError(ERROR_MESSAGES['bulk_endpoint'].format(
+            endpoint=args.endpoint, endpoints=", ".join(sorted(endpoints))
+        ))
+    for name in ("processes", "workers", "batch_size"):
+        if getattr(args, name) < 1:
+            raise ValueError(ERROR_MESSAGES['bulk_positive'].format(option=name.replace("_", "-")))
+
+    if args.format == "parquet":
+        _require_pyarrow()
+
+    source = Path(args.input)
+    items = read_items(source, endpoints[args.endpoint])
+    params = _parse_params(args.param)
+    if items:
+        _check_params(args.endpoint, items[0], params)
+    output = Path(args.output)
+    (output / "errors").mkdir(parents=True, exist_ok=True)
+
+    # Las particiones dependen del archivo, el endpoint y el tamaño de lote:
+    # solo se retoma una ejecución con los mismos valores
+    run_info = {
+        "endpoint": args.endpoint, "input_sha256": _file_digest(source),
+        "batch_size": args.batch_size, "params": params, "format": args.format,
+    }
+    info_path = output / RUN_INFO
+    if args.restart:
+        (output / CHECKPOINT).unlink(missing_ok=True)
+        for path in [*output.glob("part-*"), *(output / "errors").glob("part-*")]:
+            path.unlink()
+    elif info_path.exists() and json.loads(info_path.read_text()) != run_info and _completed(output):
+        raise ValueError(ERROR_MESSAGES['bulk_mismatch'].format(output=output))
+    info_path.write_text(json.dumps(run_info, indent=2))
+
+    # Se reescribe solo con las entradas válidas, para no continuar una línea
+    # que quedó incompleta
+    done = _completed(output)
+    (output / CHECKPOINT).write_text("".join(json.dumps(entry) + "\n" for entry in done.values()), encoding="utf-8")
+    partitions = [
+        (index, items[start:start + args.batch_size])
+        for index, start in enumerate(range(0, len(items), args.batch_size))
+    ]
+    pending = [(index, chunk) for index, chunk in partitions if index not in done]
+    print(f"{len(items)} identificadores en {len(partitions)} particiones; "
+          f"{len(partitions) - len(pending)} ya completadas", file=sys.stderr)
+
+    client_kwargs: Dict[str, Any] = {"pool_maxsize": args.workers}
+    if args.base_url:
+        client_kwargs["base_url"] = args.base_url
+    if args.rate_limit:
+        # El límite es total: cada proceso recibe su parte
+        api_name, method_name = args.endpoint.split(".")
+        family = endpoint_family(APISettings.API_CONFIG[api_name][method_name].endpoint)
+        client_kwargs["rate_limits"] = {family: args.rate_limit / args.processes}
+    options = {
+        "endpoint": args.endpoint, "params": params, "workers": args.workers,
+        "format": args.format, "output": str(output), "client": client_kwargs,
+    }
+
+    rows = sum(entry["rows"] for entry in done.values())
+    errors = sum(entry["errors"] for entry in done.values())
+    retry: List[int] = []
+    tasks = [(index, chunk, options) for index, chunk in pending]
+    with open(output / CHECKPOINT, "a", encoding="utf-8") as checkpoint:
+        def record(result: Dict[str, Any]) -> None:
+            nonlocal rows, errors
+            rows += result["rows"]
+            errors += result["errors"]
+            if result["transient"]:
+                # Sin registrar: la próxima ejecución vuelve a consultarla
+                retry.append(result["partition"])
+            else:
+                checkpoint.write(json.dumps(result) + "\n")
+                checkpoint.flush()
+                done[result["partition"]] = result
+            print(f"partición {result['partition']:05d}: {result['rows']} filas, {result['errors']} errores "
+                  f"({result['transient']} transitorios) ({len(done)}/{len(partitions)})", file=sys.stderr)
+
+        try:
+            if args.processes == 1:
+                for task in tasks:
+                    record(run_partition(task))
+            else:
+                with ProcessPoolExecutor(max_workers=args.processes) as executor:
+                    for future in as_completed([executor.submit(run_partition, task) for task in tasks]):
+                        record(future.result())
+        except KeyboardInterrupt:
+            print(f"Interrumpido: {len(done)}/{len(partitions)} particiones completadas. "
+                  "Repita el comando para continuar.", file=sys.stderr)
+            return 130
+
+    print(f"Listo: {rows} filas y {errors} errores en {output}", file=sys.stderr)
+    if retry:
+        print(f"{len(retry)} particiones con errores transitorios quedaron pendientes. "
+              "Repita el comando para reintentarlas.", file=sys.stderr)
+        return 1
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pybcradata", description="Cliente de la API del BCRA")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bulk_parser = commands.add_parser(
+        "bulk", help="Consulta un endpoint para una lista de identificadores",
+        description=bulk.__doc__.strip()
+    )
+    bulk_parser.add_argument("endpoint", help=f"Endpoint: {', '.join(bulk_endpoints())}")
+    bulk_parser.add_argument("input", help="Archivo con un identificador por línea, o CSV con encabezado")
+    bulk_parser.add_argument("-o", "--output", required=True, help="Directorio de salida")
+    bulk_parser.add_argument("--param", action="append", default=[], metavar="CLAVE=VALOR",
+                             help="Parámetro común a todas las consultas (repetible)")
+    bulk_parser.add_argument("--format", choices=("parquet", "csv"), default="parquet",
+                             help="Formato de las particiones (parquet requiere pyarrow)")
+    bulk_parser.add_argument("--processes", type=int, default=os.cpu_count() or 1,
+                             help="Procesos en paralelo (por defecto, uno por CPU)")
+    bulk_parser.add_argument("--workers", type=int, default=APISettings.MAX_WORKERS,
+                             help="Consultas simultáneas por proceso")
+    bulk_parser.add_argument("--batch-size", type=int, default=1000,
+                             help="Identificadores por partición")
+    bulk_parser.add_argument("--rate-limit", type=float, help="Solicitudes por segundo entre todos los procesos")
+    bulk_parser.add_argument("--base-url", help="URL base de la API")
+    bulk_parser.add_argument("--restart", action="store_true",
+                             help="Ignora el progreso guardado y vuelve a empezar")
+    bulk_parser.set_defaults(func=bulk)
+    return parser
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except (ValueError, OSError, ImportError) as e:
+        parser.exit(2, f"pybcradata: error: {e}\n")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,19 @@
-from typing import Optional
+from typing import Optional, Mapping
 import warnings
 import requests
 from .settings import APISettings, ERROR_MESSAGES
 from .connector import APIConnector
+from .cache import CacheOption, FrameCacheOption, open_cache, open_frame_cache
+from .store import StoreOption, open_series_store
+from .retry import RetryOption, open_retry_policy
+from .metrics import Instrumentation
+from .decoding import DecoderOption, open_decoder
 from .base_api import create_api_class
 
-MonetaryAPI = create_api_class('MonetaryAPI', APISettings.API_CONFIG['monetary'])
-CurrencyAPI = create_api_class('CurrencyAPI', APISettings.API_CONFIG['currency'])
-ChecksAPI = create_api_class('ChecksAPI', APISettings.API_CONFIG['checks'])
-DebtorsAPI = create_api_class('DebtorsAPI', APISettings.API_CONFIG['debtors'])
+MonetaryAPI = create_api_class('MonetaryAPI', APISettings.API_CONFIG['monetary'], api_name='monetary')
+CurrencyAPI = create_api_class('CurrencyAPI', APISettings.API_CONFIG['currency'], api_name='currency')
+ChecksAPI = create_api_class('ChecksAPI', APISettings.API_CONFIG['checks'], api_name='checks')
+DebtorsAPI = create_api_class('DebtorsAPI', APISettings.API_CONFIG['debtors'], api_name='debtors')
 
 class BCRAclient:
     """
@@ -28,10 +33,19 @@ class BCRAclient:
         API para cheques
     debtors : DebtorsAPI
         API para deudores
+    connector : APIConnector
+        Conector HTTP compartido por las cuatro APIs
     """
 
     def __init__(self, base_url: str = APISettings.BASE_URL,
-                cert_path: Optional[str] = None, verify_ssl: bool = True):
+                cert_path: Optional[str] = None, verify_ssl: bool = True,
+                pool_connections: int = APISettings.POOL_CONNECTIONS,
+                pool_maxsize: int = APISettings.POOL_MAXSIZE,
+                pool_block: bool = False, keep_alive: bool = True,
+                cache: CacheOption = None, memory_cache: FrameCacheOption = None,
+                series_store: StoreOption = None, retry: RetryOption = True,
+                rate_limits: Optional[Mapping[str, float]] = None, coalesce: bool = True,
+                instrumentation: Optional[Instrumentation] = None, json_decoder: DecoderOption = None):
         """
         Inicializa el cliente con la configuración de conexión.
 
@@ -46,11 +60,59 @@ class BCRAclient:
         verify_ssl : bool, default=True
             Si se debe verificar el certificado SSL. Si es False, deshabilita
             las advertencias SSL (no recomendado para producción)
+        pool_connections : int, optional
+            Cantidad de hosts distintos cuyos pools de conexiones se mantienen
+        pool_maxsize : int, optional
+            Máximo de conexiones abiertas que se reutilizan por host
+        pool_block : bool, default=False
+            Si es True, al agotarse el pool se espera una conexión libre en
+            lugar de abrir conexiones adicionales descartables
+        keep_alive : bool, default=True
+            Si es False, cada conexión se cierra luego de su respuesta
+        cache : bool, str or ResponseCache, optional
+            Caché persistente de respuestas. True usa APISettings.CACHE_PATH,
+            una ruta usa ese archivo SQLite. Por defecto no se usa caché
+        memory_cache : int or FrameCache, optional
+            Memoización en memoria de los DataFrames ya procesados. Un entero
+            indica el presupuesto en bytes. Por defecto no se usa
+        series_store : bool, str or SeriesStore, optional
+            Almacén local de observaciones para las consultas de series con
+            `incremental=True`. True usa APISettings.STORE_PATH, una ruta usa
+            ese archivo SQLite. Por defecto no se usa
+        retry : bool, int or RetryPolicy, default=True
+            Reintentos con espera exponencial ante errores de conexión y
+            status transitorios (429, 502, 503, 504), respetando
+            `Retry-After`, y circuit breaker por familia de endpoints. Un
+            entero indica la cantidad de reintentos. Si los errores persisten
+            se lanza APIError. None o False lo desactiva
+        rate_limits : dict, optional
+            Solicitudes por segundo por familia de endpoints ('estadisticas',
+            'cheques', 'CentralDeDeudores'). La tasa se reduce ante cada 429
+            y se recupera con las respuestas exitosas. Por defecto no se limita
+        coalesce : bool, default=True
+            Si es True, las llamadas idénticas que se hacen mientras otra está
+            en curso (mismo método y URL) esperan su resultado en lugar de
+            repetir la consulta. Los contadores están en
+            `connector.single_flight.stats()`
+        instrumentation : Instrumentation, optional
+            Recibe la duración de cada etapa de las consultas (armado de la
+            URL, conexión, transferencia, decodificación JSON, normalización
+            y tipos de columna) y los bytes y filas por endpoint. Por ejemplo
+            `MetricsCollector()`. Por defecto no se mide
+        json_decoder : str or JSONDecoder, optional
+            Decodificador JSON de las respuestas: 'json' (biblioteca
+            estándar), 'orjson' o 'simdjson'. Por defecto usa orjson o
+            pysimdjson si están instalados. Las respuestas grandes se
+            decodifican a medida que se reciben
 
         Notes
         -----
         Si verify_ssl se establece en False, se mostrará una advertencia sobre
         los riesgos de seguridad asociados.
+
+        Las cuatro APIs comparten el mismo conector y, por lo tanto, el mismo
+        pool de conexiones. Use `close()` o el cliente como context manager
+        para liberarlas.
         """
 
         if not verify_ssl:
@@ -59,10 +121,33 @@ class BCRAclient:
 
         connector = APIConnector(
             base_url=base_url,
-            cert_path=cert_path or (APISettings.CERT_PATH if verify_ssl else False)
+            cert_path=cert_path or (APISettings.CERT_PATH if verify_ssl else False),
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            cache=open_cache(cache),
+            frame_cache=open_frame_cache(memory_cache),
+            series_store=open_series_store(series_store),
+            retry=open_retry_policy(retry),
+            rate_limits=rate_limits,
+            coalesce=coalesce,
+            instrumentation=instrumentation,
+            json_decoder=open_decoder(json_decoder)
         )
 
+        self.connector = connector
         self.monetary = MonetaryAPI(connector)
         self.currency = CurrencyAPI(connector)
         self.checks = ChecksAPI(connector)
         self.debtors = DebtorsAPI(connector)
+
+    def close(self) -> None:
+        """Cierra las conexiones del pool compartido por todas las APIs."""
+        self.connector.close()
+
+    def __enter__(self) -> 'BCRAclient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,153 @@
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+def ordered_map(func: Callable[[T], R], items: Iterable[T], max_workers: int) -> Iterator[R]:
+    """
+    Aplica `func` a cada elemento en un pool de hilos y entrega los resultados
+    en el orden de entrada.
+
+    Como máximo se mantienen `2 * max_workers` tareas en vuelo, de modo que la
+    memoria queda acotada aunque `items` sea muy largo. Si el consumidor deja
+    de iterar, las tareas pendientes se cancelan.
+    """
+    items = iter(items)
+    if max_workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(executor.submit(func, item) for item in islice(items, 2 * max_workers))
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for item in islice(items, 1):
+                    pending.append(executor.submit(func, item))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Agrupa `items` en listas de hasta `size` elementos, sin materializar el resto."""
+    items = iter(items)
+    while chunk := list(islice(items, size)):
+        yield chunk
+
+async def ordered_map_async(func: Callable[[T], Awaitable[R]], items: Iterable[T],
+                            max_workers: int) -> AsyncIterator[R]:
+    """
+    Versión para asyncio de `ordered_map`: ejecuta la corutina `func` sobre
+    cada elemento con hasta `max_workers` en curso y entrega los resultados
+    en el orden de entrada.
+    """
+    items = iter(items)
+    max_workers = max(1, max_workers)
+    pending = deque(asyncio.ensure_future(func(item)) for item in islice(items, max_workers))
+    try:
+        while pending:
+            result = await pending.popleft()
+            for item in islice(items, 1):
+                pending.append(asyncio.ensure_future(func(item)))
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+
+class SingleFlight:
+    """
+    Agrupa las llamadas concurrentes con la misma clave: la primera ejecuta
+    la función y las que llegan mientras está en curso esperan y reciben su
+    resultado (o su excepción) en lugar de repetir el trabajo.
+
+    Funciona entre hilos (`do`) y entre corutinas de un mismo event loop
+    (`do_async`).
+
+    Parameters
+    ----------
+    share : callable, optional
+        Se aplica al resultado antes de entregarlo a cada llamada agrupada,
+        por ejemplo para darle una copia propia
+    """
+
+    def __init__(self, share: Optional[Callable[[Any], Any]] = None):
+        self.share = share
+        self.calls = 0
+        self.coalesced = 0
+        self._flights: Dict[Hashable, Future] = {}
+        self._async_flights: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], R]) -> R:
+        """Ejecuta `func`, o espera la ejecución en curso con la misma `key`."""
+        with self._lock:
+            self.calls += 1
+            future = self._flights.get(key)
+            if future is None:
+                future = self._flights[key] = Future()
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+        if not leader:
+            return self._share(future.result())
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable[R]]) -> R:
+        """Equivalente asíncrono de `do` para la corutina que devuelve `func`."""
+        loop = asyncio.get_running_loop()
+        flight = (id(loop), key)
+        with self._lock:
+            self.calls += 1
+            future = self._async_flights.get(flight)
+            if future is None:
+                future = self._async_flights[flight] = loop.create_future()
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+        if not leader:
+            return self._share(await asyncio.shield(future))
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # evita el aviso de excepción no recuperada si nadie esperaba
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._async_flights[flight]
+
+    def _share(self, result: Any) -> Any:
+        return self.share(result) if self.share is not None else result
+
+    def stats(self) -> Dict[str, int]:
+        """Llamadas recibidas, llamadas agrupadas con otra en curso y claves en curso."""
+        with self._lock:
+            return {'calls': self.calls, 'coalesced': self.coalesced,
+                    'in_flight': len(self._flights) + len(self._async_flights)}
@@ -1,17 +1,53 @@
-from typing import Dict, Any, Union, Set, List
+from typing import Dict, Any, Union, Set, List, Optional, Callable, Iterable, Iterator, Tuple, Mapping
+import json
 import logging
+import re
+import ssl
+import time
+from functools import lru_cache
 import requests
 import pandas as pd
-from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode, urlsplit
+from urllib3.util.ssl_ import create_urllib3_context
 
-from .settings import COLUMN_TYPES
+from .settings import APISettings, ColumnSchema, ERROR_MESSAGES
+from .concurrency import ordered_map, SingleFlight
+from .cache import ResponseCache, FrameCache
+from .store import SeriesStore
+from .normalize import normalize_json
+from .retry import APIError, RetryPolicy, RequestGuard, endpoint_family
+from .metrics import Instrumentation, span
+from .decoding import JSONDecoder, open_decoder, decode_chunks
 
-SPECIAL_EXPLODE_ENDPOINTS = {
-    "currency.rates",
-    "debtors.debtors",
-    "debtors.history",
-    "checks.reported"
-}
+def endpoint_schema(endpoint_key: str) -> ColumnSchema:
+    """Esquema de columnas del endpoint `api.metodo`, o uno vacío si no se conoce."""
+    api_name, _, method_name = endpoint_key.partition('.')
+    config = APISettings.API_CONFIG.get(api_name, {}).get(method_name)
+    return config.schema if config is not None else ColumnSchema()
+
+@lru_cache(maxsize=1)
+def _endpoint_patterns() -> List[Tuple[str, 're.Pattern[str]']]:
+    patterns = []
+    for api_name, methods in APISettings.API_CONFIG.items():
+        for method_name, config in methods.items():
+            regex = re.sub(r"\\\{\w+\\\}", "[^/]+", re.escape(config.endpoint.strip('/')))
+            patterns.append((f"{api_name}.{method_name}", re.compile(regex)))
+    return patterns
+
+@lru_cache(maxsize=1024)
+def endpoint_for_path(path: str) -> str:
+    """Endpoint (`api.metodo`) cuya ruta coincide con `path`, o "" si ninguno."""
+    path = path.strip('/')
+    for endpoint_key, pattern in _endpoint_patterns():
+        if pattern.fullmatch(path):
+            return endpoint_key
+    return ""
+
+def decode_incrementally(headers: Mapping[str, str]) -> bool:
+    """Si la respuesta se decodifica por bloques: sin Content-Length o desde INCREMENTAL_DECODE_BYTES."""
+    length = headers.get('Content-Length')
+    return length is None or not length.isdigit() or int(length) >= APISettings.INCREMENTAL_DECODE_BYTES
 
 def build_url(
         base_url: str,
@@ -37,23 +73,353 @@ def build_url(
 
     return f"{url}?{urlencode(query_dict)}" if query_dict else url
 
+def _own_copy(result: Any) -> Any:
+    return result.copy() if isinstance(result, pd.DataFrame) else result
+
+@lru_cache(maxsize=8)
+def build_ssl_context(cert_path: Union[str, bool, None]) -> Optional[ssl.SSLContext]:
+    """
+    Crea un contexto SSL con el certificado cargado una única vez. El
+    contexto se comparte entre todos los clientes que usan el mismo archivo.
+    """
+    if not isinstance(cert_path, str):
+        return None
+    context = create_urllib3_context()
+    context.load_verify_locations(cafile=cert_path)
+    return context
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    Adaptador HTTP con pool de conexiones por host que reutiliza un único
+    contexto SSL para todas las conexiones que abre.
+    """
+
+    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._ssl_context is not None:
+            kwargs['ssl_context'] = self._ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        if self._ssl_context is not None:
+            proxy_kwargs['ssl_context'] = self._ssl_context
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        # El certificado ya está cargado en el contexto: evitamos que urllib3
+        # lo vuelva a leer del disco en cada conexión nueva.
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        if self._ssl_context is not None:
+            pool_kwargs.pop('ca_certs', None)
+            pool_kwargs.pop('ca_cert_dir', None)
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if self._ssl_context is not None:
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
 class APIConnector:
-    def __init__(self, base_url: str, cert_path: Union[str, bool, None]):
+    def __init__(self, base_url: str, cert_path: Union[str, bool, None],
+                pool_connections: int = APISettings.POOL_CONNECTIONS,
+                pool_maxsize: int = APISettings.POOL_MAXSIZE,
+                pool_block: bool = False, keep_alive: bool = True,
+                cache: Optional[ResponseCache] = None,
+                frame_cache: Optional[FrameCache] = None,
+                series_store: Optional[SeriesStore] = None,
+                retry: Optional[RetryPolicy] = None,
+                rate_limits: Optional[Mapping[str, float]] = None,
+                coalesce: bool = True,
+                instrumentation: Optional[Instrumentation] = None,
+                json_decoder: Optional[JSONDecoder] = None):
         self.base_url = base_url.rstrip('/')
         self.cert_path = cert_path
+        self.cache = cache
+        self.frame_cache = frame_cache
+        self.series_store = series_store
+        self.guard = RequestGuard(retry, rate_limits)
+        # Las llamadas agrupadas reciben su propia copia del DataFrame
+        self.single_flight = SingleFlight(share=_own_copy) if coalesce else None
+        self.instrumentation = instrumentation
+        self.decoder = json_decoder if json_decoder is not None else open_decoder()
+        self._base_path = urlsplit(self.base_url).path
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.session = self._build_session(pool_connections, pool_maxsize, pool_block, keep_alive)
+
+    def _build_session(self, pool_connections: int, pool_maxsize: int,
+                      pool_block: bool, keep_alive: bool) -> requests.Session:
+        session = requests.Session()
+        session.verify = self.cert_path
+        adapter = PooledHTTPAdapter(
+            ssl_context=build_ssl_context(self.cert_path),
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def close(self) -> None:
+        """Cierra las conexiones abiertas del pool."""
+        self.session.close()
+
+    def __enter__(self) -> 'APIConnector':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def span(self, stage: str, endpoint_key: str):
+        """Mide el bloque como la etapa `stage` de `endpoint_key` si hay instrumentación."""
+        return span(self.instrumentation, stage, endpoint_key)
+
+    def _endpoint_key(self, url: str) -> str:
+        if self.instrumentation is None:
+            return ""
+        return endpoint_for_path(urlsplit(url).path[len(self._base_path):])
+
+    def connect_to_api(self, url: str, cache_ttl: Optional[float] = 0) -> tuple[int, Dict[str, Any]]:
+        """
+        Consulta `url` y devuelve `(status_code, data)`.
+
+        Si hay una caché configurada y `cache_ttl` es distinto de 0, las
+        respuestas exitosas se leen y se guardan en ella con esa vigencia en
+        segundos (None: no vence).
+
+        Con una política de reintentos, los errores de conexión y los status
+        transitorios se reintentan y, si persisten, se lanza APIError.
+        """
+        use_cache = self.cache is not None and cache_ttl != 0
+        if use_cache:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return 200, self.decoder.loads(cached)
+
+        family = endpoint_family(url)
+        attempt = 0
+        while True:
+            self.guard.check(family)
+            limiter = self.guard.limiter(family)
+            if limiter is not None:
+                limiter.acquire()
+            status_code, data, headers, body = self._send(url, keep_body=use_cache)
+            wait = self.guard.outcome(family, status_code, headers, attempt)
+            if wait is None:
+                break
+            attempt += 1
+            self._log_retry(url, status_code, attempt, wait)
+            time.sleep(wait)
+
+        if self.guard.retryable(status_code):
+            raise self._retries_exhausted(status_code, data, attempt + 1)
+        if use_cache and status_code == 200:
+            self.cache.set(url, body, cache_ttl)
+        return status_code, data
+
+    def _send(self, url: str, keep_body: bool = False) -> Tuple[int, Dict[str, Any], Mapping[str, str], bytes]:
+        """
+        Un intento de consulta: `(status_code, data, headers, body)`; status 0
+        si no hubo respuesta válida. Las respuestas grandes se decodifican a
+        medida que llegan y no se devuelve su cuerpo, salvo con `keep_body`.
+        """
+        endpoint_key = self._endpoint_key(url)
+        try:
+            with self.span("connect", endpoint_key):
+                # verify se pasa en cada consulta: el de la sesión lo pisan
+                # REQUESTS_CA_BUNDLE / CURL_CA_BUNDLE si están definidas
+                response = self.session.get(url, stream=True, verify=self.cert_path)
+        except Exception as e:
+            self._handle_request_error(e)
+            return 0, {}, {}, b""
+        # La respuesta se abre con stream=True: se cierra siempre, también
+        # ante un error, para devolver la conexión al pool
+        try:
+            if not keep_body and decode_incrementally(response.headers):
+                return self._send_incremental(response, endpoint_key)
+            with self.span("transfer", endpoint_key):
+                body = response.content
+        except Exception as e:
+            self._handle_request_error(e)
+            return 0, {}, {}, b""
+        finally:
+            response.close()
+        if self.instrumentation is not None:
+            self.instrumentation.record(endpoint_key, nbytes=len(body))
+        try:
+            with self.span("json_decode", endpoint_key):
+                data = self.decoder.loads(body)
+        except ValueError as e:
+            self._handle_request_error(e)
+            return (0 if response.status_code == 200 else response.status_code), {}, response.headers, b""
+        return response.status_code, data, response.headers, body
+
+    def _send_incremental(self, response: requests.Response,
+                         endpoint_key: str) -> Tuple[int, Dict[str, Any], Mapping[str, str], bytes]:
+        """Recibe y decodifica el cuerpo por bloques (ver `ResultsParser`)."""
+        received = 0
+
+        def chunks() -> Iterator[bytes]:
+            nonlocal received
+            for chunk in response.iter_content(APISettings.DECODE_CHUNK_SIZE):
+                received += len(chunk)
+                yield chunk
 
-    def connect_to_api(self, url: str) -> tuple[int, Dict[str, Any]]:
         try:
-            response = requests.get(url, verify=self.cert_path)
-            return response.status_code, response.json()
+            with self.span("transfer", endpoint_key):
+                data = decode_chunks(chunks(), self.decoder)
+        except ValueError as e:
+            self._handle_request_error(e)
+            return (0 if response.status_code == 200 else response.status_code), {}, response.headers, b""
         except Exception as e:
             self._handle_request_error(e)
-            return 0, {}
+            return 0, {}, {}, b""
+        finally:
+            if self.instrumentation is not None:
+                self.instrumentation.record(endpoint_key, nbytes=received)
+        return response.status_code, data, response.headers, b""
+
+    def _log_retry(self, url: str, status_code: int, attempt: int, wait: float) -> None:
+        self.logger.warning(ERROR_MESSAGES['retrying'].format(
+            attempt=attempt, url=url, wait=wait, status=status_code
+        ))
+
+    @staticmethod
+    def _retries_exhausted(status_code: int, data: Dict[str, Any], attempts: int) -> APIError:
+        messages = data.get('errorMessages') if isinstance(data, dict) else None
+        error = "; ".join(map(str, messages)) if messages else "sin respuesta del servidor"
+        return APIError(
+            ERROR_MESSAGES['retries_exhausted'].format(status=status_code, attempts=attempts, error=error),
+            status_code, data
+        )
+
+    def fetch_data(self, url: str, endpoint_key: str = "", cache_ttl: Optional[float] = 0) -> pd.DataFrame:
+        def fetch() -> pd.DataFrame:
+            status_code, data = self.connect_to_api(url, cache_ttl)
+            return self.process_response(status_code, data, endpoint_key)
+
+        return self.memoize_frame((endpoint_key, url), cache_ttl, fetch)
+
+    def memoize_frame(self, key: Tuple[str, str], cache_ttl: Optional[float],
+                     build: Callable[[], Any]) -> Any:
+        """
+        Devuelve el DataFrame memoizado bajo `key` o lo construye con `build`.
+        Solo se memoizan DataFrames; las respuestas de error no se guardan.
+        Las llamadas concurrentes con la misma `key` comparten una única
+        construcción (ver `single_flight`).
+        """
+        use_cache = self.frame_cache is not None and cache_ttl != 0
+        if use_cache:
+            cached = self.frame_cache.get(key)
+            if cached is not None:
+                return cached
+
+        def load() -> Any:
+            return self._store_frame(key, cache_ttl, build(), use_cache)
+
+        if self.single_flight is None:
+            return load()
+        return self.single_flight.do(key, load)
+
+    def _store_frame(self, key: Tuple[str, str], cache_ttl: Optional[float], result: Any, use_cache: bool) -> Any:
+        if use_cache and isinstance(result, pd.DataFrame):
+            return self.frame_cache.put(key, result, cache_ttl)
+        return result
 
-    def fetch_data(self, url: str, endpoint_key: str = "") -> pd.DataFrame:
-        status_code, data = self.connect_to_api(url)
+    def iter_pages(self, page_url: Callable[[int, int], str], page_size: int,
+                  offset: int = 0, max_workers: int = APISettings.MAX_WORKERS,
+                  cache_ttl: Optional[float] = 0) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Recorre un endpoint paginado con limit/offset y entrega cada página
+        como `(status_code, data)` en orden.
+
+        Si la primera página informa el total de registros
+        (`metadata.resultset.count`), las páginas restantes se piden en
+        paralelo; si no, se avanza de a una hasta recibir una página incompleta.
+        La iteración termina en la primera respuesta con status distinto de 200.
+        """
+        status_code, data = self.connect_to_api(page_url(offset, page_size), cache_ttl)
+        yield status_code, data
+        if status_code != 200:
+            return
+
+        total = self._result_count(data)
+        if total is not None:
+            offsets = range(offset + page_size, total, page_size)
+            pages = ordered_map(
+                lambda o: self.connect_to_api(page_url(o, page_size), cache_ttl), offsets, max_workers
+            )
+            for status_code, data in pages:
+                yield status_code, data
+                if status_code != 200:
+                    return
+            return
+
+        while len(self._page_results(data)) >= page_size:
+            offset += page_size
+            status_code, data = self.connect_to_api(page_url(offset, page_size), cache_ttl)
+            yield status_code, data
+            if status_code != 200:
+                return
+
+    def fetch_pages(self, page_url: Callable[[int, int], str], page_size: int,
+                   offset: int = 0, max_workers: int = APISettings.MAX_WORKERS,
+                   cache_ttl: Optional[float] = 0) -> Tuple[int, Dict[str, Any]]:
+        """
+        Descarga todas las páginas y las une en una única respuesta cuyo
+        `results` contiene los registros de todas ellas. Ante un error devuelve
+        la respuesta de la página que falló.
+        """
+        return self.merge_responses(self.iter_pages(page_url, page_size, offset, max_workers, cache_ttl))
+
+    def merge_responses(self, responses: Iterable[Tuple[int, Dict[str, Any]]],
+                       deduplicate: bool = False) -> Tuple[int, Dict[str, Any]]:
+        """
+        Une varias respuestas en una sola concatenando sus `results` en orden.
+        Con `deduplicate=True` descarta los registros repetidos. Ante la primera
+        respuesta con error devuelve esa respuesta.
+        """
+        merged: Optional[Dict[str, Any]] = None
+        results: List[Any] = []
+        seen: Set[str] = set()
+        for status_code, data in responses:
+            if status_code != 200:
+                return status_code, data
+            if merged is None:
+                merged = {k: v for k, v in data.items() if k != 'results'}
+            for record in self._page_results(data):
+                if deduplicate:
+                    key = json.dumps(record, sort_keys=True, default=str)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                results.append(record)
+        merged = merged or {}
+        merged['results'] = results
+        return 200, merged
+
+    @staticmethod
+    def _page_results(data: Dict[str, Any]) -> List[Any]:
+        results = data.get('results') if isinstance(data, dict) else None
+        if results is None:
+            return []
+        return results if isinstance(results, list) else [results]
+
+    @staticmethod
+    def _result_count(data: Dict[str, Any]) -> Optional[int]:
+        try:
+            return int(data['metadata']['resultset']['count'])
+        except (KeyError, TypeError, ValueError):
+            return None
 
+    def process_response(self, status_code: int, data: Dict[str, Any],
+                        endpoint_key: str = "") -> pd.DataFrame:
         if status_code != 200:
             return data
 
@@ -61,8 +427,15 @@ class APIConnector:
             return pd.DataFrame()
 
         try:
-            df = self._transform_to_dataframe(data, endpoint_key)
-            return self._assign_column_types(df) if not df.empty else df
+            with self.span("normalize", endpoint_key):
+                df = self._transform_to_dataframe(data, endpoint_key)
+            if df.empty:
+                return df
+            with self.span("type_cast", endpoint_key):
+                df = self._assign_column_types(df, endpoint_key)
+            if self.instrumentation is not None:
+                self.instrumentation.record(endpoint_key, rows=len(df))
+            return df
         except Exception as e:
             self.logger.error(f"Error procesando datos: {e}")
             return pd.DataFrame()
@@ -72,27 +445,13 @@ class APIConnector:
                     "HTTP" if isinstance(error, requests.exceptions.HTTPError) else "inesperado"
         self.logger.error(f"Error {error_type}: {error}")
 
-    def _assign_column_types(self, df: pd.DataFrame) -> pd.DataFrame:
-        for col, dtype in COLUMN_TYPES.items():
-            if col in df.columns:
+    def _assign_column_types(self, df: pd.DataFrame, endpoint_key: str = "") -> pd.DataFrame:
+        # Las columnas ya construidas con su tipo final no se vuelven a copiar
+        for col, dtype in endpoint_schema(endpoint_key).column_types().items():
+            if col in df.columns and df[col].dtype != dtype:
                 df[col] = df[col].astype(dtype)
         return df
 
-    def _flatten_dict(self, d: dict, parent_key: str = '', sep: str = '_') -> dict:
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
-            elif isinstance(v, list):
-                if all(isinstance(i, dict) for i in v):
-                    items.append((new_key, v))
-                else:
-                    items.append((new_key, ";".join(map(str, v))))
-            else:
-                items.append((new_key, v))
-        return dict(items)
-
     def _transform_to_dataframe(self, data: Any, endpoint_key: str = "") -> pd.DataFrame:
         if isinstance(data, dict) and 'results' in data:
             data = data['results']
@@ -101,40 +460,5 @@ class APIConnector:
         return self._json_to_df(data, endpoint_key)
 
     def _json_to_df(self, json_data: Union[Dict, List], endpoint_key: str = "") -> pd.DataFrame:
-        should_explode = endpoint_key in SPECIAL_EXPLODE_ENDPOINTS
-
-        if isinstance(json_data, dict):
-            json_data = [json_data]
-        elif not isinstance(json_data, list):
-            return pd.DataFrame()
-
-        flattened = [self._flatten_dict(item) for item in json_data]
-
-        if not flattened:
-            return pd.DataFrame()
-
-        df = pd.DataFrame(flattened)
-
-        if not should_explode:
-            # Expandir listas de un solo dict en columnas
-            for col in df.columns:
-                if df[col].apply(lambda x: isinstance(x, list) and len(x) == 1 and isinstance(x[0], dict)).all():
-                    expanded = pd.json_normalize(df[col].apply(lambda x: x[0]))
-                    expanded.columns = [f"{col}_{subcol}" for subcol in expanded.columns]
-                    df = pd.concat([df.drop(columns=[col]), expanded], axis=1)
-            return df
-
-        while True:
-            list_columns = [col for col in df.columns if df[col].apply(lambda x: isinstance(x, list)).any()]
-            if not list_columns:
-                break
-
-            col_to_explode = list_columns[0]
-            df = df.explode(col_to_explode).reset_index(drop=True)
-
-            if df[col_to_explode].apply(lambda x: isinstance(x, dict)).all():
-                expanded_cols = pd.json_normalize(df[col_to_explode])
-                expanded_cols.columns = [f"{col_to_explode}_{subcol}" for subcol in expanded_cols.columns]
-                df = pd.concat([df.drop(columns=[col_to_explode]), expanded_cols], axis=1)
-
-        return df
+        schema = endpoint_schema(endpoint_key)
+        return normalize_json(json_data, explode=schema.explode, dtypes=schema.column_types())
@@ -0,0 +1,37 @@
+from typing import List, Tuple, Union
+from datetime import date, datetime, timedelta
+
+from .settings import DATE_FORMAT, ERROR_MESSAGES
+
+DateLike = Union[str, date, datetime]
+
+def parse_date(value: DateLike, field: str = "fecha") -> date:
+    """Convierte un string YYYY-MM-DD (o un date/datetime) en `date`."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and len(value) == 10:
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(str(value), DATE_FORMAT).date()
+    except ValueError:
+        raise ValueError(ERROR_MESSAGES['invalid_date'].format(field=field, value=value)) from None
+
+def format_date(value: date) -> str:
+    return value.strftime(DATE_FORMAT)
+
+def split_date_range(start: date, end: date, parts: int) -> List[Tuple[date, date]]:
+    """
+    Divide el rango cerrado [start, end] en hasta `parts` ventanas contiguas,
+    disjuntas y de tamaño similar, en orden cronológico.
+    """
+    total_days = (end - start).days + 1
+    if total_days <= 0:
+        return []
+    parts = max(1, min(parts, total_days))
+    bounds = [start + timedelta(days=i * total_days // parts) for i in range(parts + 1)]
+    return [(bounds[i], bounds[i + 1] - timedelta(days=1)) for i in range(parts)]
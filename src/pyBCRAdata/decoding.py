@@ -0,0 +1,295 @@
+from typing import Optional, Union, Dict, Any, List, Iterable, AsyncIterable
+import codecs
+import json
+import re
+
+from .settings import ERROR_MESSAGES
+
+class JSONDecoder:
+    """
+    Decodificador de los cuerpos de las respuestas.
+
+    Decodifica directamente desde los bytes recibidos, sin la copia como
+    texto ni la detección de codificación de `requests.Response.json()`.
+    Esta implementación usa el módulo `json` de la biblioteca estándar; las
+    subclases reemplazan `loads` por una biblioteca más rápida.
+    """
+
+    name = "json"
+
+    def loads(self, body: bytes) -> Any:
+        return json.loads(body)
+
+class OrjsonDecoder(JSONDecoder):
+    """Decodificador basado en orjson (`pip install orjson`)."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._loads = orjson.loads
+
+    def loads(self, body: bytes) -> Any:
+        return self._loads(body)
+
+class SimdjsonDecoder(JSONDecoder):
+    """Decodificador basado en pysimdjson (`pip install pysimdjson`)."""
+
+    name = "simdjson"
+
+    def __init__(self):
+        import simdjson
+        self._loads = simdjson.loads
+
+    def loads(self, body: bytes) -> Any:
+        return self._loads(body)
+
+_DECODERS = {"json": JSONDecoder, "orjson": OrjsonDecoder, "simdjson": SimdjsonDecoder}
+_PACKAGES = {"orjson": "orjson", "simdjson": "pysimdjson"}
+
+DecoderOption = Union[None, str, JSONDecoder]
+
+def open_decoder(decoder: DecoderOption = None) -> JSONDecoder:
+    """
+    Normaliza la opción `json_decoder` de los clientes: None usa orjson o
+    pysimdjson si están instalados y si no la biblioteca estándar, un nombre
+    ('json', 'orjson' o 'simdjson') elige esa implementación y un
+    JSONDecoder se usa tal cual.
+    """
+    if isinstance(decoder, JSONDecoder):
+        return decoder
+    if decoder is None:
+        for name in ("orjson", "simdjson"):
+            try:
+                return _DECODERS[name]()
+            except ImportError:
+                pass
+        return JSONDecoder()
+    if decoder not in _DECODERS:
+        raise ValueError(ERROR_MESSAGES['json_decoder'].format(decoder=decoder))
+    try:
+        return _DECODERS[decoder]()
+    except ImportError:
+        package = _PACKAGES[decoder]
+        raise ImportError(f"El decodificador '{decoder}' requiere {package}: pip install {package}") from None
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_scan = json.JSONDecoder().raw_decode
+
+# Estados de ResultsParser
+(_START, _FIRST_KEY, _KEY, _COLON, _VALUE, _AFTER_VALUE,
+ _FIRST_ITEM, _ITEM, _AFTER_ITEM, _END, _RAW) = range(11)
+_MORE = object()
+# Valores incompletos de más de este tamaño no se reintentan hasta el final
+_DEFER_SIZE = 64 * 1024
+
+class ResultsParser:
+    """
+    Decodifica de manera incremental un objeto JSON que llega por partes.
+
+    Si el campo `results` es un arreglo, sus elementos se decodifican uno a
+    uno a medida que llegan los bytes: `feed` devuelve los registros que se
+    completaron con cada parte, sin esperar al resto del cuerpo ni guardarlo
+    entero, y `close` los que quedan. Los demás campos se decodifican
+    completos y quedan en `data`. Si el cuerpo no es un objeto se decodifica
+    entero al cerrar.
+
+    Los registros completos de cada parte se decodifican juntos con
+    `decoder`, en una sola llamada.
+
+    Parameters
+    ----------
+    decoder : JSONDecoder, optional
+        Decodificador de los registros. Por defecto la biblioteca estándar
+
+    Attributes
+    ----------
+    data : Any
+        Luego de `close`, el objeto sin `results` si este se entregó por
+        partes (ver `streamed`), o el valor completo del cuerpo
+    streamed : bool
+        Si los registros de `results` se entregaron por `feed` y `close`
+    """
+
+    def __init__(self, decoder: Optional[JSONDecoder] = None):
+        self.data: Any = None
+        self.streamed = False
+        self._text = codecs.getincrementaldecoder('utf-8-sig')()
+        self._buf = ""
+        self._parts: List[str] = []
+        self._pending = 0
+        # Tamaño a partir del cual se vuelve a intentar: un valor incompleto
+        # se reintenta recién cuando llegó otro tanto, de modo que los valores
+        # grandes no se recorren una vez por cada parte
+        self._retry_at = 0
+        self._state = _START
+        self._key: Optional[str] = None
+        self._fields: Dict[str, Any] = {}
+        self._decoder = decoder or JSONDecoder()
+        self._records: List[Any] = []
+        self._deferred = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Agrega una parte del cuerpo y devuelve los registros completados."""
+        text = self._text.decode(chunk)
+        if text:
+            self._parts.append(text)
+            self._pending += len(text)
+        if self._state == _RAW or self._deferred or len(self._buf) + self._pending < self._retry_at:
+            return []
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """Procesa el resto del cuerpo, completa `data` y devuelve los últimos registros."""
+        text = self._text.decode(b"", final=True)
+        if text:
+            self._parts.append(text)
+        records = self._parse(final=True)
+        if self._state == _RAW:
+            self.data = self._decoder.loads(self._buf)
+        elif self._state == _END:
+            self.data = self._fields
+        else:
+            raise ValueError(ERROR_MESSAGES['json_incomplete'])
+        return records
+
+    def _parse(self, final: bool) -> List[Any]:
+        buf = self._buf + "".join(self._parts)
+        self._parts.clear()
+        self._pending = 0
+        if self._state == _RAW:
+            self._buf = buf
+            return []
+
+        pos, end = 0, len(buf)
+        records = self._records = []
+        batch = True
+        while True:
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos == end:
+                break
+            state, char = self._state, buf[pos]
+            if state == _START:
+                if char != '{':
+                    self._state = _RAW
+                    break
+                pos += 1
+                self._state = _FIRST_KEY
+            elif state == _FIRST_KEY and char == '}':
+                pos += 1
+                self._state = _END
+            elif state in (_FIRST_KEY, _KEY) and char == '"':
+                value = self._value(buf, pos, final)
+                if value is _MORE:
+                    break
+                self._key, pos = value
+                self._state = _COLON
+            elif state == _COLON and char == ':':
+                pos += 1
+                self._state = _VALUE
+            elif state == _VALUE:
+                if self._key == 'results' and char == '[':
+                    pos += 1
+                    self.streamed = True
+                    self._state = _FIRST_ITEM
+                    continue
+                if final:
+                    # El resto del objeto completa `{"clave": ...`: se
+                    # decodifica en una sola llamada
+                    self._fields.update(self._decoder.loads('{' + json.dumps(self._key) + ':' + buf[pos:]))
+                    pos = end
+                    self._state = _END
+                    break
+                value = self._value(buf, pos, final)
+                if value is _MORE:
+                    # Un valor grande se decodifica recién al cerrar
+                    self._deferred = end - pos > _DEFER_SIZE
+                    break
+                self._fields[self._key], pos = value
+                self._state = _AFTER_VALUE
+            elif state == _AFTER_VALUE and char in ',}':
+                pos += 1
+                self._state = _KEY if char == ',' else _END
+            elif state == _FIRST_ITEM and char == ']':
+                pos += 1
+                self._state = _AFTER_VALUE
+            elif state in (_FIRST_ITEM, _ITEM):
+                # Si el corte falla (registros con objetos anidados), el resto
+                # de esta parte se decodifica registro por registro
+                cut = self._batch(buf, pos) if batch else None
+                if cut is None:
+                    batch = False
+                    value = self._value(buf, pos, final)
+                    if value is _MORE:
+                        break
+                    record, cut = value
+                    self._records.append(record)
+                pos = cut
+                self._state = _AFTER_ITEM
+            elif state == _AFTER_ITEM and char in ',]':
+                pos += 1
+                self._state = _ITEM if char == ',' else _AFTER_VALUE
+            else:
+                raise ValueError(ERROR_MESSAGES['json_incomplete'])
+
+        self._buf = buf if self._state == _RAW else buf[pos:]
+        self._retry_at = 2 * len(self._buf) if self._state != _RAW and pos < end else 0
+        return records
+
+    def _value(self, buf: str, pos: int, final: bool):
+        """`(valor, fin)` del valor que empieza en `pos`, o _MORE si aún no está completo."""
+        try:
+            value, end = _scan(buf, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _MORE
+        # Un número al final del buffer, o cortado antes de su parte decimal
+        # o exponente, puede continuar en la parte siguiente
+        if not final and (end == len(buf) or buf[end] in '.eE'):
+            return _MORE
+        return value, end
+
+    def _batch(self, buf: str, pos: int) -> Optional[int]:
+        """
+        Decodifica de una vez los registros completos desde `pos`: corta el
+        buffer en un cierre de objeto seguido de coma y lo decodifica como
+        arreglo. Un corte dentro de una cadena o de un objeto anidado deja un
+        arreglo inválido, así que el primer corte que decodifica es un límite
+        entre registros. Devuelve la posición del corte o None.
+        """
+        cut = len(buf)
+        for _ in range(3):
+            cut = buf.rfind('},', pos, cut)
+            if cut < 0:
+                return None
+            try:
+                records = self._decoder.loads('[' + buf[pos:cut + 1] + ']')
+            except ValueError:
+                continue
+            self._records.extend(records)
+            return cut + 1
+        return None
+
+def decode_chunks(chunks: Iterable[bytes], decoder: Optional[JSONDecoder] = None) -> Any:
+    """Decodifica un cuerpo recibido por partes con ResultsParser."""
+    parser = ResultsParser(decoder)
+    records: List[Any] = []
+    for chunk in chunks:
+        records.extend(parser.feed(chunk))
+    return _finish(parser, records)
+
+async def decode_chunks_async(chunks: AsyncIterable[bytes], decoder: Optional[JSONDecoder] = None) -> Any:
+    """Equivalente asíncrono de `decode_chunks`."""
+    parser = ResultsParser(decoder)
+    records: List[Any] = []
+    async for chunk in chunks:
+        records.extend(parser.feed(chunk))
+    return _finish(parser, records)
+
+def _finish(parser: ResultsParser, records: List[Any]) -> Any:
+    records.extend(parser.close())
+    if not parser.streamed:
+        return parser.data
+    parser.data['results'] = records
+    return parser.data
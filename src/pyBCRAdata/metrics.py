@@ -0,0 +1,168 @@
+from typing import Optional, Dict, Any, List, Tuple, ContextManager
+import threading
+import time
+from contextlib import nullcontext
+
+# Etapas que mide el conector, en el orden en que ocurren en una consulta.
+# `connect` abarca hasta recibir los encabezados (conexión, TLS y espera del
+# servidor) y `transfer` la lectura del cuerpo. Las respuestas que se
+# decodifican a medida que llegan (ver `decoding.ResultsParser`) no informan
+# `json_decode`: su decodificación queda incluida en `transfer`.
+STAGES = ('url_build', 'connect', 'transfer', 'json_decode', 'normalize', 'type_cast')
+
+class Instrumentation:
+    """
+    Interfaz de instrumentación del conector.
+
+    El conector llama a `observe` con la duración de cada etapa de una
+    consulta (ver STAGES) y a `record` con los bytes recibidos y las filas
+    producidas, siempre con el endpoint (`api.metodo`) al que corresponden.
+    Las implementaciones deben ser seguras para usar desde varios hilos.
+    """
+
+    def observe(self, stage: str, endpoint_key: str, seconds: float) -> None:
+        pass
+
+    def record(self, endpoint_key: str, nbytes: int = 0, rows: int = 0) -> None:
+        pass
+
+class _Span:
+    __slots__ = ('instrumentation', 'stage', 'endpoint_key', 'start')
+
+    def __init__(self, instrumentation: Instrumentation, stage: str, endpoint_key: str):
+        self.instrumentation = instrumentation
+        self.stage = stage
+        self.endpoint_key = endpoint_key
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.instrumentation.observe(self.stage, self.endpoint_key, time.perf_counter() - self.start)
+
+_NO_SPAN = nullcontext()
+
+def span(instrumentation: Optional[Instrumentation], stage: str, endpoint_key: str) -> ContextManager[None]:
+    """Mide la duración del bloque como la etapa `stage`; sin instrumentación no hace nada."""
+    if instrumentation is None:
+        return _NO_SPAN
+    return _Span(instrumentation, stage, endpoint_key)
+
+def _stage_order(item: Tuple[Tuple[str, str], List[float]]) -> Tuple[str, int]:
+    (endpoint_key, stage), _ = item
+    return endpoint_key, STAGES.index(stage) if stage in STAGES else len(STAGES)
+
+class MetricsCollector(Instrumentation):
+    """
+    Instrumentación en memoria: acumula por endpoint la cantidad, el tiempo
+    total y el máximo de cada etapa, y los bytes y filas recibidos.
+
+    `stats()` devuelve un resumen como diccionario y `to_prometheus()` el
+    mismo contenido en el formato de texto de Prometheus, para exponerlo
+    desde un endpoint `/metrics` propio.
+    """
+
+    def __init__(self):
+        self._stages: Dict[Tuple[str, str], List[float]] = {}
+        self._volume: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, endpoint_key: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._stages.get((endpoint_key, stage))
+            if entry is None:
+                self._stages[(endpoint_key, stage)] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    def record(self, endpoint_key: str, nbytes: int = 0, rows: int = 0) -> None:
+        with self._lock:
+            entry = self._volume.setdefault(endpoint_key, [0, 0])
+            entry[0] += nbytes
+            entry[1] += rows
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Resumen por endpoint: `{endpoint: {'stages': {etapa: {'count',
+        'total', 'mean', 'max'}}, 'bytes', 'rows'}}`, con los tiempos en
+        segundos. La cantidad de respuestas es el `count` de `connect`.
+        """
+        with self._lock:
+            stages = {key: list(entry) for key, entry in self._stages.items()}
+            volume = {key: list(entry) for key, entry in self._volume.items()}
+
+        summary: Dict[str, Dict[str, Any]] = {}
+        for (endpoint_key, stage), (count, total, peak) in sorted(stages.items(), key=_stage_order):
+            entry = summary.setdefault(endpoint_key, {'stages': {}, 'bytes': 0, 'rows': 0})
+            entry['stages'][stage] = {'count': count, 'total': total, 'mean': total / count, 'max': peak}
+        for endpoint_key, (nbytes, rows) in volume.items():
+            entry = summary.setdefault(endpoint_key, {'stages': {}, 'bytes': 0, 'rows': 0})
+            entry.update(bytes=nbytes, rows=rows)
+        return summary
+
+    def to_prometheus(self, prefix: str = 'pybcradata') -> str:
+        """Métricas en el formato de texto de exposición de Prometheus."""
+        summary = self.stats()
+        lines = [
+            f'# HELP {prefix}_stage_seconds Duración de las etapas de las consultas',
+            f'# TYPE {prefix}_stage_seconds summary',
+        ]
+        for endpoint_key, entry in summary.items():
+            for stage, values in entry['stages'].items():
+                labels = f'endpoint="{endpoint_key}",stage="{stage}"'
+                lines.append(f'{prefix}_stage_seconds_count{{{labels}}} {values["count"]}')
+                lines.append(f'{prefix}_stage_seconds_sum{{{labels}}} {values["total"]:.9f}')
+        for name, field, help_text in (
+                ('response_bytes_total', 'bytes', 'Bytes recibidos de la API'),
+                ('rows_total', 'rows', 'Filas producidas')):
+            lines.append(f'# HELP {prefix}_{name} {help_text}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            lines.extend(
+                f'{prefix}_{name}{{endpoint="{endpoint_key}"}} {entry[field]}'
+                for endpoint_key, entry in summary.items()
+            )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._volume.clear()
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Instrumentación que publica las métricas con la API de métricas de
+    OpenTelemetry: un histograma `pybcradata.stage.duration` (segundos) con
+    los atributos `endpoint` y `stage`, y los contadores
+    `pybcradata.response.bytes` y `pybcradata.rows` por `endpoint`.
+
+    Parameters
+    ----------
+    meter : opentelemetry.metrics.Meter, optional
+        Meter a utilizar. Por defecto el del MeterProvider global
+    """
+
+    def __init__(self, meter: Any = None):
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError:
+                raise ImportError(
+                    "OpenTelemetryInstrumentation requiere opentelemetry-api: pip install opentelemetry-api"
+                ) from None
+            meter = metrics.get_meter("pyBCRAdata")
+        self._duration = meter.create_histogram(
+            "pybcradata.stage.duration", unit="s", description="Duración de las etapas de las consultas"
+        )
+        self._bytes = meter.create_counter("pybcradata.response.bytes", unit="By", description="Bytes recibidos de la API")
+        self._rows = meter.create_counter("pybcradata.rows", description="Filas producidas")
+
+    def observe(self, stage: str, endpoint_key: str, seconds: float) -> None:
+        self._duration.record(seconds, {"endpoint": endpoint_key, "stage": stage})
+
+    def record(self, endpoint_key: str, nbytes: int = 0, rows: int = 0) -> None:
+        if nbytes:
+            self._bytes.add(nbytes, {"endpoint": endpoint_key})
+        if rows:
+            self._rows.add(rows, {"endpoint": endpoint_key})
@@ -0,0 +1,234 @@
+from typing import Dict, Any, Union, List, Set, Optional
+import warnings
+import numpy as np
+import pandas as pd
+
+def flatten_record(d: dict, parent_key: str = '', sep: str = '_') -> dict:
+    """
+    Aplana los diccionarios anidados de un registro uniendo las claves con
+    `sep`. Las listas de diccionarios se conservan para expandirlas después;
+    las demás listas se unen en un string separado por ';'.
+    """
+    items = {}
+    for k, v in d.items():
+        new_key = f"{parent_key}{sep}{k}" if parent_key else k
+        if isinstance(v, dict):
+            items.update(flatten_record(v, new_key, sep))
+        elif isinstance(v, list) and not all(isinstance(i, dict) for i in v):
+            items[new_key] = ";".join(map(str, v))
+        else:
+            items[new_key] = v
+    return items
+
+def _nested_keys(d: dict, prefix: str, out: dict) -> None:
+    for k, v in d.items():
+        key = f"{prefix}.{k}"
+        if isinstance(v, dict):
+            _nested_keys(v, key, out)
+        else:
+            out[key] = v
+
+def nested_record(d: dict) -> dict:
+    """
+    Aplana un diccionario con las mismas reglas que `pd.json_normalize`:
+    claves anidadas unidas con '.', ubicadas después de las del primer nivel.
+    """
+    if not any(isinstance(v, dict) for v in d.values()):
+        return d
+    out, nested = {}, []
+    for k, v in d.items():
+        if isinstance(v, dict):
+            nested.append((k, v))
+        else:
+            out[k] = v
+    for k, v in nested:
+        _nested_keys(v, k, out)
+    return out
+
+def _object_array(values: List[Any]) -> np.ndarray:
+    return np.fromiter(values, dtype=object, count=len(values))
+
+def _columns_from_records(records: List[dict], prefix: str = "") -> Dict[str, np.ndarray]:
+    """Arma las columnas de una lista de registros planos en una única pasada."""
+    names: Dict[str, None] = {}
+    for record in records:
+        for key in record:
+            if key not in names:
+                names[key] = None
+    return {
+        f"{prefix}{name}": _object_array([record.get(name, np.nan) for record in records])
+        for name in names
+    }
+
+def _is_list(value: Any) -> bool:
+    return isinstance(value, list)
+
+def _explode(columns: Dict[str, np.ndarray], name: str) -> Dict[str, np.ndarray]:
+    """Equivalente a `DataFrame.explode(name)` sobre columnas de tipo objeto."""
+    values = columns[name]
+    lengths = np.fromiter(
+        (max(len(v), 1) if _is_list(v) else 1 for v in values), dtype=np.intp, count=len(values)
+    )
+    index = np.repeat(np.arange(len(values)), lengths)
+    exploded = []
+    for v in values:
+        if _is_list(v):
+            exploded.extend(v if v else (np.nan,))
+        else:
+            exploded.append(v)
+
+    result = {}
+    for key, column in columns.items():
+        result[key] = _object_array(exploded) if key == name else column[index]
+    return result
+
+def _expand(columns: Dict[str, np.ndarray], name: str, dicts: List[dict]) -> Dict[str, np.ndarray]:
+    """Reemplaza la columna `name` por las columnas de sus diccionarios, al final."""
+    expanded = _columns_from_records([nested_record(d) for d in dicts], prefix=f"{name}_")
+    result = {key: column for key, column in columns.items() if key != name}
+    for key, column in expanded.items():
+        # pd.concat conserva las columnas con nombre repetido; las dejamos al legado
+        if key in result:
+            raise _Irregular(key)
+        result[key] = column
+    return result
+
+class _Irregular(Exception):
+    """La respuesta tiene una forma que el motor rápido no reproduce."""
+
+def _typed_column(values: np.ndarray, dtype: str) -> Optional[Any]:
+    """
+    Construye la columna directamente con su dtype final, sin pasar por la
+    inferencia de pandas. Devuelve None si los valores no lo permiten (nulos
+    en una columna entera, fechas con zona horaria, etc.); esas columnas se
+    convierten luego con `astype`.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            if dtype == 'category':
+                return pd.Categorical(values)
+            return values.astype(dtype)
+    except (TypeError, ValueError, OverflowError, Warning):
+        return None
+
+def _build_frame(columns: Dict[str, np.ndarray], raw: Set[str], rows: int,
+                 dtypes: Dict[str, str]) -> pd.DataFrame:
+    if not columns:
+        raise _Irregular("sin columnas")
+    data = {}
+    for key, column in columns.items():
+        typed = _typed_column(column, dtypes[key]) if key in dtypes else None
+        if typed is not None:
+            data[key] = typed
+        else:
+            data[key] = column if key in raw else column.tolist()
+    return pd.DataFrame(data, index=pd.RangeIndex(rows))
+
+def _is_flat(json_data: List[dict]) -> bool:
+    return not any(isinstance(v, (dict, list)) for item in json_data for v in item.values())
+
+def _normalize(json_data: List[dict], explode: bool, dtypes: Dict[str, str]) -> pd.DataFrame:
+    if not dtypes and _is_flat(json_data):
+        # Registros planos (series): no hay nada que aplanar ni expandir
+        return pd.DataFrame(json_data)
+
+    columns = _columns_from_records([flatten_record(item) for item in json_data])
+    raw: Set[str] = set()
+    rows = len(json_data)
+
+    if not explode:
+        for name in list(columns):
+            values = columns[name]
+            if all(_is_list(v) and len(v) == 1 and isinstance(v[0], dict) for v in values):
+                columns = _expand(columns, name, [v[0] for v in values])
+        return _build_frame(columns, raw, rows, dtypes)
+
+    # Las columnas sin listas no pueden volver a tenerlas: se revisan una sola vez
+    checked: Set[str] = set()
+    while True:
+        name = None
+        for key, values in columns.items():
+            if key in checked:
+                continue
+            if any(_is_list(v) for v in values):
+                name = key
+                break
+            checked.add(key)
+        if name is None:
+            break
+
+        columns = _explode(columns, name)
+        values = columns[name]
+        rows = len(values)
+        if all(isinstance(v, dict) for v in values):
+            columns = _expand(columns, name, list(values))
+            raw.discard(name)
+        else:
+            raw.add(name)
+
+    return _build_frame(columns, raw, rows, dtypes)
+
+def normalize_json(json_data: Union[Dict, List], explode: bool = False,
+                   dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Convierte los registros de una respuesta en un DataFrame.
+
+    Recorre los registros una sola vez para obtener las columnas y expande
+    las listas de diccionarios sobre arrays de objetos, construyendo el
+    DataFrame al final. Las columnas incluidas en `dtypes` se construyen
+    directamente con ese tipo. Sin `dtypes`, el resultado es idéntico al de
+    `legacy_json_to_df`; las formas que el motor no reproduce se delegan en
+    esa implementación.
+    """
+    if isinstance(json_data, dict):
+        json_data = [json_data]
+    elif not isinstance(json_data, list):
+        return pd.DataFrame()
+    if not json_data:
+        return pd.DataFrame()
+    if not all(isinstance(item, dict) for item in json_data):
+        return legacy_json_to_df(json_data, explode)
+
+    try:
+        return _normalize(json_data, explode, dtypes or {})
+    except _Irregular:
+        return legacy_json_to_df(json_data, explode)
+
+def legacy_json_to_df(json_data: Union[Dict, List], explode: bool = False) -> pd.DataFrame:
+    """Implementación original, columna por columna, de `normalize_json`."""
+    if isinstance(json_data, dict):
+        json_data = [json_data]
+    elif not isinstance(json_data, list):
+        return pd.DataFrame()
+
+    flattened = [flatten_record(item) for item in json_data]
+
+    if not flattened:
+        return pd.DataFrame()
+
+    df = pd.DataFrame(flattened)
+
+    if not explode:
+        # Expandir listas de un solo dict en columnas
+        for col in df.columns:
+            if df[col].apply(lambda x: isinstance(x, list) and len(x) == 1 and isinstance(x[0], dict)).all():
+                expanded = pd.json_normalize(df[col].apply(lambda x: x[0]))
+                expanded.columns = [f"{col}_{subcol}" for subcol in expanded.columns]
+                df = pd.concat([df.drop(columns=[col]), expanded], axis=1)
+        return df
+
+    while True:
+        list_columns = [col for col in df.columns if df[col].apply(lambda x: isinstance(x, list)).any()]
+        if not list_columns:
+            break
+
+        col_to_explode = list_columns[0]
+        df = df.explode(col_to_explode).reset_index(drop=True)
+
+        if df[col_to_explode].apply(lambda x: isinstance(x, dict)).all():
+            expanded_cols = pd.json_normalize(df[col_to_explode])
+            expanded_cols.columns = [f"{col_to_explode}_{subcol}" for subcol in expanded_cols.columns]
+            df = pd.concat([df.drop(columns=[col_to_explode]), expanded_cols], axis=1)
+
+    return df
@@ -0,0 +1,46 @@
+from typing import Any, List, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+SeriesArrays = Tuple[np.ndarray, np.ndarray]
+
+def _record_value(record: Any, path: Sequence[str]) -> Any:
+    """Valor de `record` en la ruta `path`; en una lista se toma el primer elemento."""
+    value = record
+    for key in path:
+        if isinstance(value, list):
+            value = value[0] if value else None
+        value = value.get(key) if isinstance(value, dict) else None
+    return value
+
+def series_arrays(records: List[Any], value_path: Sequence[str]) -> SeriesArrays:
+    """
+    Fechas (`datetime64[D]`) y valores (`float64`) de los registros de una
+    serie. Los valores faltantes quedan como NaN.
+    """
+    dates = np.array([record["fecha"] for record in records], dtype="datetime64[D]")
+    if len(value_path) == 1:
+        key = value_path[0]
+        values = [record.get(key) for record in records]
+    else:
+        values = [_record_value(record, value_path) for record in records]
+    return dates, np.array(values, dtype="float64")
+
+def build_panel(keys: Sequence[Any], arrays: Sequence[SeriesArrays], name: str) -> pd.DataFrame:
+    """
+    Arma un DataFrame ancho con una columna por serie, indexado por la unión
+    de las fechas de todas ellas.
+
+    Los valores se escriben directamente en una única matriz float64 creada
+    de antemano, ubicando cada observación por búsqueda binaria en el índice
+    de fechas, sin DataFrames intermedios por serie ni merge o pivot. Las
+    fechas en que una serie no tiene dato quedan en NaN.
+    """
+    dates = np.unique(np.concatenate([series_dates for series_dates, _ in arrays])) \
+        if arrays else np.array([], dtype="datetime64[D]")
+    values = np.full((len(dates), len(keys)), np.nan)
+    for column, (series_dates, series_values) in enumerate(arrays):
+        values[np.searchsorted(dates, series_dates), column] = series_values
+
+    index = pd.DatetimeIndex(dates.astype("datetime64[ns]"), name="fecha")
+    return pd.DataFrame(values, index=index, columns=pd.Index(list(keys), name=name), copy=False)
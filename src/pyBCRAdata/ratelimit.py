@@ -0,0 +1,88 @@
+from typing import Optional
+import asyncio
+import threading
+import time
+
+class RateLimiter:
+    """
+    Limitador de tasa tipo token bucket, seguro para usar desde varios hilos.
+
+    Parameters
+    ----------
+    rate : float
+        Cantidad de solicitudes por segundo que se permiten en régimen
+    burst : float, optional
+        Capacidad del balde, es decir, cuántas solicitudes pueden salir
+        juntas tras un período inactivo. Por defecto max(1, rate)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError(f"rate debe ser mayor que 0: {rate}")
+        self.rate = float(rate)
+        self.capacity = float(burst) if burst else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _try_acquire(self, tokens: float) -> float:
+        """Consume `tokens` si hay disponibles; si no, devuelve cuánto esperar."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Bloquea hasta que haya `tokens` disponibles y los consume."""
+        while (wait := self._try_acquire(tokens)) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """Versión para asyncio de `acquire`: espera sin bloquear el event loop."""
+        while (wait := self._try_acquire(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    Token bucket cuya tasa se ajusta a la que tolera el servidor (AIMD).
+
+    Cada respuesta 429 reduce la tasa a la mitad y vacía el balde; cada
+    respuesta exitosa la sube en `rate / 100` hasta volver a `rate`. Así la
+    tasa converge al máximo aceptado en lugar de alternar entre ráfagas y
+    rechazos.
+
+    Parameters
+    ----------
+    rate : float
+        Tasa máxima en solicitudes por segundo
+    burst : float, optional
+        Capacidad del balde. Por defecto max(1, rate)
+    min_rate : float, optional
+        Tasa mínima a la que se puede reducir. Por defecto rate / 32
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, min_rate: Optional[float] = None):
+        super().__init__(rate, burst)
+        self.max_rate = self.rate
+        self.min_rate = float(min_rate) if min_rate else self.max_rate / 32
+        self._step = self.max_rate / 100
+
+    def throttle(self) -> None:
+        """Registra un rechazo por exceso de solicitudes (429)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def success(self) -> None:
+        """Registra una respuesta aceptada."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + self._step)
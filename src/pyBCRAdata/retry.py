@@ -0,0 +1,208 @@
+from typing import Optional, Union, Dict, Any, Mapping, FrozenSet
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+from .settings import APISettings, ERROR_MESSAGES
+from .ratelimit import AdaptiveRateLimiter
+
+class APIError(ValueError):
+    """
+    Error de la API que persiste luego de agotar los reintentos, o consulta
+    rechazada sin enviarse porque el circuito de su familia está abierto.
+
+    Attributes
+    ----------
+    status_code : int
+        Status de la última respuesta; 0 si no hubo respuesta
+    data : dict
+        Cuerpo de la última respuesta
+    """
+
+    def __init__(self, message: str, status_code: int = 0, data: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.data = data or {}
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Política de reintentos de las consultas HTTP.
+
+    Se reintentan los errores de conexión y los status de `statuses`, con
+    espera exponencial con jitter completo (entre 0 y `backoff * 2**intento`,
+    hasta `max_backoff`) o la que indique el encabezado `Retry-After`. Tras
+    `failure_threshold` fallas consecutivas de una familia de endpoints su
+    circuito se abre y las consultas fallan de inmediato durante
+    `reset_timeout` segundos; luego se deja pasar una consulta de prueba.
+
+    Parameters
+    ----------
+    max_retries : int, optional
+        Reintentos por consulta, sin contar el primer intento
+    backoff : float, optional
+        Espera base en segundos
+    max_backoff : float, optional
+        Espera máxima en segundos entre dos intentos
+    statuses : frozenset of int, optional
+        Status HTTP que se reintentan
+    failure_threshold : int, optional
+        Fallas consecutivas que abren el circuito
+    reset_timeout : float, optional
+        Segundos que el circuito permanece abierto
+    """
+    max_retries: int = APISettings.MAX_RETRIES
+    backoff: float = APISettings.RETRY_BACKOFF
+    max_backoff: float = APISettings.RETRY_MAX_BACKOFF
+    statuses: FrozenSet[int] = APISettings.RETRY_STATUSES
+    failure_threshold: int = APISettings.CIRCUIT_THRESHOLD
+    reset_timeout: float = APISettings.CIRCUIT_RESET
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Espera antes del reintento número `attempt + 1`."""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+class CircuitBreaker:
+    """Circuito de una familia de endpoints, seguro para usar desde varios hilos."""
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        """
+        Segundos que faltan para que el circuito deje pasar consultas; 0 si
+        está cerrado. Al vencer la espera se deja pasar una única consulta de
+        prueba y el resto sigue esperando hasta conocer su resultado.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            now = time.monotonic()
+            remaining = self._opened_at + self.reset_timeout - now
+            if remaining > 0:
+                return remaining
+            self._opened_at = now
+            return 0.0
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+def endpoint_family(url: str) -> str:
+    """Familia de endpoints de `url` (estadisticas, cheques o CentralDeDeudores)."""
+    for segment in urlsplit(url).path.split('/'):
+        for family in APISettings.ENDPOINT_FAMILIES:
+            if segment.startswith(family):
+                return family
+    return ""
+
+def retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    """Segundos indicados por `Retry-After`, en segundos o como fecha HTTP."""
+    value = headers.get('Retry-After') if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class RequestGuard:
+    """
+    Estado compartido por las consultas de un conector: un limitador
+    adaptativo y un circuito por familia de endpoints.
+
+    Parameters
+    ----------
+    policy : RetryPolicy, optional
+        Política de reintentos. Si es None no se reintenta ni se abre el circuito
+    rate_limits : dict, optional
+        Solicitudes por segundo por familia de endpoints. Las familias sin
+        entrada no se limitan
+    """
+
+    def __init__(self, policy: Optional[RetryPolicy] = None,
+                rate_limits: Optional[Mapping[str, float]] = None):
+        self.policy = policy
+        self._limiters = {family: AdaptiveRateLimiter(rate) for family, rate in (rate_limits or {}).items()}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, family: str) -> Optional[AdaptiveRateLimiter]:
+        return self._limiters.get(family)
+
+    def check(self, family: str) -> None:
+        """Lanza APIError si el circuito de `family` está abierto."""
+        if self.policy is None:
+            return
+        remaining = self._breaker(family).remaining()
+        if remaining > 0:
+            raise APIError(ERROR_MESSAGES['circuit_open'].format(family=family or "la API", wait=remaining))
+
+    def outcome(self, family: str, status_code: int, headers: Mapping[str, str],
+               attempt: int) -> Optional[float]:
+        """
+        Registra el resultado del intento número `attempt` y devuelve cuánto
+        esperar antes de reintentar, o None si no corresponde reintentar.
+        """
+        limiter = self._limiters.get(family)
+        if limiter is not None:
+            if status_code == 429:
+                limiter.throttle()
+            elif status_code == 200:
+                limiter.success()
+        if self.policy is None:
+            return None
+
+        retryable = self.retryable(status_code)
+        if status_code != 429:
+            self._breaker(family).record(not retryable)
+        if not retryable or attempt >= self.policy.max_retries:
+            return None
+        return self.policy.delay(attempt, retry_after(headers))
+
+    def retryable(self, status_code: int) -> bool:
+        return self.policy is not None and (status_code == 0 or status_code in self.policy.statuses)
+
+    def _breaker(self, family: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is None:
+                breaker = self._breakers[family] = CircuitBreaker(
+                    self.policy.failure_threshold, self.policy.reset_timeout
+                )
+            return breaker
+
+RetryOption = Union[None, bool, int, RetryPolicy]
+
+def open_retry_policy(retry: RetryOption) -> Optional[RetryPolicy]:
+    """
+    Normaliza la opción `retry` de los clientes: None/False desactiva los
+    reintentos y el circuito, True usa la política por defecto, un entero
+    indica la cantidad de reintentos y una RetryPolicy se usa tal cual.
+    """
+    if retry is None or retry is False:
+        return None
+    if retry is True:
+        return RetryPolicy()
+    if isinstance(retry, RetryPolicy):
+        return retry
+    return RetryPolicy(max_retries=int(retry))
@@ -1,8 +1,13 @@
 from dataclasses import dataclass, field
-from typing import Dict, Set, ClassVar
+from typing import Dict, Set, ClassVar, Optional, Tuple, FrozenSet
 from pathlib import Path
 
 DATE_FORMAT = "%Y-%m-%d"
+
+# Vigencias (en segundos) de las respuestas en caché
+FIVE_MINUTES = 5 * 60
+ONE_HOUR = 60 * 60
+ONE_DAY = 24 * ONE_HOUR
 ERROR_MESSAGES = {
     'ssl_disabled': "Verificación SSL desactivada - no recomendado para producción",
     'invalid_params': "Parámetros inválidos: {params}",
@@ -11,7 +16,33 @@ ERROR_MESSAGES = {
     'no_results': "No se encontraron resultados",
     'invalid_date': "Formato de fecha inválido para {field}: {value}. Use YYYY-MM-DD",
     'invalid_int': "Valor entero inválido para {field}: {value}",
-    'unknown_format': "Formato de datos desconocido: {format}"
+    'unknown_format': "Formato de datos desconocido: {format}",
+    'not_paginated': "El método {method} no admite paginación automática",
+    'invalid_workers': "max_workers debe ser un entero mayor o igual a 1: {value}",
+    'not_sharded': "El método {method} no admite división por rango de fechas",
+    'invalid_shards': "shards debe ser un entero mayor o igual a 1: {value}",
+    'shard_start_required': "Para dividir el rango de fechas se requiere {field}",
+    'batch_items': "{arg} debe ser una lista de valores o diccionarios de parámetros",
+    'batch_sink_stream': "En las consultas por lotes stream y sink no se pueden combinar",
+    'not_incremental': "El método {method} no admite sincronización incremental",
+    'store_required': "La sincronización incremental requiere un cliente con series_store",
+    'store_no_date': "Observación sin fecha en la serie {series}",
+    'invalid_chunk_size': "chunk_size debe ser un entero mayor o igual a 1: {value}",
+    'stream_incremental': "stream y sink no se pueden combinar con incremental=True",
+    'incremental_paging': "limit y offset no se pueden combinar con incremental=True",
+    'json_decoder': "Decodificador JSON desconocido: {decoder}. Use 'json', 'orjson', 'simdjson' o un JSONDecoder",
+    'json_incomplete': "Respuesta JSON incompleta o inválida",
+    'panel_error': "Error en la API (status {status}) al descargar la serie {series}: {error}",
+    'bulk_endpoint': "Endpoint sin consultas por lotes: {endpoint}. Opciones: {endpoints}",
+    'bulk_column': "El archivo {path} no tiene la columna {column}",
+    'bulk_param': "Parámetro inválido: {value}. Use CLAVE=VALOR",
+    'bulk_positive': "--{option} debe ser un entero mayor o igual a 1",
+    'bulk_mismatch': "{output} tiene el progreso de otra ejecución (otro archivo, endpoint o parámetros). Use --restart para descartarlo u otro directorio",
+    'circuit_open': "Circuito abierto para {family} por errores consecutivos; reintente en {wait:.0f}s",
+    'retries_exhausted': "La API respondió con status {status} tras {attempts} intentos: {error}",
+    'retrying': "Reintento {attempt} de {url} en {wait:.2f}s (status {status})",
+    'sink_format': "Destino no soportado: {sink}. Use una ruta .parquet, .arrow, .feather o .csv, 'arrow' o un Sink",
+    'stream_error': "Error en la API (status {status}) durante la descarga: {error}"
 }
 
 COLUMN_TYPES = {
@@ -20,6 +51,31 @@ COLUMN_TYPES = {
     'codigoEntidad': 'int64', 'idVariable': 'int64', 'numeroCheque': 'int64'
 }
 
+# Columnas de texto muy repetidas que se construyen como categóricas
+CURRENCY_DETAIL_TYPES = {
+    'detalle_codigoMoneda': 'category', 'detalle_descripcion': 'category',
+    'detalle_tipoPase': 'float64', 'detalle_tipoCotizacion': 'float64'
+}
+DEBTS_TYPES = {
+    'denominacion': 'category', 'periodos_periodo': 'category',
+    'periodos_entidades_entidad': 'category', 'periodos_entidades_monto': 'float64'
+}
+REJECTED_TYPES = {'denominacion': 'category', 'causales_causal': 'category'}
+
+@dataclass(frozen=True)
+class ColumnSchema:
+    """
+    Columnas de la respuesta de un endpoint. `dtypes` indica el tipo final
+    de cada columna, además de COLUMN_TYPES; las columnas anidadas se nombran
+    con su ruta (p. ej. `detalle_codigoMoneda`). Si `explode` es True, las
+    listas anidadas se expanden en filas.
+    """
+    dtypes: Dict[str, str] = field(default_factory=dict)
+    explode: bool = False
+
+    def column_types(self) -> Dict[str, str]:
+        return {**COLUMN_TYPES, **self.dtypes}
+
 @dataclass(frozen=True)
 class EndpointConfig:
     """Configuración de un endpoint de la API."""
@@ -27,6 +83,16 @@ class EndpointConfig:
     path_params: Set[str] = field(default_factory=set)
     query_params: Set[str] = field(default_factory=set)
     required_args: Set[str] = field(default_factory=set)
+    page_size: Optional[int] = None
+    date_params: Optional[Tuple[str, str]] = None
+    batch_param: Optional[str] = None
+    batch_arg: Optional[str] = None
+    # Argumento de `panel` (lista de series) y ruta del valor en cada registro
+    panel_arg: Optional[str] = None
+    panel_value: Optional[Tuple[str, ...]] = None
+    # Vigencia en caché, en segundos: 0 no guarda la respuesta, None no vence
+    cache_ttl: Optional[float] = 0
+    schema: ColumnSchema = field(default_factory=ColumnSchema)
 
 class APIEndpoints:
     """Endpoints y configuraciones de la API BCRA."""
@@ -58,60 +124,125 @@ class APISettings:
         else Path(__file__).parent.parent / 'cert' / 'ca.pem'
     )
 
-    COMMON_FUNC_PARAMS: ClassVar[Set[str]] = {"json", "debug"}
+    COMMON_FUNC_PARAMS: ClassVar[Set[str]] = {
+        "json", "debug", "paginate", "max_workers", "shards", "incremental", "stream", "chunk_size", "sink"
+    }
+
+    MAX_WORKERS: ClassVar[int] = 4
+    # Consultas por bloque al iterar una consulta por lotes con stream=True
+    STREAM_BATCH_SIZE: ClassVar[int] = 100
+
+    CACHE_PATH: ClassVar[str] = str(Path.home() / '.cache' / 'pyBCRAdata' / 'responses.sqlite')
+    CACHE_MAX_BYTES: ClassVar[int] = 512 * 1024 * 1024
+    FRAME_CACHE_MAX_BYTES: ClassVar[int] = 256 * 1024 * 1024
+    STORE_PATH: ClassVar[str] = str(Path.home() / '.cache' / 'pyBCRAdata' / 'series.sqlite')
+
+    POOL_CONNECTIONS: ClassVar[int] = 4
+    POOL_MAXSIZE: ClassVar[int] = 10
+
+    # Reintentos y circuit breaker (ver retry.RetryPolicy). Por defecto solo
+    # se reintentan los errores de conexión y los status transitorios.
+    MAX_RETRIES: ClassVar[int] = 3
+    RETRY_BACKOFF: ClassVar[float] = 0.5
+    RETRY_MAX_BACKOFF: ClassVar[float] = 30.0
+    RETRY_STATUSES: ClassVar[FrozenSet[int]] = frozenset({429, 502, 503, 504})
+    CIRCUIT_THRESHOLD: ClassVar[int] = 5
+    CIRCUIT_RESET: ClassVar[float] = 30.0
+    # Familias de endpoints con limitador de tasa y circuito propios
+    ENDPOINT_FAMILIES: ClassVar[Tuple[str, ...]] = ('estadisticas', 'cheques', 'CentralDeDeudores')
+
+    # Las respuestas desde este tamaño (o sin Content-Length) se decodifican
+    # a medida que se reciben, en bloques de DECODE_CHUNK_SIZE bytes
+    INCREMENTAL_DECODE_BYTES: ClassVar[int] = 1024 * 1024
+    DECODE_CHUNK_SIZE: ClassVar[int] = 64 * 1024
 
     API_CONFIG: ClassVar[Dict[str, Dict[str, EndpointConfig]]] = {
         'monetary': {
             'variables': EndpointConfig(
-                endpoint=APIEndpoints.MONETARY_MASTER
+                endpoint=APIEndpoints.MONETARY_MASTER,
+                cache_ttl=ONE_DAY,
+                schema=ColumnSchema({'categoria': 'category'})
             ),
             'series': EndpointConfig(
                 endpoint=APIEndpoints.MONETARY,
                 path_params={"id_variable"},
                 query_params={"desde", "hasta", "limit", "offset"},
-                required_args={"id_variable"}
+                required_args={"id_variable"},
+                page_size=3000,
+                date_params=("desde", "hasta"),
+                panel_arg="ids",
+                panel_value=("valor",),
+                cache_ttl=ONE_HOUR
             )
         },
         'currency': {
             'currencies': EndpointConfig(
-                endpoint=APIEndpoints.CURRENCY_MASTER
+                endpoint=APIEndpoints.CURRENCY_MASTER,
+                cache_ttl=ONE_DAY
             ),
             'rates': EndpointConfig(
                 endpoint=APIEndpoints.CURRENCY_QUOTES,
-                query_params={"fecha"}
+                query_params={"fecha"},
+                cache_ttl=FIVE_MINUTES,
+                schema=ColumnSchema(CURRENCY_DETAIL_TYPES, explode=True)
             ),
             'series': EndpointConfig(
                 endpoint=APIEndpoints.CURRENCY_TIMESERIES,
                 path_params={"moneda"},
                 query_params={"fechadesde", "fechahasta", "limit", "offset"},
-                required_args={"moneda"}
+                required_args={"moneda"},
+                page_size=1000,
+                date_params=("fechadesde", "fechahasta"),
+                panel_arg="monedas",
+                panel_value=("detalle", "tipoCotizacion"),
+                cache_ttl=ONE_HOUR,
+                schema=ColumnSchema(CURRENCY_DETAIL_TYPES)
             )
         },
         'checks': {
             'banks': EndpointConfig(
-                endpoint=APIEndpoints.CHECKS_MASTER
+                endpoint=APIEndpoints.CHECKS_MASTER,
+                cache_ttl=ONE_DAY
             ),
             'reported': EndpointConfig(
                 endpoint=APIEndpoints.CHECKS_REPORTED,
                 path_params={'codigo_entidad', 'numero_cheque'},
-                required_args={'codigo_entidad', 'numero_cheque'}
+                required_args={'codigo_entidad', 'numero_cheque'},
+                batch_param='numero_cheque',
+                batch_arg='numeros_cheque',
+                cache_ttl=ONE_HOUR,
+                schema=ColumnSchema({
+                    'denominacionEntidad': 'category', 'detalles_causal': 'category'
+                }, explode=True)
             )
         },
         'debtors': {
             'debtors': EndpointConfig(
                 endpoint=APIEndpoints.DEBTS,
                 path_params={'identificacion'},
-                required_args={'identificacion'}
+                required_args={'identificacion'},
+                batch_param='identificacion',
+                batch_arg='identificaciones',
+                cache_ttl=ONE_DAY,
+                schema=ColumnSchema(DEBTS_TYPES, explode=True)
             ),
             'history': EndpointConfig(
                 endpoint=APIEndpoints.DEBTS_HISTORICAL,
                 path_params={'identificacion'},
-                required_args={'identificacion'}
+                required_args={'identificacion'},
+                batch_param='identificacion',
+                batch_arg='identificaciones',
+                cache_ttl=ONE_DAY,
+                schema=ColumnSchema(DEBTS_TYPES, explode=True)
             ),
             'rejected': EndpointConfig(
                 endpoint=APIEndpoints.DEBTS_REJECTED_CHECKS,
                 path_params={'identificacion'},
-                required_args={'identificacion'}
+                required_args={'identificacion'},
+                batch_param='identificacion',
+                batch_arg='identificaciones',
+                cache_ttl=ONE_DAY,
+                schema=ColumnSchema(REJECTED_TYPES)
             )
         }
     }
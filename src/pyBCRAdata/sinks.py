@@ -0,0 +1,205 @@
+from typing import Optional, Union, Any, Iterable, AsyncIterable, List
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import pandas as pd
+
+from .settings import ERROR_MESSAGES
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Las salidas Parquet y Arrow requieren pyarrow: pip install pyBCRAdata[arrow]"
+        ) from None
+    return pyarrow
+
+class Sink(ABC):
+    """
+    Destino de exportación de un resultado.
+
+    Recibe el resultado por bloques con `write`, a medida que se descargan
+    las páginas, y `close` devuelve lo que entrega el método de la API: la
+    ruta del archivo escrito o, en `ArrowSink`, la tabla en memoria. Las
+    subclases deben implementar ambos métodos; si falta alguno, la subclase
+    no se puede instanciar.
+    """
+
+    @abstractmethod
+    def write(self, frame: pd.DataFrame) -> None:
+        """Escribe un bloque del resultado."""
+
+    @abstractmethod
+    def close(self) -> Any:
+        """Termina la escritura y devuelve el resultado del método de la API."""
+
+class CSVSink(Sink):
+    """
+    Escribe el resultado en un archivo CSV, agregando cada bloque al final.
+
+    Las columnas del archivo son las del primer bloque.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = Path(path).expanduser()
+        self._columns: Optional[pd.Index] = None
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if self._columns is None:
+            self._columns = frame.columns
+            frame.to_csv(self.path, index=False)
+        else:
+            frame.reindex(columns=self._columns).to_csv(self.path, mode="a", header=False, index=False)
+
+    def close(self) -> Path:
+        if self._columns is None:
+            self.path.write_text("")
+        return self.path
+
+class _ArrowSink(Sink):
+    """
+    Base de los destinos de pyarrow: convierte cada bloque en una tabla con
+    el esquema del primero, de modo que todos los bloques compartan tipos.
+    """
+
+    def __init__(self):
+        self._pa = _require_pyarrow()
+        self.schema = None
+
+    def _table(self, frame: pd.DataFrame):
+        pa = self._pa
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if self.schema is None:
+            self.schema = table.schema
+            return table
+        if table.schema.equals(self.schema):
+            return table
+        return pa.Table.from_arrays([
+            table.column(field.name).cast(field.type) if field.name in table.column_names
+            else pa.nulls(len(table), field.type)
+            for field in self.schema
+        ], schema=self.schema)
+
+class ParquetSink(_ArrowSink):
+    """
+    Escribe el resultado en un archivo Parquet, un row group por bloque.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        Ruta del archivo
+    compression : str, optional
+        Compresión de las columnas. Por defecto snappy
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], compression: str = "snappy"):
+        super().__init__()
+        self.path = Path(path).expanduser()
+        self.compression = compression
+        self._writer = None
+
+    def write(self, frame: pd.DataFrame) -> None:
+        table = self._table(frame)
+        if self._writer is None:
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(self.path, self.schema, compression=self.compression)
+        self._writer.write_table(table)
+
+    def close(self) -> Path:
+        if self._writer is None:
+            import pyarrow.parquet as pq
+            pq.write_table(self._pa.table({}), self.path, compression=self.compression)
+        else:
+            self._writer.close()
+            self._writer = None
+        return self.path
+
+class ArrowFileSink(_ArrowSink):
+    """Escribe el resultado en un archivo Arrow IPC (Feather v2), un record batch por bloque."""
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        super().__init__()
+        self.path = Path(path).expanduser()
+        self._writer = None
+
+    def write(self, frame: pd.DataFrame) -> None:
+        table = self._table(frame)
+        if self._writer is None:
+            self._writer = self._pa.ipc.new_file(str(self.path), self.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> Path:
+        if self._writer is None:
+            self._writer = self._pa.ipc.new_file(str(self.path), self._pa.schema([]))
+        self._writer.close()
+        self._writer = None
+        return self.path
+
+class ArrowSink(_ArrowSink):
+    """
+    Devuelve el resultado como una `pyarrow.Table` en memoria.
+
+    Cada bloque se convierte a Arrow apenas llega y se libera su DataFrame;
+    la tabla final reúne los bloques sin volver a copiarlos. La conversión
+    parte del DataFrame ya tipado de cada bloque (`Table.from_pandas`), con
+    una copia por bloque: así la tabla respeta el mismo esquema de columnas
+    que el resto de los destinos.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._tables: List[Any] = []
+
+    def write(self, frame: pd.DataFrame) -> None:
+        self._tables.append(self._table(frame))
+
+    def close(self):
+        if not self._tables:
+            return self._pa.table({})
+        return self._pa.concat_tables(self._tables)
+
+_SINK_SUFFIXES = {
+    ".parquet": ParquetSink,
+    ".pq": ParquetSink,
+    ".arrow": ArrowFileSink,
+    ".feather": ArrowFileSink,
+    ".csv": CSVSink,
+}
+
+SinkOption = Union[None, str, os.PathLike, Sink]
+
+def open_sink(sink: SinkOption) -> Optional[Sink]:
+    """
+    Normaliza la opción `sink` de los métodos: "arrow" devuelve una tabla de
+    pyarrow, una ruta elige el formato por su extensión (.parquet, .arrow,
+    .feather o .csv) y una instancia de Sink se usa tal cual.
+    """
+    if sink is None or isinstance(sink, Sink):
+        return sink
+    if sink == "arrow":
+        return ArrowSink()
+    path = Path(sink)
+    factory = _SINK_SUFFIXES.get(path.suffix.lower())
+    if factory is None:
+        raise ValueError(ERROR_MESSAGES['sink_format'].format(sink=sink))
+    return factory(path)
+
+def write_frames(sink: Sink, frames: Iterable[pd.DataFrame]) -> Any:
+    """Escribe los bloques en `sink` y lo cierra, aun si la descarga falla."""
+    try:
+        for frame in frames:
+            sink.write(frame)
+    finally:
+        result = sink.close()
+    return result
+
+async def write_frames_async(sink: Sink, frames: AsyncIterable[pd.DataFrame]) -> Any:
+    """Equivalente asíncrono de `write_frames`."""
+    try:
+        async for frame in frames:
+            sink.write(frame)
+    finally:
+        result = sink.close()
+    return result
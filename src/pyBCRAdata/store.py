@@ -0,0 +1,182 @@
+from typing import Optional, Union, Dict, Any, List, Iterable, Tuple
+import os
+import json
+import sqlite3
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+from .settings import APISettings, ERROR_MESSAGES
+from .dates import DateLike, parse_date, format_date
+from .decoding import JSONDecoder, open_decoder
+
+# Inicio de un rango sin fecha desde: toda la historia de la serie
+OPEN_START = date.min
+
+class SeriesStore:
+    """
+    Almacén local de observaciones de series de tiempo en un archivo SQLite.
+
+    Cada observación se guarda tal como la devuelve la API, indexada por la
+    serie (por ejemplo `monetary.series:6` o `currency.series:USD`) y por su
+    `fecha`. Además se registran los rangos de fechas ya descargados de cada
+    serie (su cobertura), de modo que una consulta solo necesita pedir a la
+    API los huecos que quedan dentro del rango pedido.
+
+    Parameters
+    ----------
+    path : str or PathLike, optional
+        Ruta del archivo SQLite. Por defecto APISettings.STORE_PATH
+    decoder : JSONDecoder, optional
+        Decodificador de las observaciones leídas. Por defecto el mismo que
+        eligen los clientes (orjson si está instalado)
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS observations (
+            series TEXT NOT NULL,
+            fecha TEXT NOT NULL,
+            record TEXT NOT NULL,
+            PRIMARY KEY (series, fecha)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS coverage (
+            series TEXT NOT NULL,
+            start TEXT NOT NULL,
+            end TEXT NOT NULL,
+            PRIMARY KEY (series, start)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: Union[str, os.PathLike, None] = None, decoder: Optional[JSONDecoder] = None):
+        self.path = Path(path or APISettings.STORE_PATH).expanduser()
+        self.decoder = decoder if decoder is not None else open_decoder()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(self._SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def append(self, series: str, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Guarda las observaciones de `series`, reemplazando las que ya existían
+        para la misma fecha. Devuelve la cantidad de observaciones escritas.
+        """
+        rows = []
+        for record in records:
+            if not record.get('fecha'):
+                raise ValueError(ERROR_MESSAGES['store_no_date'].format(series=series))
+            rows.append((series, str(record['fecha'])[:10],
+                         json.dumps(record, ensure_ascii=False, separators=(',', ':'))))
+        with self._connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO observations (series, fecha, record) VALUES (?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def read(self, series: str, start: Optional[DateLike] = None,
+             end: Optional[DateLike] = None) -> List[Dict[str, Any]]:
+        """Observaciones de `series` en el rango cerrado [start, end], en orden cronológico."""
+        query, params = "SELECT record FROM observations WHERE series = ?", [series]
+        if start is not None:
+            query += " AND fecha >= ?"
+            params.append(format_date(parse_date(start)))
+        if end is not None:
+            query += " AND fecha <= ?"
+            params.append(format_date(parse_date(end)))
+        with self._connection() as conn:
+            rows = conn.execute(query + " ORDER BY fecha", params).fetchall()
+        # Un único arreglo JSON se decodifica mucho más rápido que cada registro por separado
+        return self.decoder.loads("[" + ",".join(record for record, in rows) + "]")
+
+    def coverage(self, series: str) -> List[Tuple[date, date]]:
+        """Rangos cerrados de fechas ya descargados de `series`, disjuntos y en orden."""
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT start, end FROM coverage WHERE series = ? ORDER BY start", (series,)
+            ).fetchall()
+        return [(date.fromisoformat(start), date.fromisoformat(end)) for start, end in rows]
+
+    def add_coverage(self, series: str, start: date, end: date) -> None:
+        """Registra [start, end] como descargado, uniéndolo a los rangos que toca."""
+        if end < start:
+            return
+        with self._connection() as conn:
+            touching = conn.execute(
+                "SELECT start, end FROM coverage WHERE series = ? AND start <= ? AND end >= ?",
+                (series, _next_day(end).isoformat(), _previous_day(start).isoformat())
+            ).fetchall()
+            for other_start, other_end in touching:
+                start = min(start, date.fromisoformat(other_start))
+                end = max(end, date.fromisoformat(other_end))
+            conn.executemany("DELETE FROM coverage WHERE series = ? AND start = ?",
+                             [(series, other_start) for other_start, _ in touching])
+            conn.execute("INSERT INTO coverage (series, start, end) VALUES (?, ?, ?)",
+                         (series, start.isoformat(), end.isoformat()))
+
+    def gaps(self, series: str, start: Optional[date] = None,
+             end: Optional[date] = None) -> List[Tuple[date, date]]:
+        """
+        Rangos de [start, end] que todavía no se descargaron, en orden. Sin
+        `start` el rango empieza en OPEN_START (toda la historia) y sin `end`
+        termina hoy.
+        """
+        start = start or OPEN_START
+        end = min(end or date.today(), date.today())
+        gaps = []
+        for covered_start, covered_end in self.coverage(series):
+            if covered_end < start:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > start:
+                gaps.append((start, _previous_day(covered_start)))
+            start = _next_day(covered_end)
+            if start > end:
+                return gaps
+        if start <= end:
+            gaps.append((start, end))
+        return gaps
+
+    def clear(self, series: Optional[str] = None) -> None:
+        """Elimina las observaciones y la cobertura de `series`, o de todas las series si es None."""
+        with self._connection() as conn:
+            for table in ("observations", "coverage"):
+                if series is None:
+                    conn.execute(f"DELETE FROM {table}")
+                else:
+                    conn.execute(f"DELETE FROM {table} WHERE series = ?", (series,))
+
+    def close(self) -> None:
+        """Cierra la conexión del hilo actual."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+def _previous_day(value: date) -> date:
+    return value - timedelta(days=1) if value > date.min else value
+
+def _next_day(value: date) -> date:
+    return value + timedelta(days=1) if value < date.max else value
+
+StoreOption = Union[None, bool, str, os.PathLike, SeriesStore]
+
+def open_series_store(series_store: StoreOption) -> Optional[SeriesStore]:
+    """
+    Normaliza la opción `series_store` de los clientes: None/False lo
+    desactiva, True usa la ruta por defecto, una ruta abre (o crea) ese
+    archivo y una instancia de SeriesStore se usa tal cual.
+    """
+    if series_store is None or series_store is False:
+        return None
+    if isinstance(series_store, SeriesStore):
+        return series_store
+    return SeriesStore(None if series_store is True else series_store)
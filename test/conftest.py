@@ -0,0 +1,95 @@
+import json
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+from pyBCRAdata import BCRAclient
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload, headers=None):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode('utf-8')
+        self.headers = {'Content-Length': str(len(self.content)), **(headers or {})}
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSession:
+    """Sesión en memoria: responde según una función `handler(url)`."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.urls = []
+        self.closed = False
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        result = self.handler(url)
+        if isinstance(result, FakeResponse):
+            return result
+        status_code, payload = result
+        return FakeResponse(status_code, payload)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def offline_client():
+    """Devuelve una fábrica de clientes cuyo conector usa una FakeSession."""
+    clients = []
+
+    def factory(handler, **kwargs):
+        client = BCRAclient(**kwargs)
+        client.connector.session = FakeSession(handler)
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def growing_series():
+    """Fábrica de handlers de una serie cuyas observaciones son las fechas de la lista `dates`, que puede crecer."""
+
+    def factory(dates):
+        def handler(url):
+            query = {k: v[0] for k, v in parse_qs(urlparse(url).query).items()}
+            offset, limit = int(query.get('offset', 0)), int(query.get('limit', 3000))
+            selected = [
+                fecha for fecha in dates
+                if query.get('desde', '0000') <= fecha <= query.get('hasta', '9999')
+            ]
+            results = [
+                {'idVariable': 6, 'fecha': fecha, 'valor': float(i)}
+                for i, fecha in enumerate(selected[offset:offset + limit], start=offset)
+            ]
+            return 200, {'status': 200, 'results': results,
+                         'metadata': {'resultset': {'count': len(selected)}}}
+
+        return handler
+
+    return factory
+
+
+@pytest.fixture
+def debtor_handler():
+    """Handler de la Central de Deudores: las identificaciones que empiezan con 0 no existen."""
+
+    def handler(url):
+        cuit = url.rsplit('/', 1)[-1]
+        if cuit.startswith('0'):
+            return 404, {'status': 404, 'errorMessages': ['No se encontró datos para la identificación ingresada.']}
+        return 200, {'results': {'identificacion': int(cuit), 'denominacion': 'X', 'periodos': [
+            {'periodo': '202401', 'entidades': [{'entidad': 'BANCO', 'situacion': 1}]},
+        ]}}
+
+    return handler
@@ -0,0 +1,143 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from pyBCRAdata import AsyncBCRAclient, ResponseCache, SeriesStore
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        if parsed.path.startswith('/CentralDeDeudores'):
+            cuit = parsed.path.rsplit('/', 1)[-1]
+            status = 404 if cuit.startswith('0') else 200
+            payload = {'status': 404, 'errorMessages': ['Sin datos']} if status == 404 else \
+                {'results': {'identificacion': int(cuit), 'periodos': [{'periodo': '202401'}]}}
+        else:
+            offset, limit = int(query.get('offset', 0)), int(query.get('limit', 1000))
+            rows = [{'fecha': f'2024-01-{d:02d}', 'valor': float(d)} for d in range(1, 26)]
+            status, payload = 200, {
+                'metadata': {'resultset': {'count': len(rows), 'offset': offset, 'limit': limit}},
+                'results': rows[offset:offset + limit],
+            }
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_methods_are_awaitable(base_url):
+    async def main():
+        async with AsyncBCRAclient(base_url=base_url) as client:
+            assert await client.monetary.series(id_variable=1, debug=True) == f'{base_url}/estadisticas/v3.0/monetarias/1'
+            return await asyncio.gather(
+                client.monetary.series(id_variable=1),
+                client.monetary.series(id_variable=1, limit=10, paginate=True),
+                client.debtors.debtors_many(identificaciones=['20111111112', '00000000000']),
+            )
+
+    plain, paged, batch = asyncio.run(main())
+    assert len(plain) == 25 and len(paged) == 25
+    assert paged['fecha'].dtype == 'datetime64[ns]'
+    assert list(batch.data.index.get_level_values(0)) == ['20111111112']
+    assert batch.errors['status_code'].tolist() == [404]
+
+
+def test_async_panel(base_url):
+    async def main():
+        async with AsyncBCRAclient(base_url=base_url) as client:
+            return await client.monetary.panel(ids=[1, 2, 3], desde='2024-01-01')
+
+    df = asyncio.run(main())
+    assert df.shape == (25, 3) and df.columns.tolist() == [1, 2, 3]
+    assert df[3].tolist() == [float(d) for d in range(1, 26)]
+
+
+def test_async_stream_yields_frames_per_page(base_url):
+    async def main():
+        async with AsyncBCRAclient(base_url=base_url) as client:
+            chunks = await client.monetary.series(id_variable=1, limit=10, stream=True)
+            return [len(df) async for df in chunks]
+
+    assert asyncio.run(main()) == [10, 10, 5]
+
+
+def test_async_identical_calls_are_coalesced(base_url):
+    async def main():
+        async with AsyncBCRAclient(base_url=base_url) as client:
+            frames = await asyncio.gather(*(client.monetary.series(id_variable=1) for _ in range(5)))
+            return frames, client.connector.single_flight.stats()
+
+    frames, stats = asyncio.run(main())
+    assert all(len(df) == 25 for df in frames)
+    assert stats['coalesced'] == 4
+
+
+def test_async_batch_sink(base_url, tmp_path):
+    async def main():
+        async with AsyncBCRAclient(base_url=base_url) as client:
+            return await client.debtors.debtors_many(
+                identificaciones=['20111111112', '00000000000', '20222222223'], sink=tmp_path / 'deudores.csv'
+            )
+
+    result = asyncio.run(main())
+    assert pd.read_csv(result.data)['identificacion'].tolist() == [20111111112, 20222222223]
+    assert result.errors['status_code'].tolist() == [404]
+
+
+def test_async_sqlite_access_runs_off_the_event_loop(base_url, tmp_path):
+    threads = set()
+
+    class RecordingCache(ResponseCache):
+        def get(self, key):
+            threads.add(threading.get_ident())
+            return super().get(key)
+
+        def set(self, key, value, ttl=None):
+            threads.add(threading.get_ident())
+            return super().set(key, value, ttl)
+
+    class RecordingStore(SeriesStore):
+        def gaps(self, *args):
+            threads.add(threading.get_ident())
+            return super().gaps(*args)
+
+        def append(self, *args):
+            threads.add(threading.get_ident())
+            return super().append(*args)
+
+    async def main():
+        cache, store = RecordingCache(tmp_path / 'cache.db'), RecordingStore(tmp_path / 'store.db')
+        async with AsyncBCRAclient(base_url=base_url, cache=cache, series_store=store) as client:
+            loop_thread = threading.get_ident()
+            await client.currency.currencies()
+            await client.currency.currencies()
+            df = await client.monetary.series(id_variable=1, desde='2024-01-01', hasta='2024-01-25', incremental=True)
+            return loop_thread, df
+
+    loop_thread, df = asyncio.run(main())
+    assert len(df) == 25
+    assert threads and loop_thread not in threads
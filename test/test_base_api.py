@@ -0,0 +1,224 @@
+from urllib.parse import urlparse, parse_qs
+
+import pandas as pd
+import pytest
+
+
+def _query(url):
+    return {k: v[0] for k, v in parse_qs(urlparse(url).query).items()}
+
+
+def series_handler(total, with_count=True):
+    """Simula una serie paginada de `total` observaciones diarias."""
+    dates = pd.date_range('2000-01-01', periods=total, freq='D').strftime('%Y-%m-%d')
+
+    def handler(url):
+        query = _query(url)
+        offset, limit = int(query.get('offset', 0)), int(query.get('limit', 1000))
+        results = [
+            {'idVariable': 1, 'fecha': fecha, 'valor': float(i)}
+            for i, fecha in enumerate(dates[offset:offset + limit], start=offset)
+        ]
+        payload = {'status': 200, 'results': results}
+        if with_count:
+            payload['metadata'] = {'resultset': {'count': total, 'offset': offset, 'limit': limit}}
+        return 200, payload
+
+    return handler
+
+
+@pytest.mark.parametrize('with_count', [True, False], ids=['count', 'no_count'])
+def test_paginate_walks_all_pages(offline_client, with_count):
+    client = offline_client(series_handler(2500, with_count))
+    df = client.monetary.series(id_variable=1, limit=1000, paginate=True, max_workers=3)
+
+    assert len(df) == 2500
+    assert df['valor'].tolist() == [float(i) for i in range(2500)]
+    assert df['fecha'].dtype == 'datetime64[ns]'
+    assert len(client.connector.session.urls) == 3
+
+
+def test_paginate_debug_returns_first_page(offline_client):
+    client = offline_client(series_handler(10))
+    url = client.currency.series(moneda='USD', paginate=True, debug=True)
+    assert _query(url) == {'limit': '1000', 'offset': '0'}
+
+
+def test_paginate_returns_failing_page(offline_client):
+    def handler(url):
+        if _query(url)['offset'] != '0':
+            return 500, {'status': 500, 'errorMessages': ['Error interno']}
+        return series_handler(20)(url)
+
+    client = offline_client(handler)
+    result = client.monetary.series(id_variable=1, limit=10, paginate=True)
+    assert result == {'status': 500, 'errorMessages': ['Error interno']}
+
+
+def test_paginate_rejected_for_unpaginated_endpoint(offline_client):
+    client = offline_client(series_handler(1))
+    with pytest.raises(ValueError):
+        client.monetary.variables(paginate=True)
+
+
+def ranged_handler(url):
+    """Devuelve una observación por día dentro de [desde, hasta] (inclusive)."""
+    query = _query(url)
+    start = query.get('desde') or query.get('fechadesde')
+    end = query.get('hasta') or query.get('fechahasta')
+    dates = pd.date_range(start, end, freq='D').strftime('%Y-%m-%d')
+    return 200, {'results': [{'idVariable': 1, 'fecha': f, 'valor': 1.0} for f in dates]}
+
+
+def test_shards_split_range_and_merge_in_order(offline_client):
+    client = offline_client(ranged_handler)
+    df = client.monetary.series(id_variable=1, desde='2020-01-01', hasta='2020-12-31', shards=4)
+
+    assert len(client.connector.session.urls) == 4
+    assert len(df) == 366
+    assert df['fecha'].is_monotonic_increasing
+    assert not df['fecha'].duplicated().any()
+
+
+def test_shards_drop_overlapping_records(offline_client):
+    def overlapping(url):
+        status, payload = ranged_handler(url)
+        payload['results'].insert(0, {'idVariable': 1, 'fecha': '2020-01-01', 'valor': 1.0})
+        return status, payload
+
+    client = offline_client(overlapping)
+    df = client.monetary.series(id_variable=1, desde='2020-01-01', hasta='2020-01-10', shards=3)
+    assert len(df) == 10
+
+
+def test_shards_debug_lists_windows(offline_client):
+    client = offline_client(ranged_handler)
+    urls = client.currency.series(
+        moneda='USD', fechadesde='2020-01-01', fechahasta='2020-01-10', shards=2, debug=True
+    )
+    assert [_query(u) for u in urls] == [
+        {'fechadesde': '2020-01-01', 'fechahasta': '2020-01-05', 'limit': '1000', 'offset': '0'},
+        {'fechadesde': '2020-01-06', 'fechahasta': '2020-01-10', 'limit': '1000', 'offset': '0'},
+    ]
+
+
+def test_shards_paginate_windows_larger_than_a_page(offline_client):
+    def limited(url):
+        """Como la API: sin `limit` devuelve solo las primeras 1000 observaciones."""
+        query = _query(url)
+        status, payload = ranged_handler(url)
+        results = payload['results']
+        offset, limit = int(query.get('offset', 0)), int(query.get('limit', 1000))
+        payload = {
+            'metadata': {'resultset': {'count': len(results), 'offset': offset, 'limit': limit}},
+            'results': results[offset:offset + limit],
+        }
+        return status, payload
+
+    client = offline_client(limited)
+    df = client.monetary.series(id_variable=1, desde='2005-01-01', hasta='2024-12-31', shards=4)
+    assert len(df) == 7305
+    assert not df['fecha'].duplicated().any()
+
+
+def test_shards_require_start_date(offline_client):
+    client = offline_client(ranged_handler)
+    with pytest.raises(ValueError):
+        client.monetary.series(id_variable=1, shards=2)
+    with pytest.raises(ValueError):
+        client.monetary.series(id_variable=1, desde='01/01/2020', shards=2)
+
+
+def test_batch_combines_frames_and_reports_errors(offline_client, debtor_handler):
+    client = offline_client(debtor_handler)
+    ids = ['20111111112', '00000000000', '20222222223']
+    result = client.debtors.debtors_many(identificaciones=ids, max_workers=2, rate_limit=1000)
+
+    data, errors = result
+    assert list(data.index.get_level_values('identificacion')) == ['20111111112', '20222222223']
+    assert data.loc['20222222223', 'identificacion'].tolist() == [20222222223]
+    assert errors.to_dict('records') == [{
+        'identificacion': '00000000000', 'status_code': 404,
+        'error': 'No se encontró datos para la identificación ingresada.'
+    }]
+
+
+def test_batch_with_fixed_params_and_invalid_items(offline_client, debtor_handler):
+    client = offline_client(debtor_handler)
+    urls = client.checks.reported_many(numeros_cheque=[1, 2], codigo_entidad=11, debug=True)
+    assert [u.rsplit('/', 2)[-2:] for u in urls] == [['11', '1'], ['11', '2']]
+
+    result = client.checks.reported_many(numeros_cheque=[1], max_workers=1)
+    assert result.data.empty
+    assert 'codigo_entidad' in result.errors.loc[0, 'error']
+
+    with pytest.raises(ValueError):
+        client.debtors.history_many(identificaciones='20111111112')
+
+
+def panel_handler(url):
+    """Series 1 y 2 con fechas en parte distintas; la 9 no existe."""
+    path = urlparse(url).path
+    if path.startswith('/estadisticascambiarias'):
+        moneda = path.rsplit('/', 1)[-1]
+        rate = {'USD': 1000.0, 'EUR': 1100.0}[moneda]
+        return 200, {'results': [
+            {'fecha': '2024-01-02', 'detalle': [{'codigoMoneda': moneda, 'tipoPase': 1.0, 'tipoCotizacion': rate}]},
+        ]}
+    id_variable = path.rsplit('/', 1)[-1]
+    if id_variable == '9':
+        return 400, {'status': 400, 'errorMessages': ['Variable inexistente']}
+    days = {'1': [1, 2, 3], '2': [2, 4]}[id_variable]
+    return 200, {'results': [
+        {'idVariable': int(id_variable), 'fecha': f'2024-01-0{d}', 'valor': d * int(id_variable) if d != 3 else None}
+        for d in days
+    ]}
+
+
+def test_panel_aligns_series_on_dates(offline_client):
+    client = offline_client(panel_handler)
+    df = client.monetary.panel(ids=[2, 1], desde='2024-01-01', max_workers=2)
+
+    assert df.index.name == 'fecha' and df.columns.tolist() == [2, 1]
+    assert df.index.strftime('%Y-%m-%d').tolist() == ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04']
+    assert (df.dtypes == 'float64').all()
+    assert df.fillna(-1).to_dict('list') == {2: [-1, 4.0, -1, 8.0], 1: [1.0, 2.0, -1, -1]}
+
+    rates = client.currency.panel(monedas=['USD', 'EUR'], fechadesde='2024-01-01')
+    assert rates.columns.name == 'moneda'
+    assert rates.loc['2024-01-02'].tolist() == [1000.0, 1100.0]
+
+
+def test_panel_debug_errors_and_invalid_params(offline_client):
+    client = offline_client(panel_handler)
+    urls = client.monetary.panel(ids=[1, 2], hasta='2024-01-31', debug=True)
+    assert [urlparse(u).path.rsplit('/', 1)[-1] for u in urls] == ['1', '2']
+    assert all(_query(u)['hasta'] == '2024-01-31' for u in urls)
+
+    assert client.monetary.panel(ids=[]).empty
+    with pytest.raises(ValueError, match='Variable inexistente'):
+        client.monetary.panel(ids=[1, 9])
+    with pytest.raises(ValueError):
+        client.monetary.panel(ids=[1], fechadesde='2024-01-01')
+    with pytest.raises(ValueError):
+        client.monetary.panel(ids=1)
+
+
+def test_methods_and_plans_are_built_once_per_class():
+    from pyBCRAdata import BCRAclient, APISettings
+    from pyBCRAdata.client import MonetaryAPI
+    from pyBCRAdata.connector import build_url
+
+    method = MonetaryAPI.series
+    client = BCRAclient()
+    assert client.monetary.series.__func__ is method
+    assert client.monetary.series.__doc__.startswith('Obtiene la serie histórica')
+
+    params = {'id_variable': 6, 'desde': '2024-01-01', 'hasta': None, 'limit': 10}
+    plan = MonetaryAPI._plans['series']
+    assert plan.endpoint_key == 'monetary.series'
+    config = APISettings.API_CONFIG['monetary']['series']
+    assert plan.url(client.connector.base_url, params) == build_url(
+        client.connector.base_url, config.endpoint, params, config.path_params, config.query_params
+    )
+    client.close()
@@ -0,0 +1,133 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyBCRAdata import FrameCache, ResponseCache
+
+
+def masters_handler(url):
+    return 200, {'results': [{'codigo': 'USD', 'denominacion': 'DOLAR E.E.U.U.'}]}
+
+
+def test_response_cache_expires_and_evicts(tmp_path):
+    cache = ResponseCache(tmp_path / 'cache.sqlite', max_bytes=25)
+    cache.set('a', b'0123456789', ttl=None)
+    cache.set('b', b'0123456789', ttl=0.05)
+    assert cache.get('a') == b'0123456789'
+
+    time.sleep(0.06)
+    assert cache.get('b') is None
+
+    cache.set('c', b'0123456789', ttl=None)
+    cache.get('a')
+    cache.set('d', b'0123456789', ttl=None)
+    assert cache.get('c') is None
+    assert cache.get('a') is not None and cache.get('d') is not None
+    assert cache.size() <= 25
+
+
+def test_response_cache_keeps_running_size(tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    cache = ResponseCache(path, max_bytes=1000)
+    cache.set('a', b'0' * 100)
+    cache.set('a', b'0' * 40)
+    cache.set('b', b'0' * 60, ttl=0)
+    assert cache.size() == 100
+    assert cache.get('b') is None
+    assert cache.size() == 40
+
+    # Otra instancia sobre el mismo archivo parte del total guardado
+    assert ResponseCache(path, max_bytes=1000).size() == 40
+    cache.clear()
+    assert cache.size() == 0
+
+
+def test_cache_shared_between_clients(offline_client, tmp_path):
+    path = tmp_path / 'cache.sqlite'
+    first = offline_client(masters_handler, cache=path)
+    second = offline_client(masters_handler, cache=path)
+
+    assert not first.currency.currencies().empty
+    df = second.currency.currencies()
+
+    assert df['codigo'].tolist() == ['USD']
+    assert len(second.connector.session.urls) == 0
+
+
+def test_closed_ranges_never_expire(offline_client, tmp_path):
+    client = offline_client(masters_handler, cache=tmp_path / 'cache.sqlite')
+    client.monetary.series(id_variable=1, desde='2020-01-01', hasta='2020-12-31')
+    client.monetary.series(id_variable=1, desde='2020-01-01')
+    client.monetary.variables()
+
+    rows = client.connector.cache._connection().execute(
+        "SELECT key, expires FROM responses ORDER BY key"
+    ).fetchall()
+    expires = {key.split('v3.0/')[1]: exp for key, exp in rows}
+    assert expires['monetarias/1?desde=2020-01-01&hasta=2020-12-31'] is None
+    assert expires['monetarias/1?desde=2020-01-01'] is not None
+    assert expires['monetarias'] > time.time() + 23 * 3600
+
+
+def test_errors_are_not_cached(offline_client, tmp_path):
+    client = offline_client(lambda url: (500, {'status': 500}), cache=tmp_path / 'cache.sqlite')
+    client.checks.banks()
+    client.checks.banks()
+    assert len(client.connector.session.urls) == 2
+
+
+def test_memory_cache_reuses_parsed_frames(offline_client):
+    client = offline_client(masters_handler, memory_cache=FrameCache())
+    first = client.currency.currencies()
+    first.loc[0, 'codigo'] = 'EUR'
+    second = client.currency.currencies()
+
+    assert second['codigo'].tolist() == ['USD']
+    assert len(client.connector.session.urls) == 1
+    assert client.connector.frame_cache.stats()['hits'] == 1
+
+
+@pytest.mark.parametrize('values, frozen', [
+    (np.array([1.0, 2.0]), True),
+    (np.array([1, 2]), True),
+    (pd.to_datetime(['2024-01-01', '2024-01-02']), True),
+    (pd.Categorical(['a', 'b']), True),
+    (pd.Series(['a', 'b'], dtype=object), True),
+    (pd.arrays.SparseArray([0.0, 1.0], fill_value=0.0), False),
+    (pd.array([1, None], dtype='Int64'), False),
+])
+def test_readonly_frames_protect_or_copy_every_column(values, frozen):
+    """Solo con accesores públicos, para que valga en todas las versiones de pandas soportadas."""
+    df = pd.DataFrame({'col': values, 'valor': [1.0, 2.0]})
+    df.index = pd.Index([10, 20], name='id')
+    expected = df.copy(deep=True)
+    cache = FrameCache(mode='readonly')
+    cache.put('k', df)
+
+    shared = cache.get('k')
+    array = shared['col'].array
+    buffer = np.asarray(array.codes if isinstance(array, pd.Categorical) else array)
+    if frozen:
+        with pytest.raises(ValueError):
+            buffer[0] = buffer[1]
+        with pytest.raises(ValueError):
+            np.asarray(shared.index.array)[0] = 0
+    else:
+        # Un array que no se puede proteger hace que la entrada se entregue copiada
+        np.asarray(shared['valor'].array)[0] = 5.0
+        assert shared['valor'].tolist() == [5.0, 2.0]
+    pd.testing.assert_frame_equal(cache.get('k'), expected)
+
+
+def test_frame_cache_respects_byte_budget():
+    df = pd.DataFrame({'valor': np.arange(100, dtype='float64')})
+    size = int(df.memory_usage(index=True, deep=True).sum())
+    cache = FrameCache(max_bytes=2 * size)
+    for key in 'abc':
+        cache.put(key, df.copy())
+
+    assert cache.get('a') is None
+    assert cache.get('c') is not None
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'entries': 2, 'bytes': 2 * size}
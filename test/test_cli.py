@@ -0,0 +1,113 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from pyBCRAdata.cli import CHECKPOINT, main
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests = []
+    # Identificaciones que responden con un error transitorio
+    failing = set()
+
+    def do_GET(self):
+        self.requests.append(self.path)
+        cuit = self.path.rsplit('/', 1)[-1]
+        status = 500 if cuit in self.failing else 404 if cuit.startswith('0') else 200
+        payload = {'status': 404, 'errorMessages': ['Sin datos']} if status == 404 else \
+            {'results': {'identificacion': int(cuit), 'periodos': [{'periodo': '202401'}]}}
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cuits(tmp_path):
+    path = tmp_path / 'cuits.txt'
+    path.write_text('20111111111\n# comentario\n20222222222\n00000000000\n\n20333333333\n20444444444\n')
+    return path
+
+
+def bulk(base_url, cuits, output, *extra):
+    return main(['bulk', 'debtors.debtors', str(cuits), '-o', str(output), '--base-url', base_url,
+                 '--processes', '1', '--batch-size', '2', '--format', 'csv', *extra])
+
+
+def test_bulk_writes_partitions_and_errors(base_url, cuits, tmp_path):
+    output = tmp_path / 'out'
+    assert bulk(base_url, cuits, output) == 0
+
+    assert sorted(p.name for p in output.glob('part-*')) == ['part-00000.csv', 'part-00001.csv', 'part-00002.csv']
+    data = pd.concat(pd.read_csv(p) for p in sorted(output.glob('part-*')))
+    assert sorted(data['identificacion']) == [20111111111, 20222222222, 20333333333, 20444444444]
+    errors = pd.read_csv(output / 'errors' / 'part-00001.csv', dtype=str)
+    assert errors['identificacion'].tolist() == ['00000000000']
+    assert len((output / CHECKPOINT).read_text().splitlines()) == 3
+
+
+def test_bulk_resumes_from_checkpoint(base_url, cuits, tmp_path):
+    output = tmp_path / 'out'
+    assert bulk(base_url, cuits, output) == 0
+    # Se pierde la última partición, como si la ejecución se hubiera cortado
+    lines = (output / CHECKPOINT).read_text().splitlines()
+    (output / CHECKPOINT).write_text('\n'.join(lines[:2]) + '\n{"partit')
+
+    _Handler.requests.clear()
+    assert bulk(base_url, cuits, output) == 0
+    assert [path.rsplit('/', 1)[-1] for path in _Handler.requests] == ['20444444444']
+
+    _Handler.requests.clear()
+    assert bulk(base_url, cuits, output) == 0
+    assert _Handler.requests == []
+
+
+def test_bulk_retries_partitions_with_transient_errors(base_url, cuits, tmp_path):
+    output = tmp_path / 'out'
+    _Handler.failing = {'20333333333'}
+    try:
+        assert bulk(base_url, cuits, output) == 1
+    finally:
+        _Handler.failing = set()
+    # La partición 1 tiene el 404 y el 500: no se registra como terminada
+    assert [json.loads(line)['partition'] for line in (output / CHECKPOINT).read_text().splitlines()] == [0, 2]
+    assert len(pd.read_csv(output / 'errors' / 'part-00001.csv')) == 2
+
+    _Handler.requests.clear()
+    assert bulk(base_url, cuits, output) == 0
+    assert sorted(path.rsplit('/', 1)[-1] for path in _Handler.requests) == ['00000000000', '20333333333']
+    # El 404 es definitivo: queda en los errores y no impide terminar la partición
+    assert pd.read_csv(output / 'errors' / 'part-00001.csv')['status_code'].tolist() == [404]
+    assert len((output / CHECKPOINT).read_text().splitlines()) == 3
+
+
+def test_bulk_rejects_other_runs_and_bad_options(base_url, cuits, tmp_path):
+    output = tmp_path / 'out'
+    assert bulk(base_url, cuits, output) == 0
+    with pytest.raises(SystemExit) as exc:
+        bulk(base_url, cuits, output, '--batch-size', '3')
+    assert exc.value.code == 2
+    assert bulk(base_url, cuits, output, '--batch-size', '3', '--restart') == 0
+
+    for extra in (['--batch-size', '0'], ['--param', 'x'], ['--param', 'x=1']):
+        with pytest.raises(SystemExit):
+            bulk(base_url, cuits, tmp_path / 'other', *extra)
+    with pytest.raises(SystemExit):
+        main(['bulk', 'monetary.series', str(cuits), '-o', str(tmp_path / 'other')])
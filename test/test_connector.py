@@ -0,0 +1,86 @@
+import json
+import shutil
+import ssl
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pyBCRAdata import BCRAclient
+from pyBCRAdata.connector import APIConnector, PooledHTTPAdapter
+from pyBCRAdata.settings import APISettings
+
+
+def test_apis_share_one_session():
+    client = BCRAclient(pool_maxsize=16)
+    apis = [client.monetary, client.currency, client.checks, client.debtors]
+    assert all(api.api_connector is client.connector for api in apis)
+
+    adapter = client.connector.session.get_adapter(APISettings.BASE_URL)
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert adapter._pool_maxsize == 16
+    assert adapter._ssl_context is not None
+    client.close()
+
+
+def test_ssl_context_disabled_without_verification():
+    connector = APIConnector(APISettings.BASE_URL, cert_path=False)
+    adapter = connector.session.get_adapter(APISettings.BASE_URL)
+    assert adapter._ssl_context is None
+    assert connector.session.verify is False
+
+
+def test_keep_alive_can_be_disabled():
+    connector = APIConnector(APISettings.BASE_URL, APISettings.CERT_PATH, keep_alive=False)
+    assert connector.session.headers['Connection'] == 'close'
+
+
+def test_client_context_manager_closes_pool(offline_client):
+    client = offline_client(lambda url: (200, {'results': [{'codigo': 'USD'}]}))
+    with client as c:
+        df = c.currency.currencies()
+    assert list(df['codigo']) == ['USD']
+    assert client.connector.session.closed
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({'results': [{'codigo': 'USD'}]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def self_signed_url(tmp_path):
+    if shutil.which('openssl') is None:
+        pytest.skip('openssl no disponible')
+    cert, key = tmp_path / 'cert.pem', tmp_path / 'key.pem'
+    subprocess.run(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+                    '-subj', '/CN=127.0.0.1', '-keyout', str(key), '-out', str(cert)],
+                   check=True, capture_output=True)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _JSONHandler)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'https://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.filterwarnings('ignore::urllib3.exceptions.InsecureRequestWarning')
+def test_verify_ssl_false_ignores_ca_bundle_env(self_signed_url, monkeypatch):
+    # Con un CA bundle en el entorno, requests pisaba el verify de la sesión
+    monkeypatch.setenv('REQUESTS_CA_BUNDLE', APISettings.CERT_PATH)
+    monkeypatch.setenv('CURL_CA_BUNDLE', APISettings.CERT_PATH)
+    with pytest.warns(UserWarning):
+        client = BCRAclient(base_url=self_signed_url, verify_ssl=False)
+    with client:
+        assert list(client.currency.currencies()['codigo']) == ['USD']
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from pyBCRAdata import APISettings
+from pyBCRAdata.decoding import JSONDecoder, ResultsParser, decode_chunks, open_decoder
+
+from conftest import FakeResponse
+
+
+BODY = json.dumps({
+    'status': 200,
+    'metadata': {'resultset': {'count': 3}},
+    'results': [
+        {'fecha': '2024-01-02', 'valor': 1.5e3, 'descripcion': 'DÓLAR "billete" },'},
+        {'fecha': '2024-01-03', 'valor': -2, 'detalle': [{'a': 1}, {'b': None}]},
+        {'fecha': '2024-01-04', 'valor': 3},
+    ],
+    'extra': True,
+}, ensure_ascii=False).encode('utf-8')
+
+
+def split(body, size):
+    return [body[start:start + size] for start in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize('size', [1, 2, 5, 64, len(BODY)])
+def test_decode_chunks_matches_json_loads(size):
+    assert decode_chunks(split(BODY, size)) == json.loads(BODY)
+
+
+@pytest.mark.parametrize('body', ['[1, 2]', '{}', '{"results": []}', '{"results": {"fecha": "2024"}}', '12.5e3'])
+def test_decode_chunks_other_shapes(body):
+    assert decode_chunks(split(body.encode(), 2)) == json.loads(body)
+
+
+def test_results_are_available_before_the_body_ends():
+    parser = ResultsParser()
+    cut = BODY.index(b'"extra"')
+    records = parser.feed(BODY[:cut])
+    assert [record['fecha'] for record in records] == ['2024-01-02', '2024-01-03', '2024-01-04']
+    assert parser.feed(BODY[cut:]) == []
+    assert parser.close() == [] and parser.data == {
+        'status': 200, 'metadata': {'resultset': {'count': 3}}, 'extra': True
+    }
+
+
+@pytest.mark.parametrize('body', [b'{"results": [1,]}', b'{"a": 1', b'{"a": 1} x', b''])
+def test_invalid_body_raises(body):
+    with pytest.raises(ValueError):
+        decode_chunks(split(body, 3))
+
+
+def test_open_decoder():
+    assert type(open_decoder('json')) is JSONDecoder
+    with pytest.raises(ValueError):
+        open_decoder('ujson')
+
+
+def test_orjson_decoder():
+    pytest.importorskip('orjson')
+    decoder = open_decoder('orjson')
+    assert decoder.loads(BODY) == json.loads(BODY)
+    assert decode_chunks(split(BODY, 7), decoder) == json.loads(BODY)
+
+
+def test_large_responses_are_decoded_incrementally(offline_client, monkeypatch):
+    rows = [{'fecha': f'2024-01-{d:02d}', 'valor': float(d)} for d in range(1, 29)]
+    client = offline_client(lambda url: (200, {'results': rows}), json_decoder='json')
+    expected = client.monetary.series(id_variable=1)
+
+    monkeypatch.setattr(APISettings, 'INCREMENTAL_DECODE_BYTES', 0)
+    monkeypatch.setattr(APISettings, 'DECODE_CHUNK_SIZE', 16)
+    client.connector.frame_cache = None
+    df = client.monetary.series(id_variable=1, desde='2024-01-01')
+    assert df.equals(expected)
+
+
+@pytest.mark.parametrize('incremental_bytes', [0, APISettings.INCREMENTAL_DECODE_BYTES])
+def test_responses_are_closed_when_decoding_fails(offline_client, monkeypatch, incremental_bytes):
+    monkeypatch.setattr(APISettings, 'INCREMENTAL_DECODE_BYTES', incremental_bytes)
+    responses = []
+
+    def handler(url):
+        response = FakeResponse(200, {'results': [{'fecha': '2024-01-02', 'valor': 1.0}]})
+        response.content = response.content[:-5]
+        responses.append(response)
+        return response
+
+    client = offline_client(handler, retry=None)
+    assert client.monetary.series(id_variable=1, json=True)[0] == 0
+    assert responses and all(response.closed for response in responses)
@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+import pyBCRAdata
+
+
+def run_python(code):
+    return subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+
+def test_import_is_lazy():
+    result = run_python(
+        "import sys, pyBCRAdata; "
+        "print(sorted(m for m in ('pandas', 'requests', 'numpy', 'pyBCRAdata.client') if m in sys.modules))"
+    )
+    assert result.stdout.strip() == '[]'
+
+
+def test_default_apis_are_created_on_first_access():
+    from pyBCRAdata import monetary, debtors
+
+    assert monetary.api_connector is debtors.api_connector
+    assert pyBCRAdata.checks.api_connector is monetary.api_connector
+    assert {'BCRAclient', 'currency'} <= set(dir(pyBCRAdata))
@@ -5,7 +5,8 @@ from pyBCRAdata import BCRAclient
 def client():
     return BCRAclient()
 
-@pytest.fixture(params=[True, False], ids=['debug_on', 'debug_off'])
+# Sin debug los métodos consultan la API real: esos casos son `live`
+@pytest.fixture(params=[True, pytest.param(False, marks=pytest.mark.live)], ids=['debug_on', 'debug_off'])
 def debug_mode(request):
     return request.param
 
@@ -71,22 +72,27 @@ def test_debts_rejected_checks_urls(client, debug_mode):
     df = client.debtors.rejected(identificacion='23409233449', debug=debug_mode)
     assert df is not None
 
+@pytest.mark.live
 def test_monetary_data_df(client):
     df = client.monetary.series(id_variable=6, debug=False)
     assert not df.empty
 
+@pytest.mark.live
 def test_monetary_master_df(client):
     df = client.monetary.variables(debug=False)
     assert not df.empty
 
+@pytest.mark.live
 def test_currency_master_df(client):
     df = client.currency.currencies(debug=False)
     assert not df.empty
 
+@pytest.mark.live
 def test_currency_quotes_df(client):
     df = client.currency.rates(fecha='2023-01-15', debug=False)
     assert not df.empty
 
+@pytest.mark.live
 def test_debts_df(client):
     df = client.debtors.debtors(identificacion='23409233449', debug=False)
     assert not df.empty
@@ -0,0 +1,27 @@
+from pyBCRAdata import MetricsCollector
+from pyBCRAdata.metrics import STAGES
+
+
+def test_collector_reports_stages_bytes_and_rows(offline_client, growing_series):
+    metrics = MetricsCollector()
+    client = offline_client(growing_series(['2024-01-01', '2024-01-02']), instrumentation=metrics)
+
+    client.monetary.series(id_variable=6)
+    client.monetary.series(id_variable=6, limit=1, paginate=True)
+
+    entry = metrics.stats()['monetary.series']
+    assert list(entry['stages']) == list(STAGES)
+    assert entry['stages']['connect']['count'] == 3
+    assert entry['stages']['url_build']['count'] == 1
+    assert entry['rows'] == 4
+    assert entry['bytes'] > 0
+
+    text = metrics.to_prometheus()
+    assert 'pybcradata_stage_seconds_count{endpoint="monetary.series",stage="connect"} 3' in text
+    assert 'pybcradata_rows_total{endpoint="monetary.series"} 4' in text
+
+
+def test_no_instrumentation_by_default(offline_client, growing_series):
+    client = offline_client(growing_series([]))
+    assert client.connector.instrumentation is None
+    assert client.connector._endpoint_key('https://api.bcra.gob.ar/estadisticas/v3.0/monetarias/6') == ''
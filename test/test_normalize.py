@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+
+from pyBCRAdata.connector import APIConnector, endpoint_schema
+from pyBCRAdata.normalize import normalize_json, legacy_json_to_df
+
+RATES = {
+    'fecha': '2024-01-02',
+    'detalle': [
+        {'codigoMoneda': 'USD', 'descripcion': 'DOLAR E.E.U.U.', 'tipoPase': 1.0, 'tipoCotizacion': 808.45},
+        {'codigoMoneda': 'EUR', 'descripcion': 'EURO', 'tipoPase': 1.09, 'tipoCotizacion': 884.2},
+    ]
+}
+
+SERIES = [
+    {'fecha': '2024-01-02', 'detalle': [{'codigoMoneda': 'USD', 'tipoPase': 1.0, 'tipoCotizacion': 808.45}]},
+    {'fecha': '2024-01-03', 'detalle': [{'codigoMoneda': 'USD', 'tipoPase': 1.0, 'tipoCotizacion': 809.1}]},
+]
+
+HISTORY = {
+    'identificacion': 20123456789,
+    'denominacion': 'PEREZ JUAN',
+    'periodos': [
+        {'periodo': '202401', 'entidades': [
+            {'entidad': 'BANCO A', 'situacion': 1, 'monto': 10.5, 'enRevision': False, 'procesoJud': False},
+            {'entidad': 'BANCO B', 'situacion': 2, 'monto': 3.0, 'enRevision': False, 'procesoJud': True},
+        ]},
+        {'periodo': '202312', 'entidades': []},
+    ]
+}
+
+REJECTED = {
+    'identificacion': 20123456789,
+    'denominacion': 'PEREZ JUAN',
+    'causales': [{'causal': 'SIN FONDOS', 'entidades': [
+        {'entidad': 11, 'detalle': [{'nroCheque': 1, 'fechaRechazo': '2023-05-01', 'monto': 100.0,
+                                     'estadoMulta': None, 'ctaPersonal': True}]}
+    ]}]
+}
+
+CHECK = {
+    'numeroCheque': 20377516, 'denunciado': True, 'fechaProcesamiento': '2024-03-05',
+    'denominacionEntidad': 'BANCO DE LA NACION ARGENTINA',
+    'detalles': [{'sucursal': 524, 'numeroCuenta': 5240055962, 'causal': 'Denuncia por robo'}]
+}
+
+
+@pytest.mark.parametrize('payload, explode', [
+    (RATES, True), (SERIES, False), (HISTORY, True), (REJECTED, False), (CHECK, True),
+    ([{'idVariable': 1, 'fecha': '2024-01-02', 'valor': 1.5}, {'idVariable': 1, 'fecha': '2024-01-03'}], False),
+], ids=['rates', 'currency_series', 'history', 'rejected', 'check', 'monetary_series'])
+def test_matches_legacy_normalizer(payload, explode):
+    expected = legacy_json_to_df(payload, explode)
+    result = normalize_json(payload, explode)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_explode_builds_one_row_per_leaf():
+    history = {**HISTORY, 'periodos': HISTORY['periodos'][:1] * 2}
+    df = normalize_json(history, explode=True)
+
+    assert len(df) == 4
+    assert df['periodos_entidades_entidad'].tolist() == ['BANCO A', 'BANCO B'] * 2
+    assert df['periodos_entidades_monto'].dtype == 'float64'
+
+
+@pytest.mark.parametrize('endpoint_key, payload', [
+    ('currency.rates', RATES), ('currency.series', SERIES), ('debtors.history', HISTORY),
+    ('debtors.rejected', REJECTED), ('checks.reported', CHECK),
+])
+def test_schema_builds_final_dtypes(endpoint_key, payload):
+    connector = APIConnector(base_url='http://localhost', cert_path=False)
+    schema = endpoint_schema(endpoint_key)
+    expected = legacy_json_to_df(payload, schema.explode)
+    expected = expected.astype({
+        col: dtype for col, dtype in schema.column_types().items() if col in expected.columns
+    })
+
+    df = connector.process_response(200, {'results': payload}, endpoint_key)
+
+    pd.testing.assert_frame_equal(df, expected)
+    connector.close()
+
+
+def test_repetitive_strings_are_categorical():
+    df = normalize_json(RATES, explode=True, dtypes=endpoint_schema('currency.rates').column_types())
+
+    assert isinstance(df['detalle_codigoMoneda'].dtype, pd.CategoricalDtype)
+    assert df['detalle_tipoCotizacion'].dtype == 'float64'
+    assert df['fecha'].dtype == 'datetime64[ns]'
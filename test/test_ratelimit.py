@@ -0,0 +1,22 @@
+import time
+
+from pyBCRAdata import RateLimiter
+from pyBCRAdata.ratelimit import AdaptiveRateLimiter
+
+
+def test_rate_limiter_spaces_requests():
+    limiter = RateLimiter(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+def test_adaptive_limiter_halves_on_throttle_and_recovers():
+    limiter = AdaptiveRateLimiter(rate=100)
+    limiter.throttle()
+    limiter.throttle()
+    assert limiter.rate == 25
+    for _ in range(100):
+        limiter.success()
+    assert limiter.rate == 100
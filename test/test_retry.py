@@ -0,0 +1,67 @@
+from email.utils import formatdate
+import time
+
+import pytest
+
+from pyBCRAdata import APIError, RetryPolicy
+from pyBCRAdata.retry import retry_after, endpoint_family
+from conftest import FakeResponse
+
+
+NO_WAIT = RetryPolicy(max_retries=2, backoff=0)
+
+
+def banks(url):
+    return 200, {'results': [{'codigoEntidad': 11, 'denominacion': 'BANCO'}]}
+
+
+def test_retries_transient_errors_honouring_retry_after(offline_client):
+    responses = [FakeResponse(429, {'status': 429}, {'Retry-After': '0'}),
+                 FakeResponse(503, {'status': 503})]
+    client = offline_client(lambda url: responses.pop(0) if responses else banks(url), retry=NO_WAIT)
+
+    df = client.checks.banks()
+    assert len(df) == 1
+    assert len(client.connector.session.urls) == 3
+
+
+def test_persistent_errors_raise_after_retries(offline_client):
+    client = offline_client(lambda url: (503, {'status': 503, 'errorMessages': ['Mantenimiento']}), retry=NO_WAIT)
+    with pytest.raises(APIError, match='Mantenimiento') as excinfo:
+        client.checks.banks()
+    assert excinfo.value.status_code == 503
+    assert len(client.connector.session.urls) == 3
+
+    batch = client.debtors.debtors_many(identificaciones=['20111111112'])
+    assert batch.errors['status_code'].tolist() == [503]
+
+
+def test_circuit_opens_per_family(offline_client):
+    def handler(url):
+        return (503, {'status': 503}) if '/cheques/' in url else \
+            (200, {'results': [{'idVariable': 1, 'descripcion': 'Reservas'}]})
+
+    policy = RetryPolicy(max_retries=0, failure_threshold=2, reset_timeout=60)
+    client = offline_client(handler, retry=policy)
+    for _ in range(2):
+        with pytest.raises(APIError):
+            client.checks.banks()
+
+    client.connector.session.urls.clear()
+    with pytest.raises(APIError, match='Circuito abierto'):
+        client.checks.banks()
+    assert client.connector.session.urls == []
+    assert len(client.monetary.variables()) == 1
+
+
+def test_retry_disabled_returns_errors(offline_client):
+    client = offline_client(lambda url: (503, {'status': 503}), retry=None)
+    assert client.checks.banks() == {'status': 503}
+
+
+def test_retry_after_and_families():
+    assert retry_after({'Retry-After': '2.5'}) == 2.5
+    assert 55 < retry_after({'Retry-After': formatdate(time.time() + 60, usegmt=True)}) <= 60
+    assert retry_after({}) is None
+    assert endpoint_family('https://api.bcra.gob.ar/estadisticascambiarias/v1.0/Cotizaciones') == 'estadisticas'
+    assert endpoint_family('https://api.bcra.gob.ar/CentralDeDeudores/v1.0/Deudas/1') == 'CentralDeDeudores'
@@ -0,0 +1,56 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyBCRAdata.concurrency import SingleFlight
+
+
+def slow_banks(url):
+    time.sleep(0.2)
+    return 200, {'results': [{'codigoEntidad': 11, 'denominacion': 'BANCO'}]}
+
+
+def test_concurrent_identical_calls_share_one_request(offline_client):
+    client = offline_client(slow_banks)
+    barrier = threading.Barrier(8)
+
+    def call(_):
+        barrier.wait()
+        return client.checks.banks()
+
+    with ThreadPoolExecutor(8) as executor:
+        frames = list(executor.map(call, range(8)))
+
+    assert len(client.connector.session.urls) == 1
+    assert client.connector.single_flight.stats() == {'calls': 8, 'coalesced': 7, 'in_flight': 0}
+    frames[0].loc[0, 'denominacion'] = 'OTRO'
+    assert all(df['denominacion'].tolist() == ['BANCO'] for df in frames[1:])
+
+
+def test_coalescing_can_be_disabled(offline_client):
+    client = offline_client(slow_banks, coalesce=False)
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(lambda _: client.checks.banks(), range(4)))
+    assert len(client.connector.session.urls) == 4
+    assert client.connector.single_flight is None
+
+
+def test_followers_receive_the_leader_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError('falla')
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(flight.do, 'k', fail)
+        started.wait()
+        follower = executor.submit(flight.do, 'k', lambda: 'no se ejecuta')
+        for future in (leader, follower):
+            with pytest.raises(ValueError, match='falla'):
+                future.result()
+    assert flight.stats()['coalesced'] == 1
@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from pyBCRAdata import CSVSink
+
+
+DATES = list(pd.date_range('2024-01-01', periods=7, freq='D').strftime('%Y-%m-%d'))
+
+
+def test_csv_sink_appends_pages(offline_client, tmp_path, growing_series):
+    client = offline_client(growing_series(DATES))
+
+    path = client.monetary.series(id_variable=6, limit=3, sink=tmp_path / 'serie.csv')
+    assert len(client.connector.session.urls) == 3
+    df = pd.read_csv(path)
+    assert df['fecha'].tolist() == DATES
+    assert list(df.columns) == ['idVariable', 'fecha', 'valor']
+
+    with pytest.raises(ValueError):
+        client.monetary.series(id_variable=6, sink=tmp_path / 'serie.xlsx')
+
+
+def test_parquet_and_arrow_sinks_keep_column_types(offline_client, tmp_path, growing_series):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    client = offline_client(growing_series(DATES))
+
+    path = client.monetary.series(id_variable=6, limit=3, sink=tmp_path / 'serie.parquet')
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_row_groups == 3
+    assert pa.types.is_timestamp(parquet.schema_arrow.field('fecha').type)
+    assert parquet.read().num_rows == 7
+
+    table = client.monetary.series(id_variable=6, limit=3, sink='arrow')
+    assert isinstance(table, pa.Table)
+    assert table.column('valor').to_pylist() == [float(i) for i in range(7)]
+    assert table.schema.field('valor').type == pa.float64()
+
+
+def test_custom_sink_receives_frames(offline_client, tmp_path, growing_series):
+    client = offline_client(growing_series(DATES))
+    sink = CSVSink(tmp_path / 'serie.csv')
+    assert client.monetary.series(id_variable=6, limit=5, sink=sink) == sink.path
+    assert len(pd.read_csv(sink.path)) == 7
+
+
+def test_incomplete_sink_fails_on_creation():
+    from pyBCRAdata.sinks import Sink
+
+    class OnlyWrite(Sink):
+        def write(self, frame):
+            pass
+
+    with pytest.raises(TypeError):
+        OnlyWrite()
+
+
+def test_batch_writes_every_item_into_one_sink(offline_client, tmp_path, debtor_handler):
+    client = offline_client(debtor_handler)
+    ids = ['20111111112', '00000000000', '20222222223', '20333333334']
+
+    result = client.debtors.debtors_many(identificaciones=ids, chunk_size=2, sink=tmp_path / 'deudores.csv')
+    assert result.data == tmp_path / 'deudores.csv'
+    df = pd.read_csv(result.data)
+    assert df['identificacion'].tolist() == [20111111112, 20222222223, 20333333334]
+    assert result.errors['identificacion'].tolist() == ['00000000000']
+
+    with pytest.raises(ValueError):
+        client.debtors.debtors_many(identificaciones=ids, stream=True, sink=tmp_path / 'deudores.csv')
@@ -0,0 +1,98 @@
+import pandas as pd
+import pytest
+
+from pyBCRAdata import SeriesStore
+
+
+def test_store_replaces_dates_and_reads_ranges(tmp_path):
+    store = SeriesStore(tmp_path / 'series.sqlite')
+    assert store.read('monetary.series:6') == []
+
+    store.append('monetary.series:6', [{'fecha': '2024-01-02', 'valor': 1.0},
+                                       {'fecha': '2024-01-01', 'valor': 0.5}])
+    store.append('monetary.series:6', [{'fecha': '2024-01-02', 'valor': 2.0}])
+
+    assert [r['valor'] for r in store.read('monetary.series:6')] == [0.5, 2.0]
+    assert store.read('monetary.series:6', start='2024-01-02') == [{'fecha': '2024-01-02', 'valor': 2.0}]
+    with pytest.raises(ValueError):
+        store.append('monetary.series:6', [{'valor': 3.0}])
+
+
+def test_incremental_fetches_only_new_observations(offline_client, tmp_path, growing_series):
+    dates = list(pd.date_range('2024-01-01', periods=10, freq='D').strftime('%Y-%m-%d'))
+    client = offline_client(growing_series(dates), series_store=tmp_path / 'series.sqlite')
+
+    first = client.monetary.series(id_variable=6, incremental=True)
+    assert len(first) == 10
+
+    dates.extend(['2024-01-11', '2024-01-12'])
+    client.connector.session.urls.clear()
+    df = client.monetary.series(id_variable=6, incremental=True)
+
+    assert len(client.connector.session.urls) == 1
+    assert 'desde=2024-01-11' in client.connector.session.urls[0]
+    assert df['fecha'].dt.strftime('%Y-%m-%d').tolist() == dates
+    assert df['fecha'].dtype == 'datetime64[ns]'
+
+    client.connector.session.urls.clear()
+    window = client.monetary.series(id_variable=6, desde='2024-01-03', hasta='2024-01-05', incremental=True)
+    assert client.connector.session.urls == []
+    assert len(window) == 3
+
+
+def test_incremental_requires_store_and_date_range(offline_client, growing_series):
+    client = offline_client(growing_series([]))
+    with pytest.raises(ValueError):
+        client.monetary.series(id_variable=6, incremental=True)
+    with pytest.raises(ValueError):
+        client.currency.rates(incremental=True)
+
+
+def test_incremental_rejects_limit_and_offset(offline_client, tmp_path, growing_series):
+    dates = list(pd.date_range('2024-01-01', periods=10, freq='D').strftime('%Y-%m-%d'))
+    client = offline_client(growing_series(dates), series_store=tmp_path / 'series.sqlite')
+    with pytest.raises(ValueError):
+        client.monetary.series(id_variable=6, desde='2024-01-01', hasta='2024-01-10',
+                               limit=3, offset=2, incremental=True)
+    assert client.connector.series_store.coverage('monetary.series:6') == []
+    assert len(client.monetary.series(id_variable=6, desde='2024-01-01', hasta='2024-01-10', incremental=True)) == 10
+
+
+def test_store_coverage_and_gaps(tmp_path):
+    from datetime import date
+    store = SeriesStore(tmp_path / 'series.sqlite')
+    d = date.fromisoformat
+
+    store.add_coverage('s', d('2024-01-05'), d('2024-01-10'))
+    store.add_coverage('s', d('2024-01-20'), d('2024-01-25'))
+    assert store.gaps('s', d('2024-01-01'), d('2024-01-31')) == [
+        (d('2024-01-01'), d('2024-01-04')), (d('2024-01-11'), d('2024-01-19')), (d('2024-01-26'), d('2024-01-31'))
+    ]
+    assert store.gaps('s', d('2024-01-06'), d('2024-01-08')) == []
+
+    store.add_coverage('s', d('2024-01-11'), d('2024-01-19'))
+    assert store.coverage('s') == [(d('2024-01-05'), d('2024-01-25'))]
+    store.clear('s')
+    assert store.coverage('s') == []
+
+
+def test_incremental_fetches_only_missing_gaps(offline_client, tmp_path, growing_series):
+    dates = list(pd.date_range('2024-01-01', periods=10, freq='D').strftime('%Y-%m-%d'))
+    client = offline_client(growing_series(dates), series_store=tmp_path / 'series.sqlite')
+
+    assert len(client.monetary.series(id_variable=6, desde='2024-01-03', hasta='2024-01-05', incremental=True)) == 3
+
+    client.connector.session.urls.clear()
+    assert len(client.monetary.series(id_variable=6, desde='2024-01-01', hasta='2024-01-10',
+                                      incremental=True, debug=True)) == 2
+    assert client.connector.session.urls == []
+    df = client.monetary.series(id_variable=6, desde='2024-01-01', hasta='2024-01-10', incremental=True)
+    urls = client.connector.session.urls
+    assert len(urls) == 2
+    assert 'desde=2024-01-01' in urls[0] and 'hasta=2024-01-02' in urls[0]
+    assert 'desde=2024-01-06' in urls[1] and 'hasta=2024-01-10' in urls[1]
+    assert df['fecha'].dt.strftime('%Y-%m-%d').tolist() == dates
+
+    client.connector.session.urls.clear()
+    assert len(client.monetary.series(id_variable=6, desde='2024-01-02', hasta='2024-01-09', incremental=True)) == 8
+    assert client.connector.session.urls == []
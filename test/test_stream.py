@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+
+DATES = list(pd.date_range('2024-01-01', periods=7, freq='D').strftime('%Y-%m-%d'))
+
+
+def test_stream_yields_one_frame_per_page(offline_client, growing_series):
+    client = offline_client(growing_series(DATES))
+
+    chunks = client.monetary.series(id_variable=6, limit=3, stream=True)
+    assert client.connector.session.urls == []
+
+    frames = list(chunks)
+    assert [len(df) for df in frames] == [3, 3, 1]
+    assert pd.concat(frames)['fecha'].dt.strftime('%Y-%m-%d').tolist() == DATES
+    assert frames[0]['fecha'].dtype == 'datetime64[ns]'
+
+
+def test_stream_regroups_records_by_chunk_size(offline_client, growing_series):
+    client = offline_client(growing_series(DATES))
+
+    frames = list(client.monetary.series(id_variable=6, limit=3, stream=True, chunk_size=2))
+    assert [len(df) for df in frames] == [2, 2, 2, 1]
+
+    raw = list(client.monetary.series(id_variable=6, limit=3, stream=True, chunk_size=4, json=True))
+    assert [len(chunk['results']) for chunk in raw] == [4, 3]
+
+
+def test_stream_validation_and_errors(offline_client):
+    client = offline_client(lambda url: (500, {'status': 500, 'errorMessages': ['Caído']}))
+    with pytest.raises(ValueError):
+        client.monetary.series(id_variable=6, stream=True, chunk_size=0)
+    with pytest.raises(ValueError):
+        client.monetary.series(id_variable=6, stream=True, incremental=True)
+    with pytest.raises(ValueError, match='Caído'):
+        next(client.monetary.series(id_variable=6, stream=True))
+
+
+def test_batch_stream_yields_partial_results(offline_client):
+    client = offline_client(lambda url: (200, {'results': {
+        'identificacion': int(url.rsplit('/', 1)[-1]), 'periodos': [{'periodo': '202401'}]
+    }}))
+
+    results = client.debtors.debtors_many(identificaciones=['20111111112', '20222222223', '20333333334'],
+                                          stream=True, chunk_size=2)
+    assert [result.data.index.get_level_values(0).tolist() for result in results] == \
+        [['20111111112', '20222222223'], ['20333333334']]